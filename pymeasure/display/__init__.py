@@ -21,16 +21,34 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 #
+import importlib.util
 import logging
 
+from ..lazy_import import attach
+
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
-try:
-    from .manager import Manager
-    from .plotter import Plotter
-except ImportError:
-    log.warning("Python bindings for Qt (PySide, PyQt) can not be imported")
+_QT_WARNING = "Python bindings for Qt (PySide, PyQt) can not be imported"
+
+# Qt is imported only at the first access, its availability is checked without importing it.
+if importlib.util.find_spec("qtpy") is None or not any(
+        importlib.util.find_spec(binding) is not None
+        for binding in ("PyQt5", "PyQt6", "PySide2", "PySide6")):
+    log.warning(_QT_WARNING)
+
+_getattr, __dir__, _ = attach(__name__, {
+    "manager": ["Manager"],
+    "plotter": ["Plotter"],
+})
+
+
+def __getattr__(name):
+    try:
+        return _getattr(name)
+    except ImportError:
+        log.warning(_QT_WARNING)
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'") from None
 
 
 def run_in_ipython(app):
@@ -32,29 +32,198 @@ log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 
+class MinMaxPyramid:
+    """ Incremental pyramid of min/max summaries of a growing curve for level of detail plotting.
+
+    Level k summarizes blocks of :code:`factor**k` samples by the x value of their first sample
+    and their minimum and maximum y value. Appending samples only updates the summaries of the
+    blocks, which contain new samples. The summaries require a non-decreasing x, otherwise the
+    samples are not decimated.
+
+    :param factor: Number of blocks of a level summarized by one block of the next level.
+    """
+
+    def __init__(self, factor=4):
+        self.factor = factor
+        self.clear()
+
+    def clear(self):
+        self.x = self.y = np.empty(0)
+        self.size = 0
+        self.monotonic = True  # whether x is non-decreasing
+        self._levels = []  # summaries (x, ymin, ymax) of the levels 1, 2, ...
+        self._sizes = []
+
+    def update(self, x, y):
+        """ Update the summaries for x and y, which extend the previous samples """
+        start = self.size
+        if len(x) < start:
+            self.clear()
+            start = 0
+        if self.monotonic and len(x) > 1:
+            self.monotonic = bool(np.all(np.diff(x[max(start - 1, 0):]) >= 0))
+        self.x, self.y, self.size = x, y, len(x)
+        if not self.monotonic:
+            del self._levels[:], self._sizes[:]
+            return
+
+        lower = (x, y, y)
+        level = 0
+        while len(lower[0]) > self.factor:
+            lower, start = self._update_level(level, lower, start)
+            level += 1
+        del self._levels[level:], self._sizes[level:]
+
+    def _update_level(self, level, lower, start):
+        """ Recalculate the blocks of a level, which contain lower samples from start on """
+        size = len(lower[0])
+        blocks = -(-size // self.factor)
+        if level == len(self._levels):
+            self._levels.append(np.empty((3, 0)))
+            self._sizes.append(0)
+        summary = self._levels[level]
+        first = min(start // self.factor, self._sizes[level])
+        if blocks > summary.shape[1]:
+            grown = np.empty((3, max(blocks, 2 * summary.shape[1])))
+            grown[:, :first] = summary[:, :first]
+            summary = self._levels[level] = grown
+        offsets = np.arange(0, size - first * self.factor, self.factor)
+        lower_start = first * self.factor
+        summary[0, first:blocks] = lower[0][lower_start::self.factor]
+        # fmin and fmax ignore missing (NaN) values
+        summary[1, first:blocks] = np.fmin.reduceat(lower[1][lower_start:size], offsets)
+        summary[2, first:blocks] = np.fmax.reduceat(lower[2][lower_start:size], offsets)
+        self._sizes[level] = blocks
+        return summary[:, :blocks], first
+
+    def decimate(self, pixels, x_range=None):
+        """ Return x and y data of the min/max envelope with about two points per pixel.
+
+        :param pixels: Number of pixels of the plot width.
+        :param x_range: Tuple of the visible x range or None. The resolution is adapted to the
+            visible range, the remaining data is included in a coarse resolution.
+        """
+        if not self.monotonic:
+            return self.x, self.y
+        start, stop = 0, self.size
+        if x_range is not None:
+            start = max(int(np.searchsorted(self.x, x_range[0], side="left")) - 1, 0)
+            stop = min(int(np.searchsorted(self.x, x_range[1], side="right")) + 1, self.size)
+        coarse = self._level(self.size, pixels)
+        blocksize = self.factor ** coarse
+        start = start // blocksize * blocksize
+        stop = min(-(-stop // blocksize) * blocksize, self.size)
+        segments = [self._segment(0, start, coarse),
+                    self._segment(start, stop, self._level(stop - start, pixels)),
+                    self._segment(stop, self.size, coarse)]
+        return (np.concatenate([segment[0] for segment in segments]),
+                np.concatenate([segment[1] for segment in segments]))
+
+    def _level(self, samples, pixels):
+        """ Return the coarsest level with at least one block per pixel """
+        level = 0
+        while level < len(self._levels) and self.factor ** (level + 1) * pixels <= samples:
+            level += 1
+        return level
+
+    def _segment(self, start, stop, level):
+        if level == 0:
+            return self.x[start:stop], self.y[start:stop]
+        blocksize = self.factor ** level
+        summary = self._levels[level - 1][:, start // blocksize:-(-stop // blocksize)]
+        return np.repeat(summary[0], 2), summary[1:].T.ravel()
+
+
 class ResultsCurve(pg.PlotDataItem):
     """ Creates a curve loaded dynamically from a file through the Results object. The data can
     be forced to fully reload on each update, useful for cases when the data is changing across
     the full file instead of just appending.
+
+    By default, the curve works in append mode: only the rows added since the last update are
+    copied into a preallocated buffer, which is referenced by the curve. The whole data is only
+    copied again if the axes change, the number of rows decreases or :code:`force_reload` is set.
+    Set :code:`append=False` to copy the whole data on each update.
+
+    With :code:`lod=True`, the curve shows the min/max envelope of the data with about two points
+    per pixel (level of detail), calculated from a :class:`MinMaxPyramid`, which is updated with
+    the new rows. The resolution follows the visible x range when zooming or panning.
     """
 
-    def __init__(self, results, x, y, force_reload=False, wdg=None, **kwargs):
+    def __init__(self, results, x, y, force_reload=False, wdg=None, append=True, lod=False,
+                 **kwargs):
         super().__init__(**kwargs)
         self.results = results
         self.wdg = wdg
         self.pen = kwargs.get('pen', None)
         self.x, self.y = x, y
         self.force_reload = force_reload
+        self.append = append
         self.color = self.opts['pen'].color()
+        self._buffer = np.empty((2, 0))
+        self._rows = 0
+        self._columns = None
+        self.lod = lod
+        self._pyramid = MinMaxPyramid()
+        self._updating_lod = False
 
-    def update_data(self):
-        """Updates the data by polling the results"""
-        if self.force_reload:
-            self.results.reload()
-        data = self.results.data  # get the current snapshot
+    def update_data(self, data=None):
+        """Updates the data by polling the results
 
-        # Set x-y data
-        self.setData(data[self.x], data[self.y])
+        :param data: Snapshot of the results data. If None, the data is taken from the results.
+        """
+        if data is None:
+            if self.force_reload:
+                self.results.reload()
+            data = self.results.data  # get the current snapshot
+
+        rows = len(data)
+        if (not self.append or self.force_reload or self._columns != (self.x, self.y)
+                or rows < self._rows):
+            self._rows = 0
+            self._columns = (self.x, self.y)
+            self._pyramid.clear()
+        elif rows == self._rows:
+            return  # nothing new to plot
+        self._append_rows(data)
+
+        if self.lod:
+            self._pyramid.update(self._buffer[0, :self._rows], self._buffer[1, :self._rows])
+            self.update_lod()
+        else:
+            # Set x-y data
+            self.setData(self._buffer[0, :self._rows], self._buffer[1, :self._rows])
+
+    def update_lod(self):
+        """ Show the min/max envelope of the data for the current view """
+        if self._updating_lod or not self._pyramid.size:
+            return
+        view_box = self.getViewBox()
+        if view_box is None:
+            pixels, x_range = 1000, None
+        else:
+            pixels, x_range = max(int(view_box.width()), 1), view_box.viewRange()[0]
+        self._updating_lod = True
+        try:
+            self.setData(*self._pyramid.decimate(pixels, x_range))
+        finally:
+            self._updating_lod = False
+
+    def viewRangeChanged(self, vb=None, ranges=None, changed=None):
+        super().viewRangeChanged(vb, ranges, changed)
+        if self.lod and (changed is None or changed[0]):
+            self.update_lod()
+
+    def _append_rows(self, data):
+        """ Copy the rows of data after the last plotted row into the buffer """
+        rows = len(data)
+        if rows > self._buffer.shape[1]:
+            # grow geometrically, such that appending is amortized O(1) per row
+            buffer = np.empty((2, max(rows, 2 * self._buffer.shape[1], 1024)))
+            buffer[:, :self._rows] = self._buffer[:, :self._rows]
+            self._buffer = buffer
+        self._buffer[0, self._rows:rows] = data[self.x].iloc[self._rows:].to_numpy(dtype=float)
+        self._buffer[1, self._rows:rows] = data[self.y].iloc[self._rows:].to_numpy(dtype=float)
+        self._rows = rows
 
     def set_color(self, color):
         self.pen.setColor(color)
@@ -66,7 +235,12 @@ class ResultsCurve(pg.PlotDataItem):
 
 class ResultsImage(pg.ImageItem):
     """ Creates an image loaded dynamically from a file through the Results
-    object."""
+    object.
+
+    The z values are stored in :attr:`z_data` and colored by the lookup table and levels of the
+    image item. On each update only the new rows are assigned to their pixels, pixels without
+    data remain transparent.
+    """
 
     def __init__(self, results, x, y, z, force_reload=False, wdg=None, **kwargs):
         self.results = results
@@ -82,11 +256,16 @@ class ResultsImage(pg.ImageItem):
         self.yend = getattr(self.results.procedure, self.y + '_end')
         self.ystep = getattr(self.results.procedure, self.y + '_step')
         self.ysize = int(np.ceil((self.yend - self.ystart) / self.ystep)) + 1
-        self.img_data = np.zeros((self.ysize, self.xsize, 4))
+        self.z_data = np.full((self.ysize, self.xsize), np.nan)
         self.force_reload = force_reload
         self.cm = pg.colormap.get('viridis')
+        self._rows = 0
+        self._columns = None
+        self._zrange = (np.inf, -np.inf)
 
-        super().__init__(image=self.img_data)
+        # need to transpose since pyqtgraph assumes column-major order
+        super().__init__(image=self.z_data.T, levels=(0, 1),
+                         lut=self.cm.getLookupTable(nPts=256, alpha=True))
 
         # Scale and translate image so that the pixels are in the correct
         # position in "data coordinates"
@@ -96,23 +275,53 @@ class ResultsImage(pg.ImageItem):
                      int(self.ystart / self.ystep) - 0.5)  # 0.5 so pixels centered
         self.setTransform(tr)
 
-    def update_data(self):
-        if self.force_reload:
-            self.results.reload()
+    def update_data(self, data=None):
+        """ Updates the image by polling the results
 
-        data = self.results.data
-        zmin = data[self.z].min()
-        zmax = data[self.z].max()
+        :param data: Snapshot of the results data. If None, the data is taken from the results.
+        """
+        if data is None:
+            if self.force_reload:
+                self.results.reload()
+            data = self.results.data
+        rows = len(data)
+        if self.force_reload or self._columns != (self.x, self.y, self.z) or rows < self._rows:
+            self.z_data[:] = np.nan
+            self._rows = 0
+            self._columns = (self.x, self.y, self.z)
+            self._zrange = (np.inf, -np.inf)
+        elif rows == self._rows:
+            return  # no new pixels
 
         # populate the image array with the new data
-        for idx, row in data.iterrows():
-            xdat = row[self.x]
-            ydat = row[self.y]
-            xidx, yidx = self.find_img_index(xdat, ydat)
-            self.img_data[yidx, xidx, :] = self.colormap((row[self.z] - zmin) / (zmax - zmin))
+        new = data.iloc[self._rows:]
+        z = new[self.z].to_numpy(dtype=float)
+        xidx, yidx = self.find_img_indices(new[self.x].to_numpy(dtype=float),
+                                           new[self.y].to_numpy(dtype=float))
+        self.z_data[yidx, xidx] = z
+        self._rows = rows
+        if not np.isnan(z).all():
+            self._zrange = (min(self._zrange[0], np.nanmin(z)),
+                            max(self._zrange[1], np.nanmax(z)))
+
+        zmin, zmax = self._zrange
+        if not zmin < zmax:  # no or constant data
+            zmin, zmax = (0, 1) if zmin > zmax else (zmin, zmin + 1)
+        self.setImage(image=self.z_data.T, levels=(zmin, zmax))
+
+    def find_img_indices(self, x, y):
+        """ Finds the integer image indices corresponding to the
+        closest x and y points of arrays of x and y data.
+        """
+        return (self._round_indices(x, self.xstart, self.xend, self.xstep, self.xsize),
+                self._round_indices(y, self.ystart, self.yend, self.ystep, self.ysize))
 
-        # set image data, need to transpose since pyqtgraph assumes column-major order
-        self.setImage(image=np.transpose(self.img_data, axes=(1, 0, 2)))
+    @staticmethod
+    def _round_indices(values, start, end, step, size):
+        """ Round half up, values out of range (or NaN) default to the final pixel """
+        in_range = (start <= values) & (values <= end)
+        scaled = np.where(in_range, (values - start) / step, size - 1)
+        return np.floor(scaled + 0.5).astype(int)
 
     def find_img_index(self, x, y):
         """ Finds the integer image indices corresponding to the
@@ -143,31 +352,94 @@ class ResultsImage(pg.ImageItem):
 
 class BufferCurve(pg.PlotDataItem):
     """ Creates a curve based on a predefined buffer size and allows data to be added dynamically.
+
+    Adding data does not redraw the curve immediately, instead all changes within
+    `update_interval` milliseconds are drawn at once, such that data may be added at a much
+    higher rate than the screen is refreshed. The interval defaults to the refresh rate of the
+    screen, with `update_interval=0` the curve is redrawn on every change.
     """
 
     data_updated = QtCore.Signal()
 
-    def __init__(self, **kwargs):
+    def __init__(self, update_interval=None, **kwargs):
         super().__init__(**kwargs)
         self._buffer = None
-
-    def prepare(self, size, dtype=np.float32):
-        """ Prepares the buffer based on its size, data type """
+        if update_interval is None:
+            screen = QtGui.QGuiApplication.primaryScreen()
+            rate = screen.refreshRate() if screen is not None else 0
+            update_interval = round(1000 / rate) if rate > 0 else 16
+        self.update_interval = update_interval
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.update_data)
+
+    def prepare(self, size, dtype=np.float32, circular=False):
+        """ Prepares the buffer based on its size, data type
+
+        :param circular: If True, the oldest points are dropped once the buffer is full,
+            otherwise adding more points than the size raises an exception.
+        """
         self._buffer = np.empty((size, 2), dtype=dtype)
-        self._ptr = 0
+        self._ptr = 0  # position of the next point in the buffer
+        self._count = 0  # number of points in the buffer
+        self.circular = circular
 
     def append(self, x, y):
         """ Appends data to the curve with optional errors """
+        self._check_space(1)
+        self._buffer[self._ptr] = x, y
+        self._advance(1)
+
+    def extend(self, xs, ys):
+        """ Appends several points to the curve at once """
+        points = np.column_stack((np.ravel(xs), np.ravel(ys)))
+        size = self._check_space(len(points))
+        if self.circular and len(points) >= size:  # only the newest points fit
+            self._buffer[:] = points[len(points) - size:]
+            self._ptr = 0
+            self._count = size
+            self._schedule_update()
+            return
+        stop = self._ptr + len(points)
+        if stop <= size:
+            self._buffer[self._ptr:stop] = points
+        else:
+            self._buffer[self._ptr:] = points[:size - self._ptr]
+            self._buffer[:stop - size] = points[size - self._ptr:]
+        self._advance(len(points))
+
+    def _check_space(self, count):
         if self._buffer is None:
             raise Exception("BufferCurve buffer must be prepared")
-        if len(self._buffer) <= self._ptr:
+        size = len(self._buffer)
+        if not self.circular and self._ptr + count > size:
             raise Exception("BufferCurve overflow")
+        return size
+
+    def _advance(self, count):
+        size = len(self._buffer)
+        self._ptr = (self._ptr + count) % size if self.circular else self._ptr + count
+        self._count = min(self._count + count, size)
+        self._schedule_update()
+
+    def _schedule_update(self):
+        if self.update_interval == 0:
+            self.update_data()
+        elif not self._timer.isActive():
+            self._timer.start(self.update_interval)
+
+    def buffered_data(self):
+        """ Returns the points of the buffer as (N, 2) array in the order they were added """
+        if self._count < len(self._buffer) or self._ptr == 0:
+            return self._buffer[:self._count]
+        return np.concatenate((self._buffer[self._ptr:], self._buffer[:self._ptr]))
 
-        # Set x-y data
-        self._buffer[self._ptr, :2] = [x, y]
-        self.setData(self._buffer[:self._ptr, :2])
-
-        self._ptr += 1
+    def update_data(self):
+        """ Redraws the curve with the current data of the buffer """
+        self._timer.stop()
+        if self._buffer is None:
+            return
+        self.setData(self.buffered_data())
         self.data_updated.emit()
 
 
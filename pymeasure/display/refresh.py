@@ -0,0 +1,186 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+import time
+from queue import Queue
+
+from .Qt import QtCore
+from .thread import StoppableQThread
+from .widgets.plot_frame import PlotFrame
+from .widgets.table_widget import Table
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+class ResultsSnapshots(dict):
+    """ Mapping of results to their data, which is pulled from each results only once.
+
+    :param reload: Results, which are reloaded before their data is pulled.
+    """
+
+    def __init__(self, reload=()):
+        super().__init__()
+        self.reload = set(reload)
+
+    def __missing__(self, results):
+        if results in self.reload:
+            results.reload()
+        data = self[results] = results.data
+        return data
+
+
+class SnapshotThread(StoppableQThread):
+    """ Pulls the data of results in a background thread, such that reading and parsing
+    the data files does not block the GUI.
+
+    Each request is answered with a :class:`ResultsSnapshots` via the :attr:`loaded` signal,
+    which is delivered to receivers in the GUI thread by a queued connection. The data frames
+    of a snapshot are not modified afterwards, new data is always stored in a new frame.
+    """
+
+    loaded = QtCore.Signal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.requests = Queue()
+
+    def request(self, results, reload=()):
+        """ Request the data of results, reloading the data of the results in reload first """
+        self.requests.put((list(results), reload))
+
+    def stop(self):
+        super().stop()
+        self.requests.put(None)  # wake up the thread
+
+    def run(self):
+        while not self.should_stop():
+            request = self.requests.get()
+            if request is None:
+                continue
+            results_list, reload = request
+            snapshots = ResultsSnapshots(reload)
+            for results in results_list:
+                try:
+                    snapshots[results]
+                except Exception:
+                    log.exception("Failed to read the data of %r", results)
+            self.loaded.emit(snapshots)
+
+
+class RefreshCoordinator(QtCore.QObject):
+    """ Refreshes the plot frames and tables of a window with a single timer.
+
+    On each tick, the data of each results is pulled once and handed to all visible frames
+    and tables, which show it. Hidden ones (e.g. in a background tab) are skipped and catch up
+    when they are shown again. The tick interval is extended, if refreshing takes more than
+    :attr:`max_load` of the interval, up to :attr:`max_refresh_time`.
+
+    If `threaded`, the data is pulled by a :class:`SnapshotThread` and only showing it
+    happens in the GUI thread. While a snapshot is being prepared, further ticks are dropped
+    (counted in :attr:`dropped`), such that a slow data source does not pile up work.
+    The owner has to call :meth:`stop` to end the thread, before the coordinator is deleted.
+
+    :param refresh_time: Shortest interval between two refreshes in seconds. If None, the
+        shortest refresh time of the added frames is used.
+    :param threaded: Whether to pull the data in a background thread.
+    """
+
+    max_load = 0.25
+    max_refresh_time = 5.
+
+    refreshed = QtCore.Signal()
+
+    def __init__(self, refresh_time=None, threaded=False, parent=None):
+        super().__init__(parent)
+        self.refresh_time = refresh_time
+        self.frames = []
+        self.duration = 0.
+        self.dropped = 0
+        self._loading = False
+        self.timer = QtCore.QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.loader = None
+        if threaded:
+            self.loader = SnapshotThread()
+            self.loader.loaded.connect(self.show)
+            self.loader.start()
+
+    def add_widget(self, widget):
+        """ Take over the refresh of all plot frames and tables in widget """
+        frames = widget.findChildren(PlotFrame) + widget.findChildren(Table)
+        if isinstance(widget, (PlotFrame, Table)):
+            frames.insert(0, widget)
+        for frame in frames:
+            if getattr(frame, "refresh_time", None) is None or frame in self.frames:
+                continue
+            frame.timer.stop()
+            self.frames.append(frame)
+            if self.refresh_time is None or frame.refresh_time < self.refresh_time:
+                self.refresh_time = frame.refresh_time
+        if self.frames:
+            self.timer.start(int(self.interval * 1e3))
+
+    @property
+    def interval(self):
+        """ Current refresh interval in seconds """
+        return min(max(self.refresh_time, self.duration / self.max_load), self.max_refresh_time)
+
+    def refresh(self):
+        """ Refresh all visible frames with one data snapshot per results """
+        frames = [frame for frame in self.frames if frame.isVisible()]
+        items = [item for frame in frames for item in frame.refresh_items()]
+        reload = {item.results for item in items if item.force_reload}
+        if self.loader is None:
+            self.show(ResultsSnapshots(reload), frames)
+        elif self._loading:
+            self.dropped += 1
+        else:
+            self._loading = True
+            self.loader.request(dict.fromkeys(item.results for item in items), reload)
+
+    def stop(self):
+        """ Stop refreshing and the background thread """
+        self.timer.stop()
+        if self.loader is not None:
+            self.loader.loaded.disconnect(self.show)
+            self.loader.join()
+            self.loader.deleteLater()
+            self.loader = None
+
+    def show(self, snapshots, frames=None):
+        """ Show the data of snapshots in the visible frames """
+        self._loading = False
+        start = time.perf_counter()
+        if frames is None:
+            frames = [frame for frame in self.frames if frame.isVisible()]
+        for frame in frames:
+            frame.refresh_data(snapshots)
+        # smooth the duration to avoid jumping intervals
+        self.duration = 0.7 * self.duration + 0.3 * (time.perf_counter() - start)
+        interval = int(self.interval * 1e3)
+        if interval != self.timer.interval():
+            self.timer.setInterval(interval)
+        self.refreshed.emit()
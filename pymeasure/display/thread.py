@@ -24,6 +24,7 @@
 
 import logging
 
+from queue import Queue
 from threading import Event
 
 from .Qt import QtCore
@@ -62,3 +63,52 @@ class StoppableQThread(QtCore.QThread):
     def __repr__(self):
         return "<{}(should_stop={})>".format(
             self.__class__.__name__, self.should_stop())
+
+
+class ResultsLoader(StoppableQThread):
+    """ Reads the data files of :class:`~pymeasure.experiment.results.Results`
+    one after the other in a background thread, such that opening large files
+    does not block the GUI.
+
+    The :attr:`progress` signal reports the percentage of the file read so far
+    and :attr:`loaded` is emitted with the results and whether reading failed,
+    once the data of a results has been read.
+    """
+
+    progress = QtCore.Signal(object, float)
+    loaded = QtCore.Signal(object, bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.requests = Queue()
+        self.pending = []  # results queued or being loaded
+        self.loaded.connect(self._loaded)
+
+    def load(self, results):
+        """ Queue results, whose data is to be read """
+        self.pending.append(results)
+        self.requests.put(results)
+
+    def is_pending(self, filename):
+        """ Whether results of the data file are queued or being loaded """
+        return any(results.data_filename == filename for results in self.pending)
+
+    def _loaded(self, results, failed):
+        self.pending.remove(results)
+
+    def stop(self):
+        super().stop()
+        self.requests.put(None)  # wake up the thread
+
+    def run(self):
+        while not self.should_stop():
+            results = self.requests.get()
+            if results is None:
+                continue
+            try:
+                results.reload(progress=lambda value: self.progress.emit(results, value))
+            except Exception:
+                log.exception("Failed to read the data file %s", results.data_filename)
+                self.loaded.emit(results, True)
+            else:
+                self.loaded.emit(results, False)
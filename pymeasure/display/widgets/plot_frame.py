@@ -82,22 +82,32 @@ class PlotFrame(QtWidgets.QFrame):
         self.crosshairs.coordinates.connect(self.update_coordinates)
 
         self.timer = QtCore.QTimer(self)
-        self.timer.timeout.connect(self.update_curves)
-        self.timer.timeout.connect(self.crosshairs.update)
-        self.timer.timeout.connect(self.updated)
+        self.timer.timeout.connect(self.refresh_data)
         self.timer.start(int(self.refresh_time * 1e3))
 
     def update_coordinates(self, x, y):
         self.coordinates.setText(f"({x:g}, {y:g})")
 
-    def update_curves(self):
-        for item in self.plot.items:
-            if isinstance(item, self.ResultsClass):
-                if self.check_status:
-                    if item.results.procedure.status == Procedure.RUNNING:
-                        item.update_data()
-                else:
-                    item.update_data()
+    def refresh_items(self):
+        """ Return the curves, which need to be updated """
+        return [item for item in self.plot.items
+                if isinstance(item, self.ResultsClass)
+                and (not self.check_status or item.results.procedure.status == Procedure.RUNNING)]
+
+    def update_curves(self, snapshots=None):
+        """ Update the curves
+
+        :param snapshots: Mapping of results to their data snapshot. If None, the curves take the
+            data from their results.
+        """
+        for item in self.refresh_items():
+            item.update_data(None if snapshots is None else snapshots[item.results])
+
+    def refresh_data(self, snapshots=None):
+        """ Refresh curves and crosshairs, called periodically """
+        self.update_curves(snapshots)
+        self.crosshairs.update()
+        self.updated.emit()
 
     def parse_axis(self, axis):
         """ Returns the units of an axis by searching the string
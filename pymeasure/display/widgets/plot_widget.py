@@ -37,16 +37,20 @@ log.addHandler(logging.NullHandler())
 
 class PlotWidget(TabWidget, QtWidgets.QWidget):
     """ Extends :class:`PlotFrame<pymeasure.display.widgets.plot_frame.PlotFrame>`
-    to allow different columns of the data to be dynamically chosen
+    to allow different columns of the data to be dynamically chosen.
+
+    With :code:`lod=True`, the curves show the min/max envelope of their data with a level of
+    detail adapted to the visible range, see :class:`~pymeasure.display.curves.ResultsCurve`.
     """
 
     def __init__(self, name, columns, x_axis=None, y_axis=None, refresh_time=0.2,
-                 check_status=True, linewidth=1, parent=None):
+                 check_status=True, linewidth=1, lod=False, parent=None):
         super().__init__(name, parent)
         self.columns = columns
         self.refresh_time = refresh_time
         self.check_status = check_status
         self.linewidth = linewidth
+        self.lod = lod
         self._setup_ui()
         self._layout()
         if x_axis is not None:
@@ -108,6 +112,8 @@ class PlotWidget(TabWidget, QtWidgets.QWidget):
             kwargs['pen'] = pg.mkPen(color=color, width=self.linewidth)
         if 'antialias' not in kwargs:
             kwargs['antialias'] = False
+        if 'lod' not in kwargs:
+            kwargs['lod'] = self.lod
         curve = ResultsCurve(results,
                              wdg=self,
                              x=self.plot_frame.x_axis,
@@ -145,6 +151,7 @@ class PlotWidget(TabWidget, QtWidgets.QWidget):
                           self.columns,
                           self.plot_frame.x_axis,
                           self.plot_frame.y_axis,
+                          lod=self.lod,
                           parent=parent,
                           )
 
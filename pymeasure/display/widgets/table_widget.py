@@ -23,6 +23,7 @@
 #
 
 import logging
+from collections import OrderedDict
 from functools import partial
 
 import numpy as np
@@ -85,12 +86,18 @@ class ResultsTable(QtCore.QObject):
     def stop(self):
         self._started = False
 
-    def update_data(self):
+    def update_data(self, data=None):
+        """ Update the table data by polling the results
+
+        :param data: Snapshot of the results data. If None, the data is taken from the results.
+        """
         if not self._started:
             return
-        if self.force_reload:
-            self.results.reload()
-        self.data = self.results.data
+        if data is None:
+            if self.force_reload:
+                self.results.reload()
+            data = self.results.data
+        self.data = data
         current_row_count, columns = self._data.shape
         if (self.last_row_count < current_row_count):
             # Request cells content update
@@ -105,6 +112,81 @@ class ResultsTable(QtCore.QObject):
         self.column_index = index
 
 
+class MergedIndex:
+    """ Sorted union of the indices of several results with a position map for each of them.
+
+    The union is updated incrementally when rows are appended to the results. Looking up the
+    local row of a results, which belongs to a row of the merged index, takes constant time.
+    If an index value occurs multiple times in a results, its first row is used.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.values = None
+        self._positions = {}
+        self._rows = {}
+
+    def __len__(self):
+        return 0 if self.values is None else len(self.values)
+
+    def update(self, results_list):
+        """ Synchronize the merged index with the current rows of the results """
+        shrunk = any(results.rows < self._rows.get(results, 0) for results in results_list)
+        if shrunk or not set(self._rows).issubset(results_list):
+            self.clear()
+        for results in results_list:
+            rows = self._rows.get(results, 0)
+            if results not in self._rows or results.rows > rows:
+                self._append(results, rows)
+
+    def local_row(self, results, row):
+        """ Return the row of results matching the merged row or None """
+        positions = self._positions.get(results)
+        if positions is None or row >= len(positions):
+            return None
+        position = positions[row]
+        return None if position < 0 else int(position)
+
+    def _append(self, results, start):
+        values = np.asarray(results.data.index[start:])
+        self._rows[results] = results.rows
+        if self.values is None:
+            moved = True
+            self.values = np.unique(values)
+        else:
+            missing = np.setdiff1d(values, self.values)
+            # Values inserted before the end move the rows of all results
+            moved = bool(missing.size and self.values.size and missing[0] < self.values[-1])
+            if moved:
+                self.values = np.union1d(self.values, missing)
+            elif missing.size:
+                self.values = np.concatenate([self.values, missing])
+
+        size = len(self.values)
+        if moved:
+            self._positions = {r: np.full(size, -1, dtype=np.intp) for r in self._rows}
+            for r in self._rows:
+                self._locate(r, 0)
+        else:
+            for r, positions in self._positions.items():
+                if len(positions) < size:
+                    self._positions[r] = np.concatenate(
+                        [positions, np.full(size - len(positions), -1, dtype=np.intp)])
+            self._positions.setdefault(results, np.full(size, -1, dtype=np.intp))
+            self._locate(results, start)
+
+    def _locate(self, results, start):
+        stop = self._rows[results]
+        local = np.arange(start, stop)
+        merged = np.searchsorted(self.values, np.asarray(results.data.index[start:stop]))
+        positions = self._positions[results]
+        free = positions[merged] < 0
+        # Reversed assignment, such that the first of duplicated index values wins
+        positions[merged[free][::-1]] = local[free][::-1]
+
+
 class PandasModelBase(QtCore.QAbstractTableModel):
     """ This class provided a model to manage multiple panda dataframes and
     display them as a single table.
@@ -125,8 +207,10 @@ class PandasModelBase(QtCore.QAbstractTableModel):
 
     float_digits = 6
     concat_axis = 0
+    # Sort the table with a QSortFilterProxyModel, otherwise the model implements sort
+    sort_by_proxy = True
 
-    def __init__(self, column_index=None, results_list=[], parent=None):
+    def __init__(self, column_index=None, results_list=None, parent=None):
         super().__init__(parent)
         self.column_index = column_index
         self._init_data(results_list)
@@ -135,8 +219,7 @@ class PandasModelBase(QtCore.QAbstractTableModel):
         if results_list is None:
             results_list = []
         self.results_list = results_list
-        self.row_count = self.pandas_row_count()
-        self.column_count = self.pandas_column_count()
+        self.update_counts()
 
     def clear(self):
         self.beginResetModel()
@@ -159,11 +242,15 @@ class PandasModelBase(QtCore.QAbstractTableModel):
         self.beginResetModel()
         if results in self.results_list:
             self.results_list.remove(results)
-        self.row_count = self.pandas_row_count()
-        self.column_count = self.pandas_column_count()
+        self.update_counts()
         results.stop()
         self.endResetModel()
 
+    def update_counts(self):
+        """ Update row and column count from the results """
+        self.row_count = self.pandas_row_count()
+        self.column_count = self.pandas_column_count()
+
     def rowCount(self, parent=None):
         return self.row_count
 
@@ -311,8 +398,7 @@ class PandasModelBase(QtCore.QAbstractTableModel):
         for r in self.results_list:
             r.start()
             r.update_data()
-        self.row_count = self.pandas_row_count()
-        self.column_count = self.pandas_column_count()
+        self.update_counts()
         self.endResetModel()
 
     def copy_model(self, model_class):
@@ -381,14 +467,231 @@ class PandasModelByRow(PandasModelBase):
         return pixelmap
 
 
+class PandasModelVirtual(PandasModelByRow):
+    """ Row layout model for results with millions of rows.
+
+    Cells are formatted in blocks of :attr:`block_size` rows of a column with one vectorized
+    operation, the last :attr:`cache_blocks` formatted blocks are kept in a LRU cache.
+    Rows are loaded incrementally by :meth:`fetchMore` in steps of :attr:`fetch_size` rows and
+    sorting is done by the model itself with a precomputed argsort of the sorted column.
+    """
+
+    sort_by_proxy = False
+    block_size = 1000
+    cache_blocks = 200
+    fetch_size = 10000
+
+    def _init_data(self, results_list=None):
+        self._blocks = OrderedDict()
+        self._order = None
+        self._ascending = None
+        self._sorted_values = None
+        self._source_rows = {}
+        self._sort_column = -1
+        self._sort_order = QtCore.Qt.SortOrder.AscendingOrder
+        self.row_count = 0
+        super()._init_data(results_list)
+
+    def update_counts(self):
+        # Keep the rows fetched so far, further rows are loaded by fetchMore
+        self.row_count = min(self.pandas_row_count(), max(self.row_count, self.fetch_size))
+        self.column_count = self.pandas_column_count()
+        self._blocks.clear()
+        self._order = self._argsort()
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        return self.row_count < self.pandas_row_count()
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        rows = min(self.fetch_size, self.pandas_row_count() - self.row_count)
+        if rows > 0:
+            self.beginInsertRows(QtCore.QModelIndex(), self.row_count, self.row_count + rows - 1)
+            self.row_count += rows
+            self.endInsertRows()
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+        results, row, col = self.translate_to_local(self.source_row(index.row()),
+                                                    index.column())
+        block = self.formatted_block(results, col, row // self.block_size)
+        row %= self.block_size
+        return str(block[row]) if row < len(block) else ""
+
+    def formatted_block(self, results, col, block):
+        """ Return the formatted strings of a block of rows of a results column """
+        key = (results, col, block)
+        if key in self._blocks:
+            self._blocks.move_to_end(key)
+            return self._blocks[key]
+        start = block * self.block_size
+        values = results.data.iloc[start:start + self.block_size, col].to_numpy()
+        if values.dtype == np.float64:
+            # limit maximum number of decimal digits displayed
+            formatted = np.char.mod(f"%.{self.float_digits:d}g", values)
+        else:
+            formatted = values.astype(str)
+        self._blocks[key] = formatted
+        if len(self._blocks) > self.cache_blocks:
+            self._blocks.popitem(last=False)
+        return formatted
+
+    def source_row(self, row):
+        """ Return the unsorted row of a (sorted) table row """
+        if self._order is not None and row < len(self._order):
+            return int(self._order[row])
+        return row
+
+    def sort(self, column, order=QtCore.Qt.SortOrder.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        sources = self._table_sources()
+        self._sort_column = column
+        self._sort_order = order
+        self._order = self._argsort()
+        self._move_persistent_indexes(sources)
+        self.layoutChanged.emit()
+
+    def _argsort(self):
+        """ Sort all rows and return the source rows in table order or None if unsorted """
+        self._source_rows = {r: r.rows for r in self.results_list}
+        if self._sort_column < 0 or not self.results_list:
+            self._ascending = self._sorted_values = None
+            return None
+        values = np.concatenate([r.data.iloc[:, self._sort_column].to_numpy()
+                                 for r in self.results_list])
+        self._ascending = np.argsort(values, kind="stable")
+        self._sorted_values = values[self._ascending]
+        return self._directed(self._ascending)
+
+    def _directed(self, ascending):
+        if self._sort_order == QtCore.Qt.SortOrder.DescendingOrder:
+            return ascending[::-1]
+        return ascending
+
+    def _table_sources(self):
+        """ Return the source rows of the fetched table rows """
+        if self._order is None:
+            return np.arange(self.row_count)
+        return self._order[:self.row_count]
+
+    def _move_persistent_indexes(self, sources):
+        """ Move the persistent indexes to the current table rows of their source rows
+
+        :param sources: Source rows of the table rows before the change.
+        """
+        indexes = self.persistentIndexList()
+        if not indexes:
+            return
+        if self._order is None:
+            rows = sources
+        else:
+            table_rows = np.empty(len(self._order), dtype=np.intp)
+            table_rows[self._order] = np.arange(len(self._order))
+            rows = table_rows[sources]
+        moved = []
+        for index in indexes:
+            row = int(rows[index.row()])
+            moved.append(self.createIndex(row, index.column()) if row < self.row_count
+                         else QtCore.QModelIndex())
+        self.changePersistentIndexList(indexes, moved)
+
+    def _data_changed(self, results, r1, c1, r2, c2):
+        """ Internal method to handle data changed signal """
+        for block in range(r1 // self.block_size, r2 // self.block_size + 1):
+            for col in range(c1, c2 + 1):
+                self._blocks.pop((results, col, block), None)
+        rows = self._source_rows.get(results, 0)
+        if self.pandas_column_count() != self.column_count or results.rows < rows:
+            self.beginResetModel()
+            self.update_counts()
+            self.endResetModel()
+            return
+        offset = sum(self._source_rows.get(r, 0)
+                     for r in self.results_list[:self.results_list.index(results)])
+        if self._order is not None and r1 < rows:
+            # Sort values of existing rows might have changed
+            self.sort(self._sort_column, self._sort_order)
+        elif results.rows > rows:
+            self._source_rows[results] = results.rows
+            if self._order is None:
+                self._insert_rows(offset + rows, results.rows - rows)
+            else:
+                self._merge_rows(results, rows, offset + rows)
+        self.fetchMore()
+        if self._order is None and r1 < rows:
+            # Only rows which existed before changed their content
+            last = min(offset + min(r2, rows - 1), self.row_count - 1)
+            if offset + r1 <= last:
+                self.dataChanged.emit(self.createIndex(offset + r1, c1),
+                                      self.createIndex(last, c2))
+
+    def _insert_rows(self, start, count):
+        """ Insert appended rows of results in front of the rows of later results """
+        if start < self.row_count:
+            self.beginInsertRows(QtCore.QModelIndex(), start, start + count - 1)
+            self.row_count += count
+            self.endInsertRows()
+
+    def _merge_rows(self, results, rows, start):
+        """ Merge the rows appended to results into the sort order
+
+        :param rows: Number of rows of results which are already sorted.
+        :param start: Source row of the first appended row.
+        """
+        values = results.data.iloc[rows:, self._sort_column].to_numpy()
+        count = len(values)
+        order = np.argsort(values, kind="stable")
+        values = values[order]
+        positions = np.searchsorted(self._sorted_values, values, side="right")
+        later_rows = start < len(self._ascending)
+        # Appending to the end of the table does not move any rows
+        end = 0 if self._sort_order == QtCore.Qt.SortOrder.DescendingOrder \
+            else len(self._sorted_values)
+        moved = later_rows or (self.row_count > 0 and bool((positions != end).any()))
+        if moved:
+            self.layoutAboutToBeChanged.emit()
+            sources = self._table_sources()
+            # Rows of later results move behind the appended rows
+            sources = sources + (sources >= start) * count
+        ascending = self._ascending + (self._ascending >= start) * count
+        self._ascending = np.insert(ascending, positions, start + order)
+        self._sorted_values = np.insert(self._sorted_values, positions, values)
+        self._order = self._directed(self._ascending)
+        if moved:
+            self._move_persistent_indexes(sources)
+            self.layoutChanged.emit()
+
+    def headerData(self, section, orientation, role):
+        if (role == QtCore.Qt.ItemDataRole.DisplayRole
+                and orientation == QtCore.Qt.Orientation.Vertical):
+            row = self.source_row(section)
+            if self.column_index is None:
+                return str(row)
+            results, row, _ = self.translate_to_local(row, 0)
+            return str(results.data.index[row])
+        return super().headerData(section, orientation, role)
+
+    def vertical_header_decoration(self, section):
+        return super().vertical_header_decoration(self.source_row(section))
+
+
 class PandasModelByColumn(PandasModelBase):
     concat_axis = 1
 
+    def _init_data(self, results_list=None):
+        self.merged_index = MergedIndex()
+        super()._init_data(results_list)
+
+    def set_index(self, index):
+        self.merged_index.clear()
+        super().set_index(index)
+
     def pandas_row_count(self):
         if self.column_index is None:
             return max([0] + [r.rows for r in self.results_list])
         else:
-            return len(self.vertical_header)
+            self.merged_index.update(self.results_list)
+            return len(self.merged_index)
 
     def pandas_column_count(self):
         cols = 0
@@ -415,11 +718,7 @@ class PandasModelByColumn(PandasModelBase):
             columns += results.columns
         if (self.column_index is not None):
             # Remap row to matching index entry when indexing is used
-            try:
-                index = self.vertical_header[row]
-                row = list(results.data.index).index(index)
-            except ValueError:
-                row = None
+            row = self.merged_index.local_row(results, row)
         return results, row, col - columns
 
     def translate_to_global(self, results, row, col):
@@ -448,11 +747,11 @@ class PandasModelByColumn(PandasModelBase):
 
     @property
     def vertical_header(self):
-        header = set([])
-        for r in self.results_list:
-            header = header.union(set(r.data.index))
-        header = sorted(list(header))
-        return header
+        if self.column_index is None:
+            return range(self.row_count)
+        if self.merged_index.values is None:
+            return []
+        return self.merged_index.values
 
 
 class Table(QtWidgets.QTableView):
@@ -493,12 +792,12 @@ class Table(QtWidgets.QTableView):
         self.check_status = check_status
         if self.refresh_time is not None:
             self.timer = QtCore.QTimer(self)
-            self.timer.timeout.connect(self.update_tables)
+            self.timer.timeout.connect(self.refresh_data)
             self.timer.start(int(self.refresh_time * 1e3))
 
     def setModel(self, model):
         model.float_digits = self.float_digits
-        if SORTING_ENABLED:
+        if SORTING_ENABLED and model.sort_by_proxy:
             proxyModel = QtCore.QSortFilterProxyModel(self)
             proxyModel.setSourceModel(model)
             model = proxyModel
@@ -508,7 +807,7 @@ class Table(QtWidgets.QTableView):
 
     def source_model(self):
         model = self.model()
-        if SORTING_ENABLED:
+        if isinstance(model, QtCore.QSortFilterProxyModel):
             model = model.sourceModel()
         return model
 
@@ -555,14 +854,25 @@ class Table(QtWidgets.QTableView):
         menu.addAction(self.export)
         menu.exec(self.mapToGlobal(point))
 
-    def update_tables(self, force=False):
-        model = self.source_model()
-        for item in model.results_list:
-            if not self.check_status or force:
-                item.update_data()
-            else:
-                if item.results.procedure.status == Procedure.RUNNING:
-                    item.update_data()
+    def refresh_items(self, force=False):
+        """ Return the tables, which need to be updated """
+        return [item for item in self.source_model().results_list
+                if not self.check_status or force
+                or item.results.procedure.status == Procedure.RUNNING]
+
+    def update_tables(self, force=False, snapshots=None):
+        """ Update the tables
+
+        :param force: Update also tables of experiments, which are not running.
+        :param snapshots: Mapping of results to their data snapshot. If None, the tables take the
+            data from their results.
+        """
+        for item in self.refresh_items(force):
+            item.update_data(None if snapshots is None else snapshots[item.results])
+
+    def refresh_data(self, snapshots=None):
+        """ Refresh the table, called periodically """
+        self.update_tables(snapshots=snapshots)
 
     def set_color(self, table, color):
         table.set_color(color)
@@ -606,6 +916,7 @@ class TableWidget(TabWidget, QtWidgets.QWidget):
     layout_class_map = {
         'By Row': PandasModelByRow,
         'By Column': PandasModelByColumn,
+        'By Row (large data)': PandasModelVirtual,
     }
 
     def __init__(self, name, columns, by_column=True,
@@ -35,6 +35,8 @@ import pyqtgraph as pg
 from ..browser import BrowserItem
 from ..manager import Manager, Experiment
 from ..Qt import QtCore, QtWidgets, QtGui
+from ..refresh import RefreshCoordinator
+from ..thread import ResultsLoader
 from ..widgets import (
     PlotWidget,
     BrowserWidget,
@@ -119,8 +121,20 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
     :param hide_groups: a boolean controlling whether parameter groups are hidden (True, default)
         or disabled/grayed-out (False) when the group conditions are not met.
 
+    Data files are opened in the background by a
+    :class:`~pymeasure.display.thread.ResultsLoader`. If
+    :attr:`cache_data_files` is True, their parsed data is cached next to
+    them, which speeds up opening them again (see
+    :class:`~pymeasure.experiment.results.Results`).
+
+    The plots and tables of the widgets are refreshed by a single
+    :class:`~pymeasure.display.refresh.RefreshCoordinator`, which pulls the data of each
+    experiment once per refresh in a background thread and skips hidden widgets.
+
     """
 
+    cache_data_files = False
+
     def __init__(self,
                  procedure_class,
                  widget_list=(),
@@ -164,6 +178,16 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         self._setup_ui()
         self._layout()
 
+        # A single timer refreshes the plots and tables of all widgets
+        self.refresh_coordinator = RefreshCoordinator(threaded=True, parent=self)
+        for wdg in self.widget_list:
+            self.refresh_coordinator.add_widget(wdg)
+
+        self.results_loader = ResultsLoader()
+        self.results_loader.progress.connect(self._show_loading_progress)
+        self.results_loader.loaded.connect(self._results_loaded)
+        self.results_loader.start()
+
     def _setup_ui(self):
 
         self.queue_button = QtWidgets.QPushButton('Queue', self)
@@ -285,6 +309,12 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
 
         self.close()
 
+    def closeEvent(self, event):
+        # The background threads end with the window
+        self.refresh_coordinator.stop()
+        self.results_loader.join()
+        super().closeEvent(event)
+
     def browser_item_changed(self, item, column):
         if column == 0:
             state = item.checkState(0)
@@ -400,7 +430,8 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
         if dialog.exec():
             filenames = dialog.selectedFiles()
             for filename in map(str, filenames):
-                if filename in self.manager.experiments:
+                if (filename in self.manager.experiments
+                        or self.results_loader.is_pending(filename)):
                     QtWidgets.QMessageBox.warning(
                         self, "Load Error",
                         "The file %s cannot be opened twice." % os.path.basename(filename)
@@ -408,14 +439,32 @@ class ManagedWindowBase(QtWidgets.QMainWindow):
                 elif filename == '':
                     return
                 else:
-                    results = Results.load(filename)
-                    experiment = self.new_experiment(results)
-                    for curve in experiment.curve_list:
-                        if curve:
-                            curve.update_data()
-                    experiment.browser_item.progressbar.setValue(100)
-                    self.manager.load(experiment)
-                    log.info('Opened data file %s' % filename)
+                    # Read only the header now and the data in the background
+                    results = Results.load(filename, lazy=True, cache=self.cache_data_files)
+                    self.results_loader.load(results)
+
+    def _show_loading_progress(self, results, progress):
+        self.statusBar().showMessage("Opening %s: %d %%" % (
+            os.path.basename(results.data_filename), progress))
+
+    def _results_loaded(self, results, failed):
+        if failed:
+            if not self.results_loader.pending:
+                self.statusBar().clearMessage()
+            QtWidgets.QMessageBox.warning(
+                self, "Load Error",
+                "The file %s could not be opened." % os.path.basename(results.data_filename)
+            )
+            return
+        experiment = self.new_experiment(results)
+        for curve in experiment.curve_list:
+            if curve:
+                curve.update_data()
+        experiment.browser_item.progressbar.setValue(100)
+        self.manager.load(experiment)
+        if not self.results_loader.pending:
+            self.statusBar().clearMessage()
+        log.info('Opened data file %s' % results.data_filename)
 
     def save_experiment_copy(self, source_filename):
         """Save a copy of the datafile to a selected folder and file.
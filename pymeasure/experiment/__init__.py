@@ -30,4 +30,9 @@ from .results import Results, unique_filename, replace_placeholders
 from .workers import Worker
 from .listeners import Listener, Recorder
 from .config import get_config
-from .experiment import Experiment, get_array, get_array_steps, get_array_zero
+from ..lazy_import import attach
+
+# The experiment module imports IPython, if available, which takes a long time.
+__getattr__, __dir__, _ = attach(__name__, {
+    "experiment": ["Experiment", "get_array", "get_array_steps", "get_array_zero"],
+})
@@ -27,17 +27,20 @@ import logging
 import os
 import re
 import sys
+import threading
 from importlib import import_module
 from importlib.machinery import SourceFileLoader
 from datetime import datetime
 from string import Formatter
 
-import pandas as pd
+import numpy as np
 import pint
 
 from .procedure import Procedure, UnknownProcedure
 from pymeasure.units import ureg
 
+# pandas is imported by the methods reading data, which a measurement script may never call
+
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
@@ -137,15 +140,27 @@ class CSVFormatter(logging.Formatter):
     def format(self, record):
         """Formats a record as csv.
 
-        :param record: record to format.
-        :type record: dict
+        :param record: record to format, or a list of its values which are
+            already converted by :meth:`values`.
+        :type record: dict or list
         :return: a string
         """
+        values = record if isinstance(record, list) else self.values(record)
+        return self.delimiter.join(f"{value}" for value in values)
+
+    def values(self, record):
+        """Returns the values of a record in the order of the columns, converted
+        to the units of the columns where applicable.
+
+        :param record: record to convert.
+        :type record: dict
+        :return: a list of values
+        """
         line = []
         for x in self.columns:
             value = record.get(x, float("nan"))
             if isinstance(value, (float, int, Decimal)) and type(value) is not bool:
-                line.append(f"{value}")
+                line.append(value)
             else:
                 units = self.units.get(x, None)
                 if units is not None:
@@ -158,37 +173,100 @@ class CSVFormatter(logging.Formatter):
                                 f" unit {units}.")
                     if isinstance(value, pint.Quantity):
                         try:
-                            line.append(f"{value.m_as(units)}")
+                            line.append(value.m_as(units))
                         except pint.DimensionalityError:
-                            line.append("nan")
+                            line.append(float("nan"))
                             log.warning(
                                 f"Value {value} for column {x} does not have the "
                                 f"right unit {units}.")
                     elif isinstance(value, bool):
-                        line.append("nan")
+                        line.append(float("nan"))
                         log.warning(
                             f"Boolean for column {x} does not have unit {units}.")
                     else:
-                        line.append("nan")
+                        line.append(float("nan"))
                         log.warning(
                             f"Value {value} for column {x} does not have the right"
                             f" type for unit {units}.")
                 else:
                     if isinstance(value, pint.Quantity):
                         if value.units == ureg.dimensionless:
-                            line.append(f"{value.magnitude}")
+                            line.append(value.magnitude)
                         else:
                             self.units[x] = value.to_base_units().units
-                            line.append(f"{value.m_as(self.units[x])}")
+                            line.append(value.m_as(self.units[x]))
                             log.info(f"Column {x} units was set to {self.units[x]}")
                     else:
-                        line.append(f"{value}")
-        return self.delimiter.join(line)
+                        line.append(value)
+        return line
 
     def format_header(self):
         return self.delimiter.join(self.columns)
 
 
+class DataBus:
+    """ Ring buffer through which a :class:`.Worker` hands new data rows to
+    consumers in the same process, e.g. the plots and tables of a
+    :class:`.ManagedWindow`, so that these do not have to read them back from
+    the data file.
+
+    Rows are numbered in the order in which they are published, starting at
+    `start`. Only the last `size` rows are kept: a consumer that falls further
+    behind gets None from :meth:`read` and has to read the missing rows from
+    the data file instead.
+
+    :param columns: list of the column names
+    :param size: maximum number of rows kept in the buffer
+    :param start: number of the first published row, i.e. the number of rows
+                  which are already in the data file
+    """
+
+    SIZE = 10000
+
+    def __init__(self, columns, size=SIZE, start=0):
+        if size < 1:
+            raise ValueError("DataBus size must be positive")
+        self.columns = list(columns)
+        self.size = size
+        self.count = self._start = start
+        self.closed = False
+        self._rows = [None] * size
+        self._lock = threading.Lock()
+
+    def publish(self, row):
+        """ Appends a row to the buffer, dropping the oldest row if it is full.
+
+        :param row: sequence of values in the order of the columns
+        """
+        with self._lock:
+            self._rows[self.count % self.size] = row
+            self.count += 1
+
+    def read(self, start):
+        """ Returns the rows from number `start` on as a :class:`pandas.DataFrame`,
+        or None if some of them have already been dropped from the buffer.
+
+        :param start: number of the first row to return
+        """
+        import pandas as pd
+        with self._lock:
+            stop = self.count
+            if not max(self._start, stop - self.size) <= start <= stop:
+                return None
+            first, last = start % self.size, stop % self.size
+            if start == stop:
+                rows = []
+            elif first < last:
+                rows = self._rows[first:last]
+            else:
+                rows = self._rows[first:] + self._rows[:last]
+        return pd.DataFrame(rows, columns=self.columns)
+
+    def close(self):
+        """ Marks the end of the data, no more rows will be published. """
+        self.closed = True
+
+
 class Results:
     """ The Results class provides a convenient interface to reading and
     writing data in connection with a :class:`.Procedure` object.
@@ -198,9 +276,19 @@ class Results:
     :cvar LINE_BREAK: The character used for line breaks (default \\n)
     :cvar CHUNK_SIZE: The length of the data chuck that is read
 
+    While a :class:`.Worker` runs the procedure, it publishes the new data
+    via the :attr:`bus` (see :class:`DataBus`) and :attr:`data` takes the new
+    rows from there. Otherwise, e.g. for results loaded from a file, new rows
+    are read from the end of the data file.
+
     :param procedure: Procedure object
     :param data_filename: The data filename where the data is or should be
                           stored
+    :param lazy: If True, the data of an existing file is read at the first
+                 access of :attr:`data` instead of immediately
+    :param cache: If True, the parsed data of an existing file is stored in
+                  the :attr:`cache_filename` next to it and read from there
+                  as long as the file is not modified
     """
 
     COMMENT = '#'
@@ -209,7 +297,7 @@ class Results:
     CHUNK_SIZE = 1000
     ENCODING = "utf-8"
 
-    def __init__(self, procedure, data_filename):
+    def __init__(self, procedure, data_filename, lazy=False, cache=False):
         if not isinstance(procedure, Procedure):
             raise ValueError("Results require a Procedure object")
         self.procedure = procedure
@@ -217,6 +305,9 @@ class Results:
         self.parameters = procedure.parameter_objects()
         self._header_count = -1
         self._metadata_count = -1
+        self.bus = None
+        self.cache = cache
+        self._lock = threading.RLock()
 
         self.formatter = CSVFormatter(columns=self.procedure.DATA_COLUMNS)
 
@@ -229,7 +320,10 @@ class Results:
         self.data_filenames = data_filenames
 
         if os.path.exists(data_filename):  # Assume header is already written
-            self.reload()
+            if lazy:
+                self._data = None
+            else:
+                self.reload()
             self.procedure.status = Procedure.FINISHED
             # TODO: Correctly store and retrieve status
         else:
@@ -251,10 +345,13 @@ class Results:
         state = self.__dict__.copy()
         del state['procedure']
         del state['procedure_class']
+        state['bus'] = None  # the data bus works only within one process
+        del state['_lock']
         return state
 
     def __setstate__(self, state):
         self.__dict__.update(state)
+        self._lock = threading.RLock()
 
         # Restore the procedure
         module = SourceFileLoader(self._module, self._file).load_module()
@@ -408,9 +505,10 @@ class Results:
         return procedure
 
     @staticmethod
-    def load(data_filename, procedure_class=None):
+    def load(data_filename, procedure_class=None, lazy=False, cache=False):
         """ Returns a Results object with the associated Procedure object and
-        data
+        data. The data is only read from the file when accessed, if `lazy`.
+        If `cache`, the parsed data is cached next to the file (see :class:`Results`).
         """
         header = ""
         header_read = False
@@ -424,63 +522,159 @@ class Results:
                 else:
                     header_read = True
         procedure = Results.parse_header(header[:-1], procedure_class)
-        results = Results(procedure, data_filename)
+        results = Results(procedure, data_filename, lazy=lazy, cache=cache)
         results._header_count = header_count
         return results
 
+    def open_bus(self, size=DataBus.SIZE):
+        """ Creates the :attr:`bus` for publishing the rows which are
+        going to be appended to the data file.
+
+        :param size: maximum number of rows kept in the bus
+        :return: the :class:`DataBus`
+        """
+        start = 0 if self._data is None else len(self._data)
+        self.bus = DataBus(self.procedure.DATA_COLUMNS, size=size, start=start)
+        return self.bus
+
+    def _read_bus(self):
+        """ Appends the new rows of the bus to the data, returns False if the
+        rows have to be read from the file instead.
+        """
+        import pandas as pd
+        bus = self.bus
+        start = 0 if self._data is None else len(self._data)
+        new = bus.read(start)
+        if new is None:
+            return False
+        if start == 0:
+            self._data = new
+        elif len(new) > 0:
+            self._data = pd.concat([self._data, new], ignore_index=True)
+        if bus.closed and len(self._data) == bus.count:
+            self.bus = None  # all data has been consumed
+        return True
+
     @property
     def data(self):
-        # Need to update header count for correct referencing
-        if self._header_count == -1:
-            self._header_count = len(
-                self.header()[-1].split(Results.LINE_BREAK))
-        if self._data is None or len(self._data) == 0:
-            # Data has not been read
-            try:
-                self.reload()
-            except Exception:
-                # Empty dataframe
-                self._data = pd.DataFrame(columns=self.procedure.DATA_COLUMNS)
-        else:  # Concatenate additional data, if any, to already loaded data
-            skiprows = len(self._data) + self._header_count
-            chunks = pd.read_csv(
-                self.data_filename,
-                comment=Results.COMMENT,
-                header=0,
-                names=self._data.columns,
-                chunksize=Results.CHUNK_SIZE,
-                skiprows=skiprows,
-                iterator=True,
-                encoding=Results.ENCODING,
-            )
-            try:
-                tmp_frame = pd.concat(chunks, ignore_index=True)
-                # only append new data if there is any
-                # if no new data, tmp_frame dtype is object, which override's
-                # self._data's original dtype - this can cause problems plotting
-                # (e.g. if trying to plot int data on a log axis)
-                if len(tmp_frame) > 0:
-                    self._data = pd.concat([self._data, tmp_frame],
-                                           ignore_index=True)
-            except Exception:
-                pass  # All data is up to date
-        return self._data
-
-    def reload(self):
+        import pandas as pd
+        # The lock allows to read the data in another thread than the GUI
+        with self._lock:
+            if self.bus is not None and self._read_bus():
+                return self._data
+            # Need to update header count for correct referencing
+            if self._header_count == -1:
+                self._header_count = len(
+                    self.header()[-1].split(Results.LINE_BREAK))
+            if self._data is None or len(self._data) == 0:
+                # Data has not been read
+                try:
+                    self.reload()
+                except Exception:
+                    # Empty dataframe
+                    self._data = pd.DataFrame(columns=self.procedure.DATA_COLUMNS)
+            else:  # Concatenate additional data, if any, to already loaded data
+                skiprows = len(self._data) + self._header_count
+                chunks = pd.read_csv(
+                    self.data_filename,
+                    comment=Results.COMMENT,
+                    header=0,
+                    names=self._data.columns,
+                    chunksize=Results.CHUNK_SIZE,
+                    skiprows=skiprows,
+                    iterator=True,
+                    encoding=Results.ENCODING,
+                )
+                try:
+                    tmp_frame = pd.concat(chunks, ignore_index=True)
+                    # only append new data if there is any
+                    # if no new data, tmp_frame dtype is object, which override's
+                    # self._data's original dtype - this can cause problems plotting
+                    # (e.g. if trying to plot int data on a log axis)
+                    if len(tmp_frame) > 0:
+                        self._data = pd.concat([self._data, tmp_frame],
+                                               ignore_index=True)
+                except Exception:
+                    pass  # All data is up to date
+            return self._data
+
+    def reload(self, progress=None):
         """ Preforms a full reloading of the file data, neglecting
         any changes in the comments
+
+        :param progress: Optional callable, which is called with the
+                         percentage of the file read so far.
         """
-        chunks = pd.read_csv(
-            self.data_filename,
-            comment=Results.COMMENT,
-            chunksize=Results.CHUNK_SIZE,
-            iterator=True,
-            encoding=Results.ENCODING,
-        )
+        import pandas as pd
+        with self._lock:
+            if self.cache and self._load_cache():
+                return
+            try:
+                size = os.path.getsize(self.data_filename)
+            except OSError:
+                size = 0
+            # Large files are read in larger chunks, at least a few hundred kB each
+            chunksize = max(Results.CHUNK_SIZE, size // 1000)
+            with open(self.data_filename, "rb") as f:
+                chunks = pd.read_csv(
+                    f,
+                    comment=Results.COMMENT,
+                    chunksize=chunksize,
+                    iterator=True,
+                    encoding=Results.ENCODING,
+                )
+                frames = []
+                for chunk in chunks:
+                    frames.append(chunk)
+                    if progress is not None and size > 0:
+                        progress(100. * f.tell() / size)
+                try:
+                    self._data = pd.concat(frames, ignore_index=True)
+                except Exception:
+                    self._data = chunks.read()
+            if self.cache:
+                self._store_cache()
+
+    @property
+    def cache_filename(self):
+        """ Name of the file caching the parsed data """
+        return self.data_filename + ".cache.npz"
+
+    def _file_key(self):
+        stat = os.stat(self.data_filename)
+        return np.array([stat.st_mtime_ns, stat.st_size])
+
+    def _load_cache(self):
+        """ Reads the data from the cache file, returns False if it is missing or outdated """
+        import pandas as pd
+        try:
+            with np.load(self.cache_filename, allow_pickle=False) as cache:
+                if not np.array_equal(cache["key"], self._file_key()):
+                    return False
+                columns = cache["columns"].tolist()
+                self._data = pd.DataFrame(
+                    {column: cache[f"column{i}"] for i, column in enumerate(columns)},
+                    columns=columns,
+                )
+        except (OSError, KeyError, ValueError):
+            return False
+        log.debug("Read data of %s from cache", self.data_filename)
+        return True
+
+    def _store_cache(self):
+        """ Writes the numeric columns of the data to the cache file """
+        data = self._data
+        if not all(dtype.kind in "biuf" for dtype in data.dtypes):
+            return  # only plain arrays can be stored without pickling
+        arrays = {f"column{i}": data.iloc[:, i].to_numpy() for i in range(data.shape[1])}
+        temporary = self.cache_filename + ".tmp"
         try:
-            self._data = pd.concat(chunks, ignore_index=True)
-        except Exception:
-            self._data = chunks.read()
+            with open(temporary, "wb") as f:
+                np.savez(f, key=self._file_key(),
+                         columns=np.array([str(c) for c in data.columns]), **arrays)
+            os.replace(temporary, self.cache_filename)
+        except OSError:
+            log.warning("Could not write the data cache %s", self.cache_filename)
 
     def __repr__(self):
         return "<{}(filename='{}',procedure={},shape={})>".format(
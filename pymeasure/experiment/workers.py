@@ -33,7 +33,7 @@ import numpy as np
 
 from .listeners import Recorder
 from .procedure import Procedure
-from .results import Results
+from .results import DataBus, Results
 from ..thread import StoppableThread
 
 log = logging.getLogger(__name__)
@@ -52,11 +52,16 @@ class Worker(StoppableThread):
     """ Worker runs the procedure and emits information about
     the procedure and its status over a ZMQ TCP port. In a child
     thread, a Recorder is run to write the results to
+
+    The results are furthermore published via the :attr:`.Results.bus`, such
+    that consumers in the same process get them without reading the file.
     """
 
-    def __init__(self, results, log_queue=None, log_level=logging.INFO, port=None):
+    def __init__(self, results, log_queue=None, log_level=logging.INFO, port=None,
+                 bus_size=DataBus.SIZE):
         """ Constructs a Worker to perform the Procedure
-        defined in the file at the filepath
+        defined in the file at the filepath. The results are published to
+        a :class:`.DataBus` of `bus_size` rows, unless `bus_size` is None.
         """
         super().__init__()
 
@@ -66,6 +71,7 @@ class Worker(StoppableThread):
         self.results = results
         self.results.procedure.check_parameters()
         self.results.procedure.status = Procedure.QUEUED
+        self.bus = None if bus_size is None else self.results.open_bus(bus_size)
 
         self.recorder = None
         self.recorder_queue = Queue()
@@ -126,7 +132,11 @@ class Worker(StoppableThread):
             self.monitor_queue.put((topic, record))
 
     def handle_record(self, record: dict[str, Any]):
-        self.recorder.handle(record)
+        # Convert the record only once for the data file and the bus
+        values = self.results.formatter.values(record)
+        self.recorder.handle(values)
+        if self.bus is not None:
+            self.bus.publish(values)
 
     def handle_batch_record(self, record: Any):
         if self._is_dictionary_of_sequences(record):
@@ -188,6 +198,8 @@ class Worker(StoppableThread):
             self.emit('progress', 100.)
 
         self.recorder.stop()
+        if self.bus is not None:
+            self.bus.close()
         self.monitor_queue.put(None)
         if self.context is not None:
             # Cleanly close down ZMQ context and associated socket
@@ -22,6 +22,9 @@
 # THE SOFTWARE.
 #
 
-from .advantestR3767CG import AdvantestR3767CG
-from .advantestR624X import AdvantestR6245
-from .advantestR624X import AdvantestR6246
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "advantestR3767CG": ["AdvantestR3767CG"],
+    "advantestR624X": ["AdvantestR6245", "AdvantestR6246"],
+})
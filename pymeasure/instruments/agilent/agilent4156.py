@@ -385,7 +385,7 @@ class Agilent4156(SCPIUnknownMixin, Instrument):
         varlist = dlist + dvar
         return list(filter(None, varlist))
 
-    def get_data(self, path=None):
+    def get_data(self, path=None, binary=False):
         """
         Get the measurement data from the instrument after completion.
 
@@ -394,24 +394,32 @@ class Agilent4156(SCPIUnknownMixin, Instrument):
         getting valid data.
 
         :param path: Path for optional data export to CSV.
+        :param binary: Transfer the data in the binary :code:`REAL,64` format instead of ASCII,
+            which is faster for many data points.
         :returns: Pandas Dataframe
 
         .. code-block:: python
 
             df = instr.get_data(path='./datafolder/data1.csv')
         """
-        if int(self.ask('*OPC?')):
-            header = self.data_variables
-        self.write(":FORM:DATA ASC")
-        # recursively get data for each variable
+        # wait until the measurement is completed
+        self.ask('*OPC?')
+        header = self.data_variables
+        if binary:
+            self.write(":FORM:DATA REAL,64")
+            self.write(":FORM:BORD NORM")
+        else:
+            self.write(":FORM:DATA ASC")
+        data = None
         for i, listvar in enumerate(header):
-            data = self.values(f":DATA? \'{listvar}\'")
-            time.sleep(0.01)
-            if i == 0:
-                lastdata = data
+            if binary:
+                self.write(f":DATA? \'{listvar}\'")
+                values = np.frombuffer(self.read_ieee_block(), dtype=">f8")
             else:
-                data = np.column_stack((lastdata, data))
-                lastdata = data
+                values = self.values(f":DATA? \'{listvar}\'")
+            if data is None:
+                data = np.empty((len(values), len(header)))
+            data[:, i] = values
 
         df = pd.DataFrame(data=data, columns=header, index=None)
         if path is not None:
@@ -335,6 +335,7 @@ class AgilentB1500(SCPIMixin, Instrument):
             128: "End of data",
         }
         data_names_int = {"Sampling index"}  # convert to int instead of float
+        status_length = 1  # number of status characters in front of the channel
 
         def __init__(self, smu_names, output_format_str):
             """Store parameters of the chosen output format for later usage in data processing.
@@ -453,6 +454,42 @@ class AgilentB1500(SCPIMixin, Instrument):
                 self.check_status(status_string)
                 return channel
 
+        def format_table(self, elements):
+            """Format a table of measurement values at once.
+
+            The status of each channel is checked once for every distinct status string.
+
+            :param elements: 2D array of measurement value strings, one row per
+                measurement point and one column per channel
+            :return: Measurement data with "channel data name" column headers
+            :rtype: pd.DataFrame
+            """
+            elements = np.char.strip(np.asarray(elements, dtype=str))
+            if elements.ndim != 2:
+                raise ValueError("Measurement values have to be a 2D array.")
+            rows, columns = elements.shape
+            # view the strings as a character matrix to slice all elements at once
+            chars = elements.view("U1").reshape(rows, columns, -1)
+            n = self.status_length
+            statuses = np.ascontiguousarray(chars[:, :, :n]).view(f"U{n}")[:, :, 0]
+            values = np.ascontiguousarray(chars[:, :, n + 2:])
+            values = values.view(f"U{values.shape[2]}")[:, :, 0]
+            heads = []
+            data = {}
+            for column in range(columns):
+                channel_string = chars[0, column, n]
+                data_name = self.data_names[chars[0, column, n + 1]]
+                for status in np.unique(statuses[:, column]):
+                    channel = self.format_channel_check_status(status, channel_string)
+                heads.append(f"{channel} {data_name}")
+                if data_name in self.data_names_int:
+                    data[column] = values[:, column].astype(float).astype(np.int64)
+                else:
+                    data[column] = values[:, column].astype(float)
+            data = pd.DataFrame(data)
+            data.columns = heads
+            return data
+
     class _data_formatting_FMT1(_data_formatting_generic):
         """Data formatting for FMT1 format"""
 
@@ -487,6 +524,8 @@ class AgilentB1500(SCPIMixin, Instrument):
     class _data_formatting_FMT21(_data_formatting_generic):
         """Data formatting for FMT21 format"""
 
+        status_length = 3
+
         def __init__(self, smu_names={}):
             super().__init__(smu_names, "FMT21")
 
@@ -848,18 +887,9 @@ class AgilentB1500(SCPIMixin, Instrument):
         :rtype: pd.DataFrame
         """
         data = self.read()
-        data = data.split(",")
-        data = np.array(data)
-        data = np.split(data, number_of_points)
-        data = pd.DataFrame(data=data)
-        data = data.applymap(self._data_format.format_single)
-        heads = data.iloc[[0]].applymap(lambda x: " ".join(x[1:3]))
-        # channel & data_type
-        heads = heads.to_numpy().tolist()  # 2D List
-        heads = heads[0]  # first row
-        data = data.applymap(lambda x: x[3])
-        data.columns = heads
-        return data
+        data = np.array(data.split(","))
+        data = data.reshape(number_of_points, -1)
+        return self._data_format.format_table(data)
 
     def read_channels(self, nchannels):
         """Read data for 1 measurement point from the buffer for the specified number of channels.
@@ -878,6 +908,28 @@ class AgilentB1500(SCPIMixin, Instrument):
         data = tuple(data)
         return data
 
+    def stream_data(self, number_of_points, nchannels, block_size=100):
+        """Read the data from the buffer in blocks while the measurement is running.
+
+        Each block is parsed at once and yielded as a Pandas DataFrame with the same columns
+        as the one returned by :meth:`read_data`, such that the blocks can be processed or
+        stored while sampling continues.
+
+        :param int number_of_points: Number of measurement points
+        :param int nchannels: Number of channels which return data (includes measurement
+            channels and sweep sources, depending on data output settings)
+        :param int block_size: Maximum number of measurement points per block
+        :return: Generator of measurement data blocks
+        :rtype: Iterator[pd.DataFrame]
+        """
+        for start in range(0, number_of_points, block_size):
+            points = min(block_size, number_of_points - start)
+            data = self.read_bytes(self._data_format.size * nchannels * points)
+            data = data.decode("ASCII")
+            # ',' if more data in buffer, '\r' if last data point
+            data = np.array(data.rstrip("\r\n,").split(","))
+            yield self._data_format.format_table(data.reshape(points, nchannels))
+
     ######################################
     # Queries on all SMUs
     ######################################
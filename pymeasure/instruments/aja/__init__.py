@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .dcxs import DCXS
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "dcxs": ["DCXS"],
+})
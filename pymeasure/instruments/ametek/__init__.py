@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .ametek7270 import Ametek7270
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "ametek7270": ["Ametek7270"],
+})
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .ami430 import AMI430
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "ami430": ["AMI430"],
+})
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .apsin12G import APSIN12G
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "apsin12G": ["APSIN12G"],
+})
@@ -22,9 +22,14 @@
 # THE SOFTWARE.
 #
 
-from .anritsuMG3692C import AnritsuMG3692C
-from .anritsuMS9710C import AnritsuMS9710C
-from .anritsuMS9740A import AnritsuMS9740A
-from .anritsuMS2090A import AnritsuMS2090A
-from .anritsuMS464xB import AnritsuMS464xB, AnritsuMS4642B, AnritsuMS4644B, \
-    AnritsuMS4645B, AnritsuMS4647B
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "anritsuMG3692C": ["AnritsuMG3692C"],
+    "anritsuMS9710C": ["AnritsuMS9710C"],
+    "anritsuMS9740A": ["AnritsuMS9740A"],
+    "anritsuMS2090A": ["AnritsuMS2090A"],
+    "anritsuMS464xB": [
+        "AnritsuMS464xB", "AnritsuMS4642B", "AnritsuMS4644B", "AnritsuMS4645B", "AnritsuMS4647B",
+    ],
+})
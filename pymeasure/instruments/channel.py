@@ -88,6 +88,10 @@ class Channel(CommonBase):
         """
         return self.parent.read_bytes(count, **kwargs)
 
+    def _read_until_end(self):
+        """Read the rest of the message, even if it contains the termination character."""
+        return self.parent._read_until_end()
+
     def write_binary_values(self, command, values, *args, **kwargs):
         """Write binary values to the instrument.
 
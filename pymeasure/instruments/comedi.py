@@ -78,6 +78,19 @@ def writeAO(device, channel, voltage, range=None):
     ao.data_write(converter.from_physical(voltage))
 
 
+def _array_converter(converter):
+    """ Returns a function converting an array of raw values to physical values
+    with the calibration polynomial of a converter, or with the converter itself
+    if it does not provide the polynomial
+    """
+    try:
+        coefficients = np.asarray(converter.get_to_physical_coefficients(), dtype=np.float64)
+        origin = converter.get_to_physical_expansion_origin()
+    except AttributeError:
+        return lambda values: np.asarray(converter.to_physical(values))
+    return lambda values: np.polynomial.polynomial.polyval(values - origin, coefficients)
+
+
 class SynchronousAI:
 
     def __init__(self, channels, period, samples):
@@ -115,9 +128,15 @@ class SynchronousAI:
             if rc is None:
                 break
 
-    def measure(self, hasAborted=lambda: False):
+    def measure(self, hasAborted=lambda: False, block_size=1):
         """ Initiates the scan after first checking the command
         and does not block, returns the starting timestamp
+
+        The scans are read in blocks of up to `block_size` scans directly into
+        a preallocated buffer and converted at once. For each block, the progress
+        and the data are emitted: a single scan (1D array) if `block_size` is 1,
+        otherwise the block of scans (2D array with one column per channel).
+        Larger blocks reduce the overhead per scan for high sampling rates.
         """
         self._verifyCommand()
         sleep(0.01)
@@ -125,40 +144,42 @@ class SynchronousAI:
 
         length = len(self.channels)
         dtype = self.subdevice.get_dtype()
-        converters = [c.get_converter() for c in self.channels]
+        converters = [_array_converter(c.get_converter()) for c in self.channels]
 
         self.data = np.zeros((self.samples, length), dtype=np.float32)
+        raw = np.zeros((self.samples, length), dtype=dtype)
+        buffer = memoryview(raw).cast('B')
+        file = self.subdevice.device.file
 
         # Trigger AI
         self.subdevice.device.do_insn(inttrig_insn(self.subdevice))
 
         # Measurement loop
         count = 0
-        size = int(self.data.itemsize / 2) * length
-        previous_bin_slice = b''
+        received = 0  # bytes
+        size = raw.itemsize * length  # bytes per scan
 
         while not hasAborted() and self.samples > count:
-            bin_slice = previous_bin_slice
-            while len(bin_slice) < size:
-                bin_slice += self.subdevice.device.file.read(size)
-            previous_bin_slice = bin_slice[size:]
-            bin_slice = bin_slice[:size]
-            slice = np.fromstring(
-                bin_slice,
-                dtype=dtype,
-                count=length
-            )
-
-            if len(slice) != length:  # Reading finished
+            end = min(count + block_size, self.samples) * size
+            while received < end:
+                read = file.readinto(buffer[received:end])
+                if not read:  # Reading finished
+                    break
+                received += read
+            stop = received // size
+            if stop == count:  # Reading finished
                 break
 
             # Convert to physical values
-            for i, c in enumerate(converters):
-                self.data[count, i] = c.to_physical(slice[i])
+            for i, convert in enumerate(converters):
+                self.data[count:stop, i] = convert(raw[count:stop, i])
 
             self.emit_progress(100. * count / self.samples)
-            self.emit_data(self.data[count])
-            count += 1
+            if block_size == 1:
+                self.emit_data(self.data[count])
+            else:
+                self.emit_data(self.data[count:stop])
+            count = stop
 
         # Cancel measurement if it is still running (abort event)
         if self.subdevice.get_flags().running:
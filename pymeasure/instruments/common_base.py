@@ -92,6 +92,104 @@ class DynamicProperty(property):
         self.name = name
 
 
+class LazyChannels(dict):
+    """Collection of channels, which are created at their first access.
+
+    It behaves like the dictionary of a regular channel collection: the keys (channel ids) are
+    known from the start, but a channel is only instantiated when it is accessed, either via the
+    collection (e.g. :code:`inst.channels["A"]`, :code:`inst.channels.values()`) or via its
+    attribute (e.g. :code:`inst.ch_A`).
+    Create it with :code:`MultiChannelCreator(..., lazy=True)` in the class definition.
+
+    :param parent: The instance, which owns the collection.
+    :param name: Name of the collection attribute of the parent.
+    :param creator: The :class:`CommonBase.MultiChannelCreator` defining the channels.
+    """
+
+    # Placeholder for channels not yet created
+    _pending = object()
+
+    def __init__(self, parent, name, creator):
+        super().__init__((id, self._pending) for cls, id in creator.pairs)
+        self._parent = parent
+        self._name = name
+        self._classes = {id: cls for cls, id in creator.pairs}
+        self._kwargs = creator.kwargs
+
+    def _materialize(self, id):
+        """Create the channel with `id` and return it."""
+        child = self._parent.add_child(self._classes.pop(id), id, collection=self._name,
+                                       **self._kwargs)
+        child._protected = True
+        return child
+
+    def _materialize_all(self):
+        for id in self.pending_ids:
+            self._materialize(id)
+
+    @property
+    def pending_ids(self):
+        """Ids of the channels, which have not been created yet."""
+        return [id for id, child in super().items() if child is self._pending]
+
+    def __getitem__(self, id):
+        child = super().__getitem__(id)
+        if child is self._pending:
+            child = self._materialize(id)
+        return child
+
+    def __iter__(self):
+        # Overriding prevents `dict(collection)` from copying the placeholders.
+        return super().__iter__()
+
+    def __eq__(self, other):
+        self._materialize_all()
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        self._materialize_all()
+        return super().__repr__()
+
+    def get(self, id, default=None):
+        return self[id] if id in self else default
+
+    def values(self):
+        self._materialize_all()
+        return super().values()
+
+    def items(self):
+        self._materialize_all()
+        return super().items()
+
+    def pop(self, id, *args):
+        if id in self:
+            self[id]
+        return super().pop(id, *args)
+
+    def copy(self):
+        self._materialize_all()
+        return dict(super().items())
+
+
+class _LazyChannelAttribute:
+    """Attribute of a lazy channel, which creates the channel at the first access.
+
+    The created channel is stored in the instance's dictionary and shadows this attribute.
+    """
+
+    def __init__(self, collection, id):
+        self.collection = collection
+        self.id = id
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(obj, self.collection)[self.id]
+
+
 class CommonBase:
     """Base class for instruments and channels.
 
@@ -115,13 +213,16 @@ class CommonBase:
                          'map_values',
                          'set_process',
                          'command_process',
-                         'check_set_errors')
+                         'check_set_errors',
+                         'write_if_changed')
 
     # Prefix used to store reserved variables
     __reserved_prefix = "___"
 
     def __init__(self, **kwargs):
         self._special_names = self._setup_special_names()
+        # Last commands written by properties with `write_if_changed`
+        self._write_cache = {}
         self._create_channels()
         super().__init__(**kwargs)
 
@@ -198,11 +299,16 @@ class CommonBase:
         :param prefix: Collection prefix for the attributes, e.g. `"ch_"`
             creates attribute `self.ch_A`. If prefix evaluates False,
             the child will be added directly under the variable name. Required if id is tuple/list.
+        :param lazy: If True, a channel is created only when it is accessed for the first time,
+            either via the collection or via its attribute. The collection is a
+            :class:`~pymeasure.instruments.common_base.LazyChannels` instance.
+            Use it for instruments with many channels, of which usually only a few are used.
         :param \\**kwargs: Keyword arguments for all children.
         """
 
-        def __init__(self, cls, id=None, prefix="ch_", **kwargs):
+        def __init__(self, cls, id=None, prefix="ch_", lazy=False, **kwargs):
             super().__init__(cls=cls, **kwargs)
+            self.lazy = lazy
             if isinstance(id, (list, tuple)) and isinstance(cls, (list, tuple)):
                 assert (len(id) == len(cls)), "Lengths of cls and id do not match."
                 self.pairs = list(zip(cls, id))
@@ -211,6 +317,15 @@ class CommonBase:
             else:
                 raise ValueError("Invalid definition of classes '{cls}' and ids '{id}'.")
             self.kwargs.setdefault("prefix", prefix)
+            if lazy and not self.kwargs["prefix"]:
+                raise ValueError("Lazy channels require a prefix.")
+
+        def __set_name__(self, owner, name):
+            if not self.lazy:
+                return
+            prefix = self.kwargs["prefix"]
+            for cls, id in self.pairs:
+                setattr(owner, f"{prefix}{id}", _LazyChannelAttribute(name, id))
 
     def _setup_special_names(self):
         """ Return list of class/instance special names.
@@ -255,6 +370,9 @@ class CommonBase:
     def _create_channels(self):
         """Create channel interfaces for all the Instrument's channel pairs."""
         for name, creator in CommonBase.get_channels(self.__class__):
+            if isinstance(creator, CommonBase.MultiChannelCreator) and creator.lazy:
+                setattr(self, name, LazyChannels(self, name, creator))
+                continue
             for cls, id in creator.pairs:
                 # If channel pair was created with MultiChannelCreator
                 # add channel interface to collection with passed attribute name
@@ -354,6 +472,19 @@ class CommonBase:
             del collection[child.id]
         delattr(self, child._name)
 
+    def clear_write_cache(self):
+        """Forget the values written by properties with :code:`write_if_changed=True`.
+
+        The next assignment to such a property is sent to the device, even if the value did not
+        change. The caches of all children are cleared as well.
+        Call this method whenever the device state may have changed behind pymeasure's back,
+        e.g. after a reset.
+        """
+        self._write_cache.clear()
+        for child in vars(self).values():
+            if isinstance(child, CommonBase) and getattr(child, "parent", None) is self:
+                child.clear_write_cache()
+
     # Communication functions
     def wait_for(self, query_delay=None):
         """Wait for some time. Used by 'ask' to wait before reading.
@@ -420,6 +551,32 @@ class CommonBase:
         self.wait_for(query_delay)
         return self.read_binary_values(**kwargs)
 
+    def read_ieee_block(self, termination_bytes=1):
+        """ Read an IEEE 488.2 block and return its payload.
+
+        For a definite length block, the header is read first, such that exactly the announced
+        number of bytes is read afterwards, instead of reading until a timeout.
+        An indefinite length block (header ``#0``) is read until the end of the message.
+
+        :param termination_bytes: Number of bytes following the block (e.g. the termination
+            character), which are read and discarded.
+        :returns: Payload of the block as bytes.
+        :raises ConnectionError: If the reply is not a block.
+        """
+        start = self.read_bytes(2)
+        if start[:1] != b"#" or not start[1:2].isdigit():
+            raise ConnectionError(f"Expected a block, but got '{start}'.")
+        if start[1:2] == b"0":
+            # The binary payload may contain the termination character, only the end of the
+            # message ends the block.
+            payload = self._read_until_end()
+            return payload[:len(payload) - termination_bytes]
+        length = int(self.read_bytes(int(start[1:2])))
+        payload = self.read_bytes(length) if length else b""
+        if termination_bytes:
+            self.read_bytes(termination_bytes)
+        return payload
+
     # Property creators
     @staticmethod
     def control(  # noqa: C901 accept that this is a complex method
@@ -441,6 +598,7 @@ class CommonBase:
         maxsplit=-1,
         cast=float,
         values_kwargs=None,
+        write_if_changed=False,
         **kwargs
     ):
         """Return a property for the class based on the supplied
@@ -482,6 +640,10 @@ class CommonBase:
             -1 (default) indicates no limit.
         :param cast: A type to cast each element of the splitted string.
         :param dict values_kwargs: Further keyword arguments for :meth:`values`.
+        :param write_if_changed: If True, setting the property to the value it was last set to
+            does not send the command again. The last written value is forgotten by
+            :meth:`clear_write_cache` (e.g. called by :meth:`reset`) or if getting the property
+            returns a different value.
         :param \\**kwargs: Keyword arguments for :meth:`values`.
 
             .. deprecated:: 0.12
@@ -531,6 +693,26 @@ class CommonBase:
         else:
             warn("Do not use `command_process`, use a dynamic property instead.", FutureWarning)
 
+        # Identifies this property in the `_write_cache` of an instance
+        cache_key = object()
+
+        def format_command(value, set_command, values, map_values, set_process,
+                           command_process):
+            """Return the command, which sets the validated value."""
+            value = set_process(value)
+            if not map_values:
+                pass
+            elif isinstance(values, (list, tuple, range)):
+                value = values.index(value)
+            elif isinstance(values, dict):
+                value = values[value]
+            else:
+                raise ValueError(
+                    'Values of type `{}` are not allowed '
+                    'for CommonBase.control'.format(type(values))
+                )
+            return command_process(set_command) % value
+
         def fget(self,
                  get_command=get_command,
                  values=values,
@@ -562,22 +744,33 @@ class CommonBase:
             if len(vals) == 1:
                 value = get_process(vals[0])
                 if not map_values:
-                    return value
+                    pass
                 elif isinstance(values, (list, tuple, range)):
-                    return values[int(value)]
+                    value = values[int(value)]
                 elif isinstance(values, dict):
                     for k, v in values.items():
                         if v == value:
-                            return k
-                    raise KeyError(f"Value {value} not found in mapped values")
+                            value = k
+                            break
+                    else:
+                        raise KeyError(f"Value {value} not found in mapped values")
                 else:
                     raise ValueError(
                         'Values of type `{}` are not allowed '
                         'for Instrument.control'.format(type(values))
                     )
             else:
-                vals = get_process_list(vals)
-                return vals
+                value = get_process_list(vals)
+            if write_if_changed and cache_key in self._write_cache:
+                # The device changed the value since it was written last, do not trust the cache.
+                try:
+                    changed = self._write_cache[cache_key] != format_command(
+                        value, set_command, values, map_values, set_process, command_process)
+                except Exception:
+                    changed = True
+                if changed:
+                    del self._write_cache[cache_key]
+            return value
 
         def fset(self,
                  value,
@@ -588,37 +781,37 @@ class CommonBase:
                  set_process=set_process,
                  command_process=command_process,
                  check_set_errors=check_set_errors,
+                 write_if_changed=write_if_changed,
                  ):
 
             if set_command is None:
                 raise LookupError("Property can not be set.")
 
-            value = set_process(validator(value, values))
-            if not map_values:
-                pass
-            elif isinstance(values, (list, tuple, range)):
-                value = values.index(value)
-            elif isinstance(values, dict):
-                value = values[value]
-            else:
-                raise ValueError(
-                    'Values of type `{}` are not allowed '
-                    'for CommonBase.control'.format(type(values))
-                )
-            self.write(command_process(set_command) % value)
+            value = validator(value, values)
+            command = format_command(value, set_command, values, map_values, set_process,
+                                     command_process)
+            if write_if_changed:
+                if self._write_cache.get(cache_key) == command:
+                    log.debug(f"Skipping '{command}', the value is already set.")
+                    return
+                self._write_cache.pop(cache_key, None)
+            self.write(command)
+            errors = []
             if check_set_errors:
                 try:
                     error_list = self.check_set_errors()
                 except Exception as exc:
                     log.error("Exception raised while setting a property with the command "
-                              f"""'{command_process(set_command) % value}': '{str(exc)}'.""")
+                              f"""'{command}': '{str(exc)}'.""")
                     raise
                 errors = [str(error) for error in error_list]
                 if errors:
                     log.error(
                         "Error received after trying to set a property with the command "
-                        f"""'{command_process(set_command) % value}': '{"', '".join(errors)}'."""
+                        f"""'{command}': '{"', '".join(errors)}'."""
                     )
+            if write_if_changed and not errors:
+                self._write_cache[cache_key] = command
 
         # Add the specified document string to the getter
         fget.__doc__ = docs
@@ -721,6 +914,7 @@ class CommonBase:
         set_process=lambda v: v,
         check_set_errors=False,
         dynamic=False,
+        write_if_changed=False,
     ):
         """Return a property for the class based on the supplied
         commands. This property may be set, but raises an exception
@@ -739,6 +933,8 @@ class CommonBase:
         :param check_set_errors: Toggles checking errors after setting
         :param dynamic: Specify whether the property parameters are meant to be changed in
             instances or subclasses. See :meth:`control` for an usage example.
+        :param write_if_changed: If True, setting the property to the value it was last set to
+            does not send the command again. See :meth:`control` for details.
         """
 
         return CommonBase.control(get_command=None,
@@ -750,6 +946,7 @@ class CommonBase:
                                   set_process=set_process,
                                   check_set_errors=check_set_errors,
                                   dynamic=dynamic,
+                                  write_if_changed=write_if_changed,
                                   )
 
     def check_errors(self):
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .danfysik8500 import Danfysik8500
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "danfysik8500": ["Danfysik8500"],
+})
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .nxds import Nxds
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "nxds": ["Nxds"],
+})
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .fluke7341 import Fluke7341
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "fluke7341": ["Fluke7341"],
+})
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .fwbell5080 import FWBell5080
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "fwbell5080": ["FWBell5080"],
+})
@@ -84,6 +84,7 @@ class SCPIMixin:
     def reset(self):
         """Reset the instrument."""
         self.write("*RST")
+        self.clear_write_cache()
 
     def check_errors(self):
         """ Read all errors from the instrument.
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .ldp3811 import LDP3811
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "ldp3811": ["LDP3811"],
+})
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .sqm160 import SQM160
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "sqm160": ["SQM160"],
+})
@@ -26,6 +26,8 @@ import logging
 import time
 from warnings import warn
 
+from pyvisa.constants import StatusCode
+
 from .common_base import CommonBase
 from ..adapters.visa import VISAAdapter
 
@@ -175,6 +177,22 @@ class Instrument(CommonBase):
         """
         return self.adapter.read_bytes(count, **kwargs)
 
+    def _read_until_end(self):
+        """Read the rest of the message, even if it contains the termination character.
+
+        A VISA connection reads until the END indicator (e.g. GPIB EOI) with its termination
+        character disabled, other adapters read the whole read buffer.
+        """
+        if not isinstance(self.adapter, VISAAdapter):
+            return self.read_bytes(-1)
+        connection = self.adapter.connection
+        read_termination = connection.read_termination
+        connection.read_termination = ""
+        try:
+            return self.read_bytes(-1, break_on_termchar=True)
+        finally:
+            connection.read_termination = read_termination
+
     def write_binary_values(self, command, values, *args, **kwargs):
         """Write binary values to the device.
 
@@ -197,6 +215,56 @@ class Instrument(CommonBase):
         if query_delay:
             time.sleep(query_delay)
 
+    def wait_until(self, condition, timeout=60, should_stop=lambda: False,
+                   min_interval=1e-3, max_interval=0.1, use_srq=False):
+        """Block until the callable `condition` returns True.
+
+        The condition is checked with an interval, which starts at `min_interval` and doubles
+        after every check up to `max_interval`. Short waits are therefore answered quickly,
+        while long waits do not congest the bus.
+
+        If `use_srq` is True and the adapter supports :code:`wait_for_srq`, the instrument is
+        assumed to issue a service request once the condition is met (e.g. configured via
+        :code:`*SRE`). Instead of sleeping between two checks, the adapter waits for that service
+        request, such that the condition is checked right after the request arrives.
+        If service requests are not available for the connection, it falls back to polling.
+
+        :param condition: Callable returning True, once the wait is over.
+        :param timeout: Time in seconds after which a :code:`TimeoutError` is raised.
+            None waits indefinitely.
+        :param should_stop: Callable returning True, if the wait should be aborted.
+        :param min_interval: Initial interval in seconds between two checks.
+        :param max_interval: Maximum interval in seconds between two checks.
+        :param use_srq: Whether to wait for service requests between two checks.
+        :returns: True if the condition is met, False if the wait was aborted by `should_stop`.
+        :raises TimeoutError: If the condition is not met within `timeout`.
+        """
+        start = time.perf_counter()
+        interval = min_interval
+        srq = use_srq and hasattr(self.adapter, "wait_for_srq")
+        while not condition():
+            if should_stop():
+                return False
+            wait = interval
+            if timeout is not None:
+                remaining = start + timeout - time.perf_counter()
+                if remaining <= 0:
+                    raise TimeoutError(f"{self.name}: Condition not met within {timeout} s.")
+                wait = min(wait, remaining)
+            if srq:
+                try:
+                    self.adapter.wait_for_srq(timeout=wait)
+                except Exception as exc:
+                    if not (isinstance(exc, TimeoutError)
+                            or getattr(exc, "error_code", None) == StatusCode.error_timeout):
+                        log.debug(f"{self.name}: Service requests not available ({exc}), "
+                                  "polling instead.")
+                        srq = False
+            if not srq:
+                time.sleep(wait)
+            interval = min(2 * interval, max_interval)
+        return True
+
     # SCPI default methods
     def clear(self):
         """ Clears the instrument status byte
@@ -210,6 +278,7 @@ class Instrument(CommonBase):
         """ Resets the instrument. """
         if self.SCPI:
             self.write("*RST")
+            self.clear_write_cache()
         else:
             raise NotImplementedError("Non SCPI instruments require implementation in subclasses")
 
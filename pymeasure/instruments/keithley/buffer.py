@@ -23,9 +23,9 @@
 #
 
 import logging
-from time import sleep, time
 
 import numpy as np
+from numpy.lib.recfunctions import unstructured_to_structured
 
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import truncated_range
@@ -39,6 +39,11 @@ class KeithleyBuffer:
     """ Implements the basic buffering capability found in
     many Keithley instruments. """
 
+    #: Query for a part of the buffer, formatted with the 0-based index `start` of the first
+    #: reading, the number of readings `count`, and the 1-based indices `first` and `last` of the
+    #: first and last reading. None if the instrument does not support it.
+    buffer_range_query = None
+
     buffer_points = Instrument.control(
         ":TRAC:POIN?", ":TRAC:POIN %d",
         """ Control the number of buffer points. This does not represent actual points
@@ -76,19 +81,19 @@ class KeithleyBuffer:
         returns early if the :code:`should_stop` function returns True or
         the timeout is reached before the buffer is full.
 
+        The service request enabled by :meth:`config_buffer` is used, if the connection
+        supports it, otherwise the status byte is polled.
+
         :param should_stop: A function that returns True when this function should return early
         :param timeout: A time in seconds after which this function should return early
-        :param interval: A time in seconds for how often to check if the buffer is full
+        :param interval: The maximum time in seconds between two checks if the buffer is full
+        :raises TimeoutError: If the buffer is not full after `timeout`.
         """
-        # TODO: Use SRQ initially instead of constant polling
-        # self.adapter.wait_for_srq()
-        t = time()
-        while not self.is_buffer_full():
-            sleep(interval)
-            if should_stop():
-                return
-            if (time() - t) > timeout:
-                raise Exception("Timed out waiting for Keithley buffer to fill.")
+        try:
+            self.wait_until(self.is_buffer_full, timeout=timeout, should_stop=should_stop,
+                            max_interval=interval, use_srq=True)
+        except TimeoutError:
+            raise TimeoutError("Timed out waiting for Keithley buffer to fill.") from None
 
     @property
     def buffer_data(self):
@@ -96,6 +101,46 @@ class KeithleyBuffer:
         self.write(":FORM:DATA ASCII")
         return np.array(self.values(":TRAC:DATA?"), dtype=np.float64)
 
+    def read_buffer(self, start=0, count=None, elements=None, binary=True):
+        """ Read the buffer, or a part of it, as a numpy array.
+
+        The binary transfer uses the single precision :code:`SREAL` format, the data format
+        is set back to ASCII afterwards.
+
+        :param start: Index of the first reading to read, starting at 0.
+        :param count: Number of readings to read. If None, the whole buffer is read.
+            Reading a part of the buffer, for example of a buffer which is still filling,
+            requires :attr:`buffer_range_query`.
+        :param elements: List of names of the elements of each reading, in the order of the
+            instrument's :code:`:FORM:ELEM` setting, e.g. ``["voltage", "current", "time"]``.
+            For several elements, a structured array with one field per element is returned.
+        :param binary: Transfer the data in binary instead of ASCII format.
+        :return: Numpy array of the values, or structured array if several elements are given.
+        """
+        if count is None:
+            if start != 0:
+                raise ValueError("A count is required to read from a start index.")
+            command = ":TRAC:DATA?"
+        elif self.buffer_range_query is None:
+            raise NotImplementedError(f"{self.name} cannot read a part of the buffer.")
+        else:
+            command = self.buffer_range_query.format(start=start, count=count,
+                                                     first=start + 1, last=start + count)
+        if binary:
+            self.write(":FORM:DATA SREAL;:FORM:BORD NORM")
+            try:
+                self.write(command)
+                data = np.frombuffer(self.read_ieee_block(), dtype=">f4").astype(np.float32)
+            finally:
+                self.write(":FORM:DATA ASCII")
+        else:
+            self.write(":FORM:DATA ASCII")
+            data = np.array(self.values(command), dtype=np.float64)
+        if elements is not None and len(elements) > 1:
+            dtype = np.dtype([(name, data.dtype) for name in elements])
+            data = unstructured_to_structured(data.reshape(-1, len(elements)), dtype)
+        return data
+
     def start_buffer(self):
         """ Starts the buffer. """
         self.write(":INIT")
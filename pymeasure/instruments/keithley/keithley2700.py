@@ -99,6 +99,8 @@ class Keithley2700(KeithleyBuffer, SCPIMixin, Instrument):
 
     CLIST_VALUES = list(range(101, 300))
 
+    buffer_range_query = ":TRAC:DATA:SEL? {start},{count}"
+
     def __init__(self, adapter, name="Keithley 2700 MultiMeter/Switch System", **kwargs):
         super().__init__(
             adapter,
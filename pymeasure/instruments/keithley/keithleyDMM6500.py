@@ -215,7 +215,8 @@ class KeithleyDMM6500(SCPIMixin, Instrument):
         "voltage ratio",
     )
 
-    channels = Instrument.MultiChannelCreator(ScannerCard2000Channel, list(range(1, 11)))
+    channels = Instrument.MultiChannelCreator(ScannerCard2000Channel, list(range(1, 11)),
+                                              lazy=True)
 
     def __init__(
         self, adapter, name="Keithley DMM6500 6½-Digit Multimeter", read_termination="\n", **kwargs
@@ -22,10 +22,14 @@
 # THE SOFTWARE.
 #
 
-from .keysight81160A import Keysight81160A
-from .keysightDSOX1102G import KeysightDSOX1102G
-from .keysightE3631A import KeysightE3631A
-from .keysightE36312A import KeysightE36312A
-from .keysightN5767A import KeysightN5767A
-from .keysightN7776C import KeysightN7776C
-from .keysightPNA import KeysightPNA
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "keysight81160A": ["Keysight81160A"],
+    "keysightDSOX1102G": ["KeysightDSOX1102G"],
+    "keysightE3631A": ["KeysightE3631A"],
+    "keysightE36312A": ["KeysightE36312A"],
+    "keysightN5767A": ["KeysightN5767A"],
+    "keysightN7776C": ["KeysightN7776C"],
+    "keysightPNA": ["KeysightPNA"],
+})
@@ -484,7 +484,7 @@ class KeysightDSOX1102G(SCPIUnknownMixin, Instrument):
         img = self.binary_values(query, header_bytes=10, dtype=np.uint8)
         return bytearray(img)
 
-    def download_data(self, source, points=62500):
+    def download_data(self, source, points=62500, format_="ascii"):
         """ Get data from specified source of oscilloscope. Returned objects are a np.ndarray of
         data values (no temporal axis) and a dict of the waveform preamble, which can be used to
         build the corresponding time values for all data points.
@@ -496,18 +496,93 @@ class KeysightDSOX1102G(SCPIUnknownMixin, Instrument):
         :param points: integer number of points to acquire. Note that oscilloscope may return fewer
             points than specified, this is not an issue of this library. Can be 100, 250, 500, 1000,
             2000, 5000, 10000, 20000, 50000, or 62500.
+        :param format_: transfer format, "ascii", "word", or "byte". The binary formats are
+            transferred much faster and scaled with the waveform preamble, "byte" has a lower
+            vertical resolution.
 
         :return data_ndarray, waveform_preamble_dict: see waveform_preamble property for dict
             format.
         """
-        # TODO: Consider downloading from multiple sources at the same time.
         self.waveform_source = source
         self.waveform_points_mode = "normal"
         self.waveform_points = points
 
+        if format_ == "ascii":
+            preamble = self.waveform_preamble
+            data_bytes = self.waveform_data
+            return np.array(data_bytes), preamble
+        self._set_binary_format(format_)
         preamble = self.waveform_preamble
-        data_bytes = self.waveform_data
-        return np.array(data_bytes), preamble
+        data = self._read_waveform_block(preamble["format"])
+        return self._scale_waveform_data(data, preamble), preamble
+
+    def download_waveform(self, source, points=62500, format_="word"):
+        """ Get data and time values from specified source of oscilloscope.
+
+        :param source: measurement source, see :meth:`download_data`.
+        :param points: integer number of points to acquire, see :meth:`download_data`.
+        :param format_: transfer format, "ascii", "word", or "byte".
+
+        :return data_ndarray, time_ndarray, waveform_preamble_dict: see waveform_preamble
+            property for dict format.
+        """
+        data, preamble = self.download_data(source, points=points, format_=format_)
+        return data, self._waveform_time(len(data), preamble), preamble
+
+    def download_waveforms(self, sources, points=62500, format_="word"):
+        """ Get data and time values from several sources of oscilloscope in one call.
+
+        The number of points and the format are set only once for all sources.
+
+        :param sources: list of measurement sources, see :meth:`download_data`.
+        :param points: integer number of points to acquire, see :meth:`download_data`.
+        :param format_: transfer format, "ascii", "word", or "byte".
+
+        :return: dict with the source as key and a tuple (data_ndarray, time_ndarray,
+            waveform_preamble_dict) as value.
+        """
+        self.waveform_points_mode = "normal"
+        self.waveform_points = points
+        if format_ != "ascii":
+            self._set_binary_format(format_)
+        waveforms = {}
+        for source in sources:
+            self.waveform_source = source
+            preamble = self.waveform_preamble
+            if format_ == "ascii":
+                data = np.array(self.waveform_data)
+            else:
+                data = self._scale_waveform_data(
+                    self._read_waveform_block(preamble["format"]), preamble)
+            waveforms[source] = data, self._waveform_time(len(data), preamble), preamble
+        return waveforms
+
+    def _set_binary_format(self, format_):
+        """ Set the binary waveform format together with the byte order and sign, which
+        :meth:`_read_waveform_block` relies on. """
+        self.waveform_format = format_
+        self.write(":waveform:byteorder MSBF;:waveform:unsigned 1")
+
+    def _read_waveform_block(self, format_):
+        """ Read the waveform data in the binary "BYTE" or "WORD" format.
+
+        Data points are unsigned integers, words are transmitted in big endian.
+        """
+        dtype = {"BYTE": np.uint8, "WORD": ">u2"}[format_.upper()]
+        self.write(":waveform:data?")
+        return np.frombuffer(self.read_ieee_block(), dtype=dtype)
+
+    @staticmethod
+    def _scale_waveform_data(data, preamble):
+        """ Convert the raw binary data to values with the waveform preamble. """
+        return (data - float(preamble["yreference"])) * preamble["yincrement"] \
+            + preamble["yorigin"]
+
+    @staticmethod
+    def _waveform_time(points, preamble):
+        """ Calculate the time values of the data points with the waveform preamble. """
+        return (np.arange(points) - float(preamble["xreference"])) * preamble["xincrement"] \
+            + preamble["xorigin"]
 
     def _timebase(self):
         """
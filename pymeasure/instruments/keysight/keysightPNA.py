@@ -22,11 +22,34 @@
 # THE SOFTWARE.
 #
 
+import sys
+
 import numpy as np
 
 from pymeasure.instruments import Channel, Instrument, SCPIMixin
 from pymeasure.instruments.validators import strict_discrete_set
 
+# Queries of the trace data with the binary data format suited best for them
+TRACE_QUERIES = {"x": ("CALC{ch}:MEAS{tr}:X?", "real64"),
+                 "formatted": ("CALC{ch}:MEAS{tr}:DATA:FDATA?", "real32"),  # access point 2
+                 "complex": ("CALC{ch}:MEAS{tr}:DATA:SDATA?", "real32"),  # access point 1
+                 }
+
+
+def _binary_format(data_format):
+    """Get the commands selecting a binary data format with the byte order of this computer.
+
+    :param str data_format: ``real32`` or ``real64``.
+    :return: Tuple of the format commands and the numpy dtype of the transferred values.
+    """
+    if data_format not in ("real32", "real64"):
+        raise ValueError(f"Invalid binary data format '{data_format}'.")
+    swapped = sys.byteorder == "little"
+    command = "FORM {};:FORM:BORD {}".format("REAL,32" if data_format == "real32" else "REAL,64",
+                                             "SWAP" if swapped else "NORM")
+    dtype = np.dtype(("<" if swapped else ">") + ("f4" if data_format == "real32" else "f8"))
+    return command, dtype
+
 
 class Marker(Channel):
     """A class representing a marker on a measurement trace."""
@@ -71,15 +94,18 @@ class Marker(Channel):
 class Trace(Channel):
     """A class representing a Keysight PNA measurement trace."""
 
-    markers = Instrument.MultiChannelCreator(Marker, list(range(1, 16)), prefix="mkr_")
+    markers = Instrument.MultiChannelCreator(Marker, list(range(1, 16)), prefix="mkr_", lazy=True)
 
     placeholder = "tr"
 
-    def read_buffer(self, data_format="ascii"):
+    def read_buffer(self, data_format="ascii", byte_order_swapped=True):
         """
         Read the data buffer of the PNA.
 
         :param data_format: str, strictly ``ascii``, ``real32`` or ``real64``
+        :param bool byte_order_swapped: Whether the binary data is sent in swapped
+            (little endian) byte order, see
+            :attr:`~pymeasure.instruments.keysight.KeysightPNA.byte_order_swapped`.
         :return: ndarray
         """
 
@@ -87,21 +113,32 @@ class Trace(Channel):
             got = np.array(self.read().split(","))
             return got
         else:  # 'real32' and 'real64' format
-            got = self.read_bytes(1)
-            expected = b"#"
-            if got != expected:
-                raise ConnectionError(f"Expected '{expected}', but got '{got}'")
-
-            number_of_digits = int(self.read_bytes(1))
-            buffer_length = int(self.read_bytes(number_of_digits))
-            buffer = self.read_bytes(buffer_length)
-            self.read_bytes(1)  # read the termination byte
+            dtype = "<" if byte_order_swapped else ">"
+            dtype += "f4" if data_format == "real32" else "f8"
+            return np.frombuffer(self.read_ieee_block(), dtype=dtype)
 
-            data_type = np.float64
-            if data_format == "real32":
-                data_type = np.float32
-
-            return np.frombuffer(buffer, dtype=data_type)
+    def _query_buffer(self, command):
+        """Query the data buffer in the data format and byte order set in the instrument."""
+        data_format = self.parent.parent.data_format
+        byte_order_swapped = data_format == "ascii" or self.parent.parent.byte_order_swapped
+        self.write(command)
+        return self.read_buffer(data_format, byte_order_swapped)
+
+    def read_data(self, data="complex", data_format=None):
+        """Read the data of the trace with a binary transfer.
+
+        The data format and the byte order of this computer are selected together with the data
+        query and the reply is read in one block directly into a float or complex ndarray.
+        Afterwards, :attr:`~pymeasure.instruments.keysight.KeysightPNA.data_format` and
+        :attr:`~pymeasure.instruments.keysight.KeysightPNA.byte_order_swapped` keep these values.
+
+        :param str data: ``x`` for the X data, ``formatted`` for the Y data in the displayed format
+            (access point 2) or ``complex`` for the complex, unformatted data (access point 1).
+        :param data_format: ``real32`` or ``real64``. Defaults to ``real64`` for the X data
+            and ``real32`` for the Y data, which keeps the full precision of the PNA.
+        :return: ndarray of float or complex values
+        """
+        return self.parent.read_traces(data, traces=[self.id], data_format=data_format)[self.id]
 
     parameter = Channel.measurement(
         "CALC{{ch}}:MEAS{tr}:PAR?",
@@ -117,9 +154,7 @@ class Trace(Channel):
         The data type of the array elements is equal to the currently set
         :attr:`~pymeasure.instruments.keysight.KeysightPNA.data_format`.
         """
-        data_format = self.parent.parent.data_format
-        self.write("CALC{{ch}}:MEAS{tr}:X?")
-        return self.read_buffer(data_format)
+        return self._query_buffer("CALC{{ch}}:MEAS{tr}:X?")
 
     x_unit = Channel.measurement(
         "CALC{{ch}}:MEAS{tr}:X:AXIS:UNIT?",
@@ -138,9 +173,7 @@ class Trace(Channel):
         The method returns the data from access point 2.
         Please check PNA help for further information about the data access map.
         """
-        data_format = self.parent.parent.data_format
-        self.write("CALC{{ch}}:MEAS{tr}:DATA:FDATA?")  # data access point 2
-        return self.read_buffer(data_format)
+        return self._query_buffer("CALC{{ch}}:MEAS{tr}:DATA:FDATA?")  # data access point 2
 
     @property
     def y_data_complex(self):
@@ -151,9 +184,7 @@ class Trace(Channel):
         The method returns the data from access point 1.
         Please check PNA help for further information about the data access map.
         """
-        data_format = self.parent.parent.data_format
-        self.write("CALC{{ch}}:MEAS{tr}:DATA:SDATA?")  # data access point 1
-        got = self.read_buffer(data_format)
+        got = self._query_buffer("CALC{{ch}}:MEAS{tr}:DATA:SDATA?")  # data access point 1
         return np.reshape(got, (-1, 2))
 
     y_unit = Channel.measurement(
@@ -221,6 +252,28 @@ class MeasurementChannel(Channel):
                            prefix="tr_",
                            )
 
+    def read_traces(self, data="complex", traces=None, data_format=None):
+        """Read the data of several traces of the channel in one transaction.
+
+        The queries of all traces are combined in a single command and the binary reply
+        is read at once, see :meth:`Trace.read_data`.
+
+        :param str data: ``x``, ``formatted`` or ``complex``.
+        :param traces: List of trace numbers, defaults to all traces of the channel.
+        :param data_format: ``real32`` or ``real64``, defaults to the best suited format.
+        :return: dict of trace number and ndarray
+        """
+        if data not in TRACE_QUERIES:
+            raise ValueError(f"Invalid data '{data}', use one of {list(TRACE_QUERIES)}.")
+        query, default_format = TRACE_QUERIES[data]
+        traces = list(self.traces) if traces is None else list(traces)
+        command, dtype = _binary_format(data_format or default_format)
+        if data == "complex":
+            dtype = np.dtype(f"{dtype.byteorder}c{2 * dtype.itemsize}")
+        self.write(";:".join([command] + [query.format(ch="{ch}", tr=trace) for trace in traces]))
+        # Each block is followed by the ";" separator or the termination character
+        return {trace: np.frombuffer(self.read_ieee_block(), dtype=dtype) for trace in traces}
+
     number_of_points = Channel.measurement(
         "SENS{ch}:SWE:POIN?",
         """Get the number of points of the channel (int).""",
@@ -257,6 +310,8 @@ class KeysightPNA(SCPIMixin, Instrument):
         x_data = pna.ch_1.tr_1.x_data  # get the X data of trace 1 in channel 1
         y_data = pna.ch_2.tr_5.y_data  # get the Y data of trace 5 in channel 2
         y_complex = pna.ch_2.tr_5.y_data_complex  # get the complex Y data of trace 5 in channel 2
+        s_data = pna.ch_2.tr_5.read_data("complex")  # get complex ndarray in binary format
+        all_s_data = pna.ch_2.read_traces("complex")  # dict with the data of all traces
         pna.ch_1.tr_1.mkr_1.enabled = True  # Activate marker 1 on trace 1 in channel 1
         pna.ch_1.tr_1.mkr_1.x = 123e6  # Set marker 1 to 123 MHz
         mkr_y = pna.ch_1.tr_1.mkr_1.y  # Read the marker 1 y data
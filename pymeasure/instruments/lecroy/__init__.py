@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .lecroyT3DSO1204 import LeCroyT3DSO1204
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "lecroyT3DSO1204": ["LeCroyT3DSO1204"],
+})
@@ -22,6 +22,10 @@
 # THE SOFTWARE.
 #
 
-from .mksinst import MKSInstrument
-from .mks937b import MKS937B
-from .mks974b import MKS974B
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "mksinst": ["MKSInstrument"],
+    "mks937b": ["MKS937B"],
+    "mks974b": ["MKS974B"],
+})
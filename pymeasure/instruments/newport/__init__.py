@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .esp300 import ESP300
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "esp300": ["ESP300"],
+})
@@ -23,7 +23,6 @@
 #
 
 import logging
-from time import sleep
 from warnings import warn
 
 from pymeasure.instruments import Instrument, SCPIUnknownMixin
@@ -144,9 +143,8 @@ class CNT91(SCPIUnknownMixin, Instrument):
         :return: Frequency values from the buffer.
         """
         n = truncated_range(n, [MIN_BUFFER_SIZE, MAX_BUFFER_SIZE])  # Programmer's guide 8-39
-        while not self.complete:
-            # Wait until the buffer is filled.
-            sleep(0.01)
+        # Wait until the buffer is filled.
+        self.wait_until(lambda: self.complete, timeout=None, max_interval=0.01)
         return self.values(f":FETC:ARR? {'MAX' if n == MAX_BUFFER_SIZE else n}")
 
     def configure_frequency_array_measurement(self, n_samples, channel, back_to_back=True):
@@ -1 +1,5 @@
-from .PM6669 import PM6669
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "PM6669": ["PM6669"],
+})
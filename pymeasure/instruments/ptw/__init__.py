@@ -22,5 +22,9 @@
 # THE SOFTWARE.
 #
 
-from .ptwDIAMENTOR import ptwDIAMENTOR
-from .ptwUNIDOS import ptwUNIDOS
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "ptwDIAMENTOR": ["ptwDIAMENTOR"],
+    "ptwUNIDOS": ["ptwUNIDOS"],
+})
@@ -1 +1,5 @@
-from .redpitaya_scpi import RedPitayaScpi
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "redpitaya_scpi": ["RedPitayaScpi"],
+})
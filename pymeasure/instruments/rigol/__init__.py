@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .rigol_dg800 import DG800
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "rigol_dg800": ["DG800"],
+})
@@ -22,6 +22,11 @@
 # THE SOFTWARE.
 #
 
-from .fsseries import FSL, FSW
-from .hmp import HMP4040
-from .sfm import SFM
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "fsseries": ["FSL", "FSW"],
+    "hmp": ["HMP4040"],
+    "sfm": ["SFM"],
+    "fsl": [],
+})
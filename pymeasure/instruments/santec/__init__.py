@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .tsl570 import TSL570
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "tsl570": ["TSL570"],
+})
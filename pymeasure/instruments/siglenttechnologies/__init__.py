@@ -22,7 +22,12 @@
 # THE SOFTWARE.
 #
 
-from .siglent_spd1168x import SPD1168X
-from .siglent_spd1305x import SPD1305X
-from .siglent_sds1072cml import SDS1072CML
-from .siglent_sds1000xhd import SDS1000XHD
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "siglent_spd1168x": ["SPD1168X"],
+    "siglent_spd1305x": ["SPD1305X"],
+    "siglent_sds1072cml": ["SDS1072CML"],
+    "siglent_sds1000xhd": ["SDS1000XHD"],
+    "siglent_spdbase": [],
+})
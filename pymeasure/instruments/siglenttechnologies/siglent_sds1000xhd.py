@@ -24,6 +24,9 @@
 
 import struct
 import math
+
+import numpy as np
+
 from pymeasure.instruments import Channel, Instrument
 from pymeasure.instruments.generic_types import SCPIMixin
 from pymeasure.instruments.validators import (
@@ -278,15 +281,19 @@ class WaveformChannel(Channel):
         raw_data = self.read_bytes(-1)
         return self._parse_preamble_descriptor(raw_data)
 
-    def get_data(self):
+    def get_data(self, as_array=False, dtype=np.float64):
         """Get the waveform data from the oscilloscope for the current source.
 
         This method retrieves waveform data from the oscilloscope using the preamble
         property to get descriptor information about the waveform format.
+        The slices are read into a preallocated buffer and scaled with NumPy.
 
+        :param bool as_array: Return NumPy arrays instead of lists.
+        :param dtype: NumPy data type of the returned arrays, for example ``np.float32``
+            to halve the memory of deep-memory captures. Only used if `as_array` is True.
         :return: A tuple containing (time_values, volt_values) where:
-            - time_values: List of time values in seconds
-            - volt_values: List of voltage values in volts
+            - time_values: List (or array) of time values in seconds
+            - volt_values: List (or array) of voltage values in volts
         :rtype: tuple
         """
         # Constants - same as reference script
@@ -307,7 +314,7 @@ class WaveformChannel(Channel):
 
         # Get the waveform points and confirm the number of waveform slice reads
         points = self.parent.acquisition.points
-        one_piece_num = self.max_point
+        one_piece_num = int(self.max_point)
         read_times = math.ceil(points / one_piece_num)
 
         # Set the number of read points per slice, if the waveform points is
@@ -315,51 +322,45 @@ class WaveformChannel(Channel):
         if points > one_piece_num:
             self.point = one_piece_num
 
-        # Choose the format of the data returned
+        # Choose the format of the data returned, signed little endian integers
         self.width = "BYTE"
+        data_type = np.dtype(np.int8)
         if adc_bit > 8:
             self.width = "WORD"
+            data_type = np.dtype("<i2")
 
-        # Get the waveform data for each slice
-        recv_byte = b''
+        # Get the waveform data for each slice into a preallocated buffer, which grows only
+        # if the instrument sends more data than expected
+        recv_byte = bytearray(points * data_type.itemsize)
+        received = 0
         for i in range(0, read_times):
             start = i * one_piece_num
             # Set the starting point of each slice
             self.start_point = start
             # Get the waveform data of each slice
             self.write("WAV:DATA?")
-            recv_rtn = self.read_bytes(-1, break_on_termchar=True).rstrip()
+            recv_rtn = self.read_bytes(-1, break_on_termchar=True)
             # Splice each waveform data based on data block information
             block_start = recv_rtn.find(b'#')
             data_digit = int(recv_rtn[block_start + 1:block_start + 2])
             data_start = block_start + 2 + data_digit
-            recv_byte += recv_rtn[data_start:]
+            data_length = int(recv_rtn[block_start + 2:data_start])
+            payload = memoryview(recv_rtn)[data_start:data_start + data_length]
+            recv_byte[received:received + len(payload)] = payload
+            received += len(payload)
 
-        # Unpack signed byte data
-        if adc_bit > 8:
-            # Calculate actual length of data received and adjust points if needed
-            actual_points = len(recv_byte) // 2  # 2 bytes per point for WORD format
-            if actual_points * 2 != len(recv_byte):
-                # Truncate buffer to ensure it's exactly divisible by 2
-                truncated_bytes = len(recv_byte) - (len(recv_byte) % 2)
-                recv_byte = recv_byte[:truncated_bytes]
-                actual_points = len(recv_byte) // 2
-
-            convert_data = struct.unpack("%dh" % actual_points, recv_byte)
-        else:
-            # Calculate actual length of data received and adjust points if needed
-            actual_points = len(recv_byte)  # 1 byte per point for BYTE format
-            convert_data = struct.unpack("%db" % actual_points, recv_byte)
+        # Unpack signed data, ignoring an incomplete last point
+        convert_data = np.frombuffer(recv_byte, dtype=data_type,
+                                     count=received // data_type.itemsize)
 
         # Calculate the voltage value and time value
-        time_value = []
-        volt_value = []
-        for idx in range(0, len(convert_data)):
-            volt_value.append(convert_data[idx] / vcode_per * float(vdiv) - float(offset))
-            time_data = -(float(tdiv) * HORI_NUM / 2) + idx * interval + float(trdl)
-            time_value.append(time_data)
-
-        return time_value, volt_value
+        volt_value = convert_data / vcode_per * float(vdiv) - float(offset)
+        time_value = np.arange(len(convert_data)) * interval
+        time_value = -(float(tdiv) * HORI_NUM / 2) + time_value + float(trdl)
+
+        if as_array:
+            return time_value.astype(dtype, copy=False), volt_value.astype(dtype, copy=False)
+        return time_value.tolist(), volt_value.tolist()
 
 
 class AdvancedMeasurementItem(Channel):
@@ -22,5 +22,10 @@
 # THE SOFTWARE.
 #
 
-from .dsp7265 import DSP7265
-from .dsp7225 import DSP7225
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "dsp7265": ["DSP7265"],
+    "dsp7225": ["DSP7225"],
+    "dsp_base": [],
+})
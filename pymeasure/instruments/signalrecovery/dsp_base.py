@@ -27,7 +27,6 @@
 # =============================================================================
 
 import logging
-from time import sleep, time
 import numpy as np
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import modular_range_bidirectional
@@ -539,15 +538,18 @@ class DSPBase(Instrument):
 
     def wait_for_buffer(self, timeout=None, delay=0.1):
         """ Method that waits until the curve buffer is filled
+
+        :param timeout: A time in seconds after which the waiting stops, None waits indefinitely.
+        :param delay: The maximum time in seconds between two checks of the buffer status.
         """
-        start = time()
-        while self.curve_buffer_status[0] == 1:
-            sleep(delay)
-            if timeout is not None and time() < start + timeout:
-                break
+        try:
+            self.wait_until(lambda: self.curve_buffer_status[0] != 1, timeout=timeout,
+                            max_interval=delay)
+        except TimeoutError:
+            pass
 
     def get_buffer(self, quantity=None,
-                   convert_to_float=True, wait_for_buffer=True):
+                   convert_to_float=True, wait_for_buffer=True, transfer="point"):
         """Retrieves the buffer after it has been filled. The data retrieved
         from the lock-in is in a fixed-point format, which requires translation
         before it can be interpreted as meaningful data. When
@@ -578,6 +580,17 @@ class DSPBase(Instrument):
             finished. If True, the method waits until the buffer is filled
             before continuing; if False, the method raises an exception if the
             acquisition is not finished when the method is called.
+
+        :param str transfer:
+            Determines how the data is transferred from the lock-in:
+
+            - ``"point"``: each point of each quantity is read as a separate
+              ASCII message (DC command), synchronized via the status byte.
+              This is the slowest mode.
+            - ``"table"``: all quantities are dumped at once in ASCII table
+              format (DCT command), one line per point.
+            - ``"binary"``: each quantity is dumped as binary 16 bit integers
+              (DCB command), which is the fastest mode.
         """
 
         # Check if buffer is finished
@@ -603,6 +616,26 @@ class DSPBase(Instrument):
                                    )))
 
         # Retrieve the data
+        if transfer == "table":
+            data = self._get_buffer_table(quantity_enums)
+        elif transfer == "binary":
+            data = self._get_buffer_binary(quantity_enums)
+        elif transfer == "point":
+            data = self._get_buffer_points(quantity_enums)
+        else:
+            raise ValueError(f"Invalid transfer mode '{transfer}', use 'point', 'table', "
+                             "or 'binary'.")
+
+        if convert_to_float:
+            data = self.buffer_to_float(data)
+
+        if quantity is not None:
+            data = data[quantity]
+
+        return data
+
+    def _get_buffer_points(self, quantity_enums):
+        """Read the curve buffer point by point, see :meth:`get_buffer`."""
         data = {}
         for enum in quantity_enums:
             self.write("DC %d" % enum)
@@ -621,13 +654,33 @@ class DSPBase(Instrument):
                     q_data.append(int(self.read().strip()))
 
             data[self.CURVE_BITS[enum]] = np.array(q_data)
+        return data
 
-        if convert_to_float:
-            data = self.buffer_to_float(data)
-
-        if quantity is not None:
-            data = data[quantity]
-
+    def _get_buffer_table(self, quantity_enums):
+        """Dump the curve buffer in ASCII table format, see :meth:`get_buffer`."""
+        points = self.curve_buffer_status[3]
+        if points == 0:
+            table = np.empty((0, len(quantity_enums)), dtype=np.int64)
+            return {self.CURVE_BITS[enum]: table[:, i] for i, enum in enumerate(quantity_enums)}
+        self.write("DCT %d" % sum(2 ** enum for enum in quantity_enums))
+        lines = [self.read().strip() for _ in range(points)]
+        table = np.array(",".join(lines).split(","), dtype=np.int64).reshape(points, -1)
+        if table.shape[1] != len(quantity_enums):
+            raise ValueError(f"Received {table.shape[1]} columns for "
+                             f"{len(quantity_enums)} quantities.")
+        return {self.CURVE_BITS[enum]: table[:, i] for i, enum in enumerate(quantity_enums)}
+
+    def _get_buffer_binary(self, quantity_enums):
+        """Dump the curve buffer in binary format, see :meth:`get_buffer`.
+
+        Each point is transferred as a signed 16 bit integer, most significant byte first.
+        """
+        points = self.curve_buffer_status[3]
+        data = {}
+        for enum in quantity_enums:
+            self.write("DCB %d" % enum)
+            raw = self.read_bytes(2 * points)
+            data[self.CURVE_BITS[enum]] = np.frombuffer(raw, dtype=">i2").astype(np.int64)
         return data
 
     def buffer_to_float(self, buffer_data, sensitivity=None,
@@ -691,13 +744,12 @@ class DSPBase(Instrument):
         # Sensitivity (for both single and dual modes)
         for key in ["sensitivity", "sensitivity2"]:
             if key in buffer_data:
-                data[key] = np.array([
-                    self.SENSITIVITIES[v % 32] * self.SEN_MULTIPLIER[v // 32]
-                    for v in buffer_data[key]
-                ])
+                values = np.asarray(buffer_data[key], dtype=np.int64)
+                data[key] = (np.asarray(self.SENSITIVITIES)[values % 32]
+                             * np.asarray(self.SEN_MULTIPLIER)[values // 32])
         # Try to set sensitivity values from arg or data
-        sensitivity = sensitivity or data.get('sensitivity', None)
-        sensitivity2 = sensitivity2 or data.get('sensitivity2', None)
+        sensitivity = data.get('sensitivity', None) if sensitivity is None else sensitivity
+        sensitivity2 = data.get('sensitivity2', None) if sensitivity2 is None else sensitivity2
 
         if any(["x" in buffer_data,
                 "y" in buffer_data,
@@ -716,10 +768,9 @@ class DSPBase(Instrument):
         # frequency data from frequency part 1 and 2
         if "frequency part 1" in buffer_data or "frequency part 2" in buffer_data:
             if "frequency part 1" in buffer_data and "frequency part 2" in buffer_data:
-                data["frequency"] = np.array([
-                    int(format(v2, "016b") + format(v1, "016b"), 2) / 1000 for
-                    v1, v2 in zip(buffer_data["frequency part 1"], buffer_data["frequency part 2"])
-                ])
+                part1 = np.asarray(buffer_data["frequency part 1"], dtype=np.int64) & 0xFFFF
+                part2 = np.asarray(buffer_data["frequency part 2"], dtype=np.int64) & 0xFFFF
+                data["frequency"] = ((part2 << 16) | part1) / 1000
             else:
                 maybe_raise("Can calculate the frequency only when both"
                             "frequency part 1 and 2 are provided.")
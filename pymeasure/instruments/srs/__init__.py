@@ -22,9 +22,13 @@
 # THE SOFTWARE.
 #
 
-from .ldc500series import LDC500Series
-from .sr830 import SR830
-from .sg380 import SG380
-from .sr860 import SR860
-from .sr570 import SR570
-from .sr510 import SR510
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "ldc500series": ["LDC500Series"],
+    "sr830": ["SR830"],
+    "sg380": ["SG380"],
+    "sr860": ["SR860"],
+    "sr570": ["SR570"],
+    "sr510": ["SR510"],
+})
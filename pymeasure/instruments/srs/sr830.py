@@ -507,24 +507,19 @@ class SR830(Instrument):
         """ Fill two numpy arrays with the content of the instrument buffer
 
         Eventually waiting until the specified number of recording is done
+
+        :param count: Number of points to record.
+        :param has_aborted: A function that returns True when the recording should stop early.
+        :param delay: Minimum time in seconds between two checks of the buffer count.
         """
         ch1 = np.empty(count, np.float32)
         ch2 = np.empty(count, np.float32)
-        currentCount = self.buffer_count
         index = 0
-        while currentCount < count:
-            if currentCount > index:
-                ch1[index:currentCount] = self.get_buffer(1, index, currentCount)
-                ch2[index:currentCount] = self.get_buffer(2, index, currentCount)
-                index = currentCount
-                time.sleep(delay)
-            currentCount = self.buffer_count
-            if has_aborted():
-                self.pause_buffer()
-                return ch1, ch2
-        self.pause_buffer()
-        ch1[index: count + 1] = self.get_buffer(1, index, count)  # noqa: E203
-        ch2[index: count + 1] = self.get_buffer(2, index, count)  # noqa: E203
+        for chunk1, chunk2 in self.stream_buffer(count, has_aborted=has_aborted,
+                                                 min_interval=delay):
+            ch1[index:index + len(chunk1)] = chunk1
+            ch2[index:index + len(chunk2)] = chunk2
+            index += len(chunk1)
         return ch1, ch2
 
     def buffer_measure(self, count, stopRequest=None, delay=1e-3):
@@ -534,25 +529,81 @@ class SR830(Instrument):
         Return the mean and std from both channels
         """
         self.write("FAST2;STRD")
-        ch1 = np.empty(count, np.float64)
-        ch2 = np.empty(count, np.float64)
-        currentCount = self.buffer_count
-        index = 0
-        while currentCount < count:
-            if currentCount > index:
-                ch1[index:currentCount] = self.get_buffer(1, index, currentCount)
-                ch2[index:currentCount] = self.get_buffer(2, index, currentCount)
-                index = currentCount
-                time.sleep(delay)
-            currentCount = self.buffer_count
-            if stopRequest is not None and stopRequest.isSet():
-                self.pause_buffer()
-                return (0, 0, 0, 0)
-        self.pause_buffer()
-        ch1[index:count] = self.get_buffer(1, index, count)
-        ch2[index:count] = self.get_buffer(2, index, count)
+        has_aborted = (lambda: False) if stopRequest is None else stopRequest.isSet
+        ch1, ch2 = self.fill_buffer(count, has_aborted=has_aborted, delay=delay)
+        if has_aborted():
+            return (0, 0, 0, 0)
+        ch1 = ch1.astype(np.float64)
+        ch2 = ch2.astype(np.float64)
         return (ch1.mean(), ch1.std(), ch2.mean(), ch2.std())
 
+    def stream_buffer(self, count=None, chunk_size=512, has_aborted=lambda: False,
+                      timeout=None, min_interval=1e-3, poll_interval=0.1, labels=None):
+        """ Generator yielding the content of the instrument buffer in chunks, while it is
+        recorded.
+
+        Each chunk of both channels is read as soon as it is recorded. The buffer count is
+        queried only once the chunk is expected to be recorded according to the sample
+        frequency, while `has_aborted` is checked every `poll_interval`. The buffer is paused
+        at the end.
+
+        .. code-block:: python
+
+            lockin.start_buffer()
+            for chunk in lockin.stream_buffer(10000, labels=("X", "Y")):
+                self.emit('batch results', chunk)  # in a Procedure
+
+        :param count: Number of points to record. None streams until the generator is closed.
+        :param chunk_size: Number of points per chunk. The last chunk may be smaller.
+        :param has_aborted: A function that returns True when the recording should stop early.
+        :param timeout: Time in seconds to wait for a single chunk, None waits indefinitely.
+        :param min_interval: Minimum time in seconds between two checks of the buffer count.
+        :param poll_interval: Maximum time in seconds between two checks of `has_aborted`.
+        :param labels: Tuple of two keys. If given, a dictionary with the channel data under these
+            keys is yielded, which can be emitted as 'batch results' directly.
+        :returns: Generator of tuples of two numpy arrays (channel 1 and channel 2), or of
+            dictionaries if `labels` is given.
+        """
+        sample_frequency = self.sample_frequency
+        index = 0
+        available = 0
+
+        def chunk_recorded():
+            nonlocal available
+            available = self.buffer_count
+            return available >= end
+
+        try:
+            while count is None or index < count:
+                end = index + chunk_size if count is None else min(index + chunk_size, count)
+                if available < end:
+                    start = time.perf_counter()
+                    deadline = None if timeout is None else start + timeout
+                    if sample_frequency:
+                        # Sleep for the expected recording time of the missing points without
+                        # querying the instrument, but check for an abort regularly.
+                        expected = start + (end - available) / sample_frequency
+                        if deadline is not None:
+                            expected = min(expected, deadline)
+                        while (remaining := expected - time.perf_counter()) > min_interval:
+                            if has_aborted():
+                                return
+                            time.sleep(min(remaining, poll_interval))
+                    remaining = None if deadline is None else max(deadline - time.perf_counter(), 0)
+                    if not self.wait_until(chunk_recorded, timeout=remaining,
+                                           should_stop=has_aborted, min_interval=min_interval,
+                                           max_interval=max(min_interval, poll_interval)):
+                        return
+                ch1 = self.get_buffer(1, index, end)
+                ch2 = self.get_buffer(2, index, end)
+                index = end
+                if labels is None:
+                    yield ch1, ch2
+                else:
+                    yield {labels[0]: ch1, labels[1]: ch2}
+        finally:
+            self.pause_buffer()
+
     def pause_buffer(self):
         self.write("PAUS")
 
@@ -565,13 +616,18 @@ class SR830(Instrument):
     def wait_for_buffer(self, count, has_aborted=lambda: False,
                         timeout=60, timestep=0.01):
         """ Wait for the buffer to fill a certain count
+
+        :param count: Number of points to wait for.
+        :param has_aborted: A function that returns True when this function should return early.
+        :param timeout: A time in seconds after which the waiting stops.
+        :param timestep: The maximum time in seconds between two checks of the buffer count.
         """
-        i = 0
-        while not self.buffer_count >= count and i < (timeout / timestep):
-            time.sleep(timestep)
-            i += 1
-            if has_aborted():
+        try:
+            if not self.wait_until(lambda: self.buffer_count >= count, timeout=timeout,
+                                   should_stop=has_aborted, max_interval=timestep):
                 return False
+        except TimeoutError:
+            pass
         self.pause_buffer()
 
     def get_buffer(self, channel=1, start=0, end=None):
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .tccxn import CXN
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "tccxn": ["CXN"],
+})
@@ -23,16 +23,19 @@
 #
 
 from abc import ABCMeta
+import logging
 import re
 import sys
 import time
-from decimal import Decimal
 import numpy as np
 
 from pymeasure.instruments import Instrument, Channel, SCPIUnknownMixin
 from pymeasure.instruments.validators import strict_discrete_set, strict_range, \
     strict_discrete_range
 
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
 
 def sanitize_source(source):
     """Parse source string.
@@ -474,12 +477,18 @@ class TeledyneOscilloscope(SCPIUnknownMixin, Instrument, metaclass=ABCMeta):
         on the actual commands and on the connection type, so it is impossible to give a unique
         value to fit all cases. An interval between 10ms and 500ms second proved to be good,
         depending on the commands and connection latency.
+        WAVEFORM_CHUNK_SIZE: default size in bytes of the chunks in which waveforms are
+        downloaded, as larger chunks may fail to transfer. Larger chunks (e.g. 250000 bytes
+        over TCPIP) can speed up the download, but have to be enabled for a single instrument
+        with the :attr:`waveform_chunk_size` attribute, after checking them with the hardware.
     """
 
     _BOOLS = TeledyneOscilloscopeChannel._BOOLS
 
     WRITE_INTERVAL_S = 0.02  # seconds
 
+    WAVEFORM_CHUNK_SIZE = 20000  # bytes
+
     ch_1 = Instrument.ChannelCreator(TeledyneOscilloscopeChannel, 1)
 
     ch_2 = Instrument.ChannelCreator(TeledyneOscilloscopeChannel, 2)
@@ -496,6 +505,8 @@ class TeledyneOscilloscope(SCPIUnknownMixin, Instrument, metaclass=ABCMeta):
         self._seconds_since_last_write = 0  # Timestamp of the last command
         self._header_size = 16  # bytes
         self._footer_size = 2  # bytes
+        self.waveform_chunk_size = None  # bytes, None selects WAVEFORM_CHUNK_SIZE
+        self.last_transfer_rate = None  # MB/s of the last waveform download
         self.waveform_source = "C1"
         self.default_setup()
 
@@ -744,7 +755,7 @@ class TeledyneOscilloscope(SCPIUnknownMixin, Instrument, metaclass=ABCMeta):
             preamble["yoffset"] = self.ch(self.waveform_source).offset
         return preamble
 
-    def _digitize(self, src, num_bytes=None):
+    def _digitize(self, src, num_bytes=None, setup=None):
         """Acquire waveforms according to the settings of the acquire commands.
         Note.
         If the requested number of bytes is not specified, the default chunk size is used,
@@ -753,10 +764,14 @@ class TeledyneOscilloscope(SCPIUnknownMixin, Instrument, metaclass=ABCMeta):
         :param src: source of data: "C1", "C2", "C3", "C4", "MATH".
         :param: num_bytes: number of bytes expected from the scope (including the header and
         footer).
+        :param setup: setup command sent in the same message before the waveform query.
         :return: bytearray with raw data.
         """
+        command = f"{src}:WF? DAT2"
+        if setup:
+            command = f"{setup};{command}"
         with _ChunkResizer(self.adapter, num_bytes):
-            binary_values = self.binary_values(f"{src}:WF? DAT2", dtype=np.uint8)
+            binary_values = self.binary_values(command, dtype=np.uint8)
         if num_bytes is not None and len(binary_values) != num_bytes:
             raise BufferError(f"read bytes ({len(binary_values)}) != requested bytes ({num_bytes})")
         return binary_values
@@ -785,13 +800,30 @@ class TeledyneOscilloscope(SCPIUnknownMixin, Instrument, metaclass=ABCMeta):
             raise ValueError(f"Number of transmitted points ({transmitted_points}) != "
                              f"number of received points ({received_points})")
 
-    def _acquire_data(self, requested_points=0, sparsing=1):
+    def _get_waveform_chunk_size(self, chunk_size=None):
+        """Return the chunk size in bytes for waveform downloads.
+
+        :param chunk_size: chunk size in bytes. If None, :attr:`waveform_chunk_size` is used or,
+            if that is None as well, :attr:`WAVEFORM_CHUNK_SIZE`.
+        """
+        if chunk_size is None:
+            chunk_size = self.waveform_chunk_size
+        if chunk_size is None:
+            chunk_size = self.WAVEFORM_CHUNK_SIZE
+        chunk_size = int(chunk_size)
+        if chunk_size <= self._header_size + self._footer_size:
+            raise ValueError(f"Chunk size ({chunk_size}) is too small.")
+        return chunk_size
+
+    def _acquire_data(self, requested_points=0, sparsing=1, chunk_size=None, pipeline=False):
         """Acquire raw data points from the scope. The header, footer and number of points are
         sanity-checked, but they are not processed otherwise. For a description of the input
         arguments refer to the download_waveform method.
         If the number of expected points is big enough, the transmission is split in smaller
-        chunks of 20k points and read one chunk at a time. I do not know the reason why,
+        chunks (20k points by default) and read one chunk at a time. I do not know the reason why,
         but if the chunk size is big enough the transmission does not complete successfully.
+        The chunks are written into a single preallocated array. The achieved transfer rate in
+        MB/s is stored in :attr:`last_transfer_rate`.
         :return: raw data points as numpy array and waveform preamble
         """
         # Setup waveform acquisition parameters
@@ -808,33 +840,44 @@ class TeledyneOscilloscope(SCPIUnknownMixin, Instrument, metaclass=ABCMeta):
 
         # If the number of points is big enough, split the data in small chunks and read it one
         # chunk at a time. For less than a certain amount of points we do not bother splitting them.
-        chunk_bytes = 20000
+        chunk_bytes = self._get_waveform_chunk_size(chunk_size)
         chunk_points = chunk_bytes - self._header_size - self._footer_size
         iterations = -(expected_points // -chunk_points)
-        i = 0
-        data = []
-        while i < iterations:
+        data = np.empty(expected_points, dtype=np.uint8)
+        # number of points set in the oscilloscope
+        setup_points = requested_points
+        start = time.perf_counter()
+        for i in range(iterations):
             # number of points already read
             read_points = i * chunk_points
-            # number of points still to read
-            remaining_points = expected_points - read_points
             # number of points requested in a single chunk
-            requested_points = chunk_points if remaining_points > chunk_points else remaining_points
-            self.waveform_points = requested_points
+            requested_points = min(chunk_points, expected_points - read_points)
             # number of bytes requested in a single chunk
             requested_bytes = requested_points + self._header_size + self._footer_size
             # read the next chunk starting from this points
             first_point = read_points * sparsing
-            self.waveform_first_point = first_point
-            # read chunk of points
-            values = self._digitize(src=self.waveform_source, num_bytes=requested_bytes)
+            if pipeline:
+                # send the chunk setup in the same message as the waveform query
+                setup = f"WFSU FP,{first_point}"
+                if requested_points != setup_points:
+                    setup = f"WFSU NP,{requested_points},FP,{first_point}"
+                    setup_points = requested_points
+                values = self._digitize(src=self.waveform_source, num_bytes=requested_bytes,
+                                        setup=setup)
+            else:
+                self.waveform_points = requested_points
+                self.waveform_first_point = first_point
+                values = self._digitize(src=self.waveform_source, num_bytes=requested_bytes)
             # perform many sanity checks on the received data
             self._header_footer_sanity_checks(values)
             self._npoints_sanity_checks(values)
-            # append the points without the header and footer
-            data.append(values[self._header_size:-self._footer_size])
-            i += 1
-        data = np.concatenate(data)
+            # store the points without the header and footer
+            data[read_points:read_points + requested_points] = \
+                values[self._header_size:-self._footer_size]
+        elapsed = time.perf_counter() - start
+        self.last_transfer_rate = expected_points / elapsed / 1e6 if elapsed > 0 else None
+        log.debug("Downloaded %d waveform points in %d chunks at %s MB/s.", expected_points,
+                  iterations, self.last_transfer_rate)
         preamble = self.waveform_preamble
         return data, preamble
 
@@ -850,35 +893,42 @@ class TeledyneOscilloscope(SCPIUnknownMixin, Instrument, metaclass=ABCMeta):
             img = self.binary_values("SCDP", dtype=np.uint8)
         return bytearray(img)
 
-    def _process_data(self, ydata, preamble):
-        """Apply scale and offset to the data points acquired from the scope.
+    def scale_waveform(self, ydata, preamble):
+        """Apply scale and offset to the raw data points acquired from the scope.
+
         - Y axis : the scale is ydiv / 25 and the offset -yoffset. the
-        offset is not applied for the MATH source.
+          offset is not applied for the MATH source.
         - X axis : the scale is sparsing / sampling_rate and the offset is -xdiv * 7. The
-        7 = 14 / 2 factor comes from the fact that there are 14 vertical grid lines and the data
-        starts from the left half of the screen.
+          7 = 14 / 2 factor comes from the fact that there are 14 vertical grid lines and the data
+          starts from the left half of the screen.
 
-        :return: tuple of (numpy array of Y points, numpy array of X points, waveform preamble) """
+        Use it to scale the raw data returned by :meth:`download_waveform` with ``raw=True``.
 
-        def _scale_data(y):
-            if preamble["source"] == "MATH":
-                value = int.from_bytes([y], byteorder='big', signed=False) * preamble["ydiv"] / 25.
-                value -= preamble["ydiv"] * (preamble["yoffset"] + 255) / 50.
-            else:
-                value = int.from_bytes([y], byteorder='big', signed=True) * preamble["ydiv"] / 25.
-                value -= preamble["yoffset"]
-            return value
-
-        def _scale_time(x):
-            return float(Decimal(-preamble["xdiv"] * self._grid_number / 2.) +
-                         Decimal(float(x * preamble["sparsing"])) /
-                         Decimal(preamble["sampling_rate"]))
-
-        data_points = np.vectorize(_scale_data)(ydata)
-        time_points = np.vectorize(_scale_time)(np.arange(len(data_points)))
+        :param ydata: raw data points as numpy array of uint8.
+        :param preamble: waveform preamble dict, see :attr:`waveform_preamble`.
+        :return: tuple of (numpy array of Y points, numpy array of X points, waveform preamble)
+        """
+        ydata = np.asarray(ydata, dtype=np.uint8)
+        ydiv = preamble["ydiv"]
+        if preamble["source"] == "MATH":
+            data_points = ydata * ydiv / 25.
+            data_points -= ydiv * (preamble["yoffset"] + 255) / 50.
+        else:
+            data_points = ydata.view(np.int8) * ydiv / 25.
+            data_points -= preamble["yoffset"]
+        # Multiply the integer indices first and divide once to keep float64 rounding errors
+        # below one ulp.
+        time_points = np.arange(len(data_points), dtype=np.float64) * preamble["sparsing"]
+        time_points /= preamble["sampling_rate"]
+        time_points += -preamble["xdiv"] * self._grid_number / 2.
         return data_points, time_points, preamble
 
-    def download_waveform(self, source, requested_points=None, sparsing=None):
+    def _process_data(self, ydata, preamble):
+        """Scale the data points, see :meth:`scale_waveform`."""
+        return self.scale_waveform(ydata, preamble)
+
+    def download_waveform(self, source, requested_points=None, sparsing=None, raw=False,
+                          chunk_size=None, pipeline=False):
         """Get data points from the specified source of the oscilloscope.
 
         The returned objects are two np.ndarray of data and time points and a dict with the
@@ -892,8 +942,16 @@ class TeledyneOscilloscope(SCPIUnknownMixin, Instrument, metaclass=ABCMeta):
         :param sparsing: interval between data points. For example if sparsing = 4, only one
                point every 4 points is read. If 0 or None the sparsing of the previous call is
                assumed, i.e. the value of the sparsing stored in the oscilloscope memory.
+        :param raw: if True, do not scale the data and return the raw data points (np.ndarray of
+               uint8) and the waveform preamble only. Pass them to :meth:`scale_waveform` to
+               scale them later on.
+        :param chunk_size: size in bytes of the chunks in which the waveform is downloaded. If
+               None, :attr:`waveform_chunk_size` or :attr:`WAVEFORM_CHUNK_SIZE` is used.
+        :param pipeline: if True, send the setup of each chunk in the same message as its
+               waveform query, which saves two write intervals per chunk.
         :return: data_ndarray, time_ndarray, waveform_preamble_dict: see waveform_preamble
-                 property for dict format.
+                 property for dict format. If `raw` is True: raw_data_ndarray,
+                 waveform_preamble_dict.
         """
         # Sanitize the input arguments
         if not sparsing:
@@ -902,12 +960,15 @@ class TeledyneOscilloscope(SCPIUnknownMixin, Instrument, metaclass=ABCMeta):
             requested_points = self.waveform_points
         self.waveform_source = sanitize_source(source)
         # Acquire the Y data and the preable
-        ydata, preamble = self._acquire_data(requested_points, sparsing)
+        ydata, preamble = self._acquire_data(requested_points, sparsing, chunk_size=chunk_size,
+                                             pipeline=pipeline)
         # Update the preamble with info about actually acquired data
         preamble["transmitted_points"] = len(ydata)
         preamble["requested_points"] = requested_points
         preamble["sparsing"] = sparsing
         preamble["first_point"] = 0
+        if raw:
+            return ydata, preamble
         # Scale the Y-data and create the X-data
         return self._process_data(ydata, preamble)
 
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .texioPSW360L30 import TexioPSW360L30
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "texioPSW360L30": ["TexioPSW360L30"],
+})
@@ -22,6 +22,10 @@
 # THE SOFTWARE.
 #
 
-from .thorlabspm100usb import ThorlabsPM100USB
-from .thorlabspro8000 import ThorlabsPro8000
-from .thorlabsmbxseries import ThorlabsMBXSeries
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "thorlabspm100usb": ["ThorlabsPM100USB"],
+    "thorlabspro8000": ["ThorlabsPro8000"],
+    "thorlabsmbxseries": ["ThorlabsMBXSeries"],
+})
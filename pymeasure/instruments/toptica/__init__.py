@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .ibeamsmart import IBeamSmart
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "ibeamsmart": ["IBeamSmart"],
+})
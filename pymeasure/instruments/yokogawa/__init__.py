@@ -22,6 +22,12 @@
 # THE SOFTWARE.
 #
 
-from .aq6370series import AQ6370Series, AQ6370C, AQ6370D, AQ6370E, AQ6373, AQ6373B, AQ6375, AQ6375B
-from .yokogawa7651 import Yokogawa7651
-from .yokogawags200 import YokogawaGS200
+from ...lazy_import import attach
+
+__getattr__, __dir__, __all__ = attach(__name__, {
+    "aq6370series": [
+        "AQ6370Series", "AQ6370C", "AQ6370D", "AQ6370E", "AQ6373", "AQ6373B", "AQ6375", "AQ6375B",
+    ],
+    "yokogawa7651": ["Yokogawa7651"],
+    "yokogawags200": ["YokogawaGS200"],
+})
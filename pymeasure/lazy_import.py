@@ -0,0 +1,73 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+"""Lazy loading of package attributes (:pep:`562`).
+
+A package may define its attributes, which live in submodules, without importing these
+submodules at import time of the package::
+
+    from pymeasure.lazy_import import attach
+
+    __getattr__, __dir__, __all__ = attach(__name__, {
+        "keithley2000": ["Keithley2000"],
+        "keithley2400": ["Keithley2400"],
+    })
+
+A submodule is imported at the first access of one of its attributes, e.g. by
+:code:`from pymeasure.instruments.keithley import Keithley2400`.
+"""
+
+import importlib
+import sys
+
+
+def attach(package_name, submod_attrs):
+    """Return the module level :code:`__getattr__`, :code:`__dir__`, and :code:`__all__`
+    for lazily importing the attributes of a package's submodules.
+
+    :param package_name: Name of the package, usually :code:`__name__`.
+    :param submod_attrs: Dictionary mapping the submodule names (relative to the package) to a
+        list of attribute names to import from that submodule.
+    :returns: Tuple of :code:`__getattr__` function, :code:`__dir__` function, and
+        :code:`__all__` list.
+    """
+    attr_to_module = {attr: module for module, attrs in submod_attrs.items() for attr in attrs}
+    __all__ = list(attr_to_module)
+
+    def __getattr__(name):
+        if name in attr_to_module:
+            module = importlib.import_module(f"{package_name}.{attr_to_module[name]}")
+            value = getattr(module, name)
+        elif name in submod_attrs:
+            value = importlib.import_module(f"{package_name}.{name}")
+        else:
+            raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+        # Store the attribute in the package, such that __getattr__ is not called again.
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package_name])) | set(__all__) | set(submod_attrs))
+
+    return __getattr__, __dir__, __all__
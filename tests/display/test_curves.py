@@ -0,0 +1,284 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pyqtgraph as pg
+import pytest
+
+from pymeasure.display.curves import BufferCurve, MinMaxPyramid, ResultsCurve, ResultsImage
+from pymeasure.display.widgets import PlotWidget
+
+
+def make_results(rows):
+    return SimpleNamespace(data=pd.DataFrame({"a": np.arange(rows, dtype=float),
+                                              "b": np.arange(rows) ** 2,
+                                              "c": -np.arange(rows, dtype=float)}),
+                           reload=mock.MagicMock())
+
+
+def extend_results(results, rows):
+    start = len(results.data)
+    results.data = pd.concat([results.data, make_results(start + rows).data.iloc[start:]])
+
+
+class TestResultsCurve:
+    @pytest.fixture()
+    def curve(self, qapp):
+        return ResultsCurve(make_results(5), "a", "b", pen=pg.mkPen())
+
+    def plotted(self, curve):
+        x, y = curve.getData()
+        return list(x), list(y)
+
+    def test_update_data(self, curve):
+        curve.update_data()
+        assert self.plotted(curve) == ([0, 1, 2, 3, 4], [0, 1, 4, 9, 16])
+
+    def test_append_rows(self, curve):
+        curve.update_data()
+        buffer = curve._buffer
+        buffer[1, 0] = -1  # marker to verify that plotted rows are not copied again
+        extend_results(curve.results, 3)
+        curve.update_data()
+        assert curve._buffer is buffer  # no reallocation
+        assert self.plotted(curve) == (list(range(8)), [-1] + [i ** 2 for i in range(1, 8)])
+
+    def test_buffer_grows(self, curve):
+        curve.update_data()
+        extend_results(curve.results, 5000)
+        curve.update_data()
+        assert curve._buffer.shape[1] >= 5005
+        x, y = curve.getData()
+        np.testing.assert_array_equal(y, np.arange(5005) ** 2)
+
+    def test_no_new_rows_skips_set_data(self, curve):
+        curve.update_data()
+        with mock.patch.object(curve, "setData") as set_data:
+            curve.update_data()
+        set_data.assert_not_called()
+
+    def test_axis_change_reloads(self, curve):
+        curve.update_data()
+        curve.y = "c"
+        curve.update_data()
+        assert self.plotted(curve) == ([0, 1, 2, 3, 4], [0, -1, -2, -3, -4])
+
+    def test_fewer_rows_reloads(self, curve):
+        curve.update_data()
+        curve.results.data = curve.results.data.iloc[:2]
+        curve.update_data()
+        assert self.plotted(curve) == ([0, 1], [0, 1])
+
+    @pytest.mark.parametrize("kwargs", ({"force_reload": True}, {"append": False}))
+    def test_full_reload(self, qapp, kwargs):
+        curve = ResultsCurve(make_results(5), "a", "b", pen=pg.mkPen(), **kwargs)
+        curve.update_data()
+        curve.results.data.loc[0, "b"] = 100  # changed in place, not appended
+        curve.update_data()
+        assert self.plotted(curve)[1][0] == 100
+        assert curve.results.reload.called == kwargs.get("force_reload", False)
+
+
+class TestMinMaxPyramid:
+    @pytest.fixture()
+    def data(self):
+        rng = np.random.default_rng(1)
+        return np.arange(100_000, dtype=float), rng.normal(size=100_000)
+
+    def test_incremental_update_matches_full_update(self, data):
+        x, y = data
+        pyramid = MinMaxPyramid()
+        for stop in (0, 1, 3, 4, 5, 16, 17, 1000, 1000, 4096, 50_001, 100_000):
+            pyramid.update(x[:stop], y[:stop])
+        reference = MinMaxPyramid()
+        reference.update(x, y)
+        assert pyramid._sizes == reference._sizes
+        for level, expected, size in zip(pyramid._levels, reference._levels, pyramid._sizes):
+            np.testing.assert_array_equal(level[:, :size], expected[:, :size])
+
+    def test_decimate_keeps_envelope(self, data):
+        x, y = data
+        pyramid = MinMaxPyramid()
+        pyramid.update(x, y)
+        dx, dy = pyramid.decimate(500)
+        assert len(dx) <= 2 * pyramid.factor * 500
+        assert dy.min() == y.min() and dy.max() == y.max()
+        assert np.all(np.diff(dx) >= 0)
+
+    def test_decimate_visible_range(self, data):
+        x, y = data
+        pyramid = MinMaxPyramid()
+        pyramid.update(x, y)
+        dx, dy = pyramid.decimate(500, x_range=(1000, 1100))
+        visible = (dx >= 1000) & (dx <= 1100)
+        np.testing.assert_array_equal(dy[visible], y[1000:1101])  # full resolution
+        assert dy.min() == y.min() and dy.max() == y.max()
+
+    def test_not_monotonic(self):
+        pyramid = MinMaxPyramid()
+        pyramid.update(np.array([0., 2, 1, 3, 4, 5]), np.zeros(6))
+        assert pyramid.monotonic is False
+
+    def test_not_monotonic_is_not_decimated(self, data):
+        x, y = data
+        x = np.sin(x)  # x-y plot, e.g. a hysteresis loop
+        pyramid = MinMaxPyramid()
+        pyramid.update(x[:50_000], y[:50_000])
+        pyramid.update(x, y)
+        dx, dy = pyramid.decimate(500, x_range=(-0.5, 0.5))
+        np.testing.assert_array_equal(dx, x)
+        np.testing.assert_array_equal(dy, y)
+        assert pyramid._levels == []
+
+
+class TestResultsCurveLOD:
+    def test_update_data(self, qapp):
+        curve = ResultsCurve(make_results(10), "a", "c", pen=pg.mkPen(), lod=True)
+        curve.update_data()
+        extend_results(curve.results, 100_000)
+        curve.update_data()
+        x, y = curve.getData()
+        assert len(x) <= 2 * curve._pyramid.factor * 1000
+        assert y.min() == -100_009 and y.max() == 0
+
+    def test_plot_widget(self, qtbot):
+        widget = PlotWidget("Plot", ["a", "b", "c"], lod=True)
+        qtbot.addWidget(widget)
+        curve = widget.new_curve(make_results(10))
+        assert curve.lod is True
+
+
+class TestResultsImage:
+    @pytest.fixture()
+    def image(self, qapp):
+        procedure = SimpleNamespace(x_start=0, x_end=1, x_step=0.25, y_start=-1, y_end=1, y_step=1)
+        xs, ys = np.meshgrid(np.arange(0, 1.01, 0.25), [-1, 0, 1])
+        data = pd.DataFrame({"x": xs.ravel(), "y": ys.ravel(), "z": np.arange(15.)})
+        results = SimpleNamespace(procedure=procedure, data=data.iloc[:7], all_data=data,
+                                  reload=mock.MagicMock())
+        return ResultsImage(results, "x", "y", "z")
+
+    def legacy_z_data(self, image):
+        """Pixel assignment with the per row implementation."""
+        z_data = np.full((image.ysize, image.xsize), np.nan)
+        for _, row in image.results.data.iterrows():
+            xidx, yidx = image.find_img_index(row["x"], row["y"])
+            z_data[yidx, xidx] = row["z"]
+        return z_data
+
+    def test_update_data(self, image):
+        image.update_data()
+        assert image.z_data.shape == (3, 5)
+        np.testing.assert_array_equal(image.z_data, self.legacy_z_data(image))
+        assert image.levels[0] == 0 and image.levels[1] == 6
+
+    def test_incremental_update(self, image):
+        image.update_data()
+        image.z_data[0, 0] = -5  # marker to verify that old rows are not assigned again
+        image.results.data = image.results.all_data
+        image.update_data()
+        assert image.z_data[0, 0] == -5
+        assert image.z_data[2, 4] == 14
+        assert image.levels[1] == 14
+
+    def test_axis_change_reloads(self, image):
+        image.update_data()
+        image.z = "y"
+        image.update_data()
+        np.testing.assert_array_equal(image.z_data[0, :], -1)
+
+    def test_indices_match_legacy(self, image):
+        x = np.array([-0.1, 0, 0.1, 0.125, 0.13, 0.9, 1, 1.1, np.nan])
+        y = np.array([-1.5, -1, -0.5, 0, 0.49, 0.5, 1, 2, 0])
+        xidx, yidx = image.find_img_indices(x, y)
+        assert list(zip(xidx, yidx)) == [tuple(image.find_img_index(a, b)) for a, b in zip(x, y)]
+
+    def test_missing_pixels_are_transparent(self, image):
+        image.update_data()
+        image.render()
+        assert image.qimage.pixelColor(0, 0).alpha() == 255
+        assert image.qimage.pixelColor(4, 2).alpha() == 0
+
+
+class TestBufferCurve:
+    @pytest.fixture()
+    def curve(self, qapp):
+        curve = BufferCurve(update_interval=0)
+        curve.prepare(5)
+        return curve
+
+    def test_not_prepared(self, qapp):
+        with pytest.raises(Exception, match="prepared"):
+            BufferCurve().append(1, 2)
+
+    def test_append(self, curve):
+        curve.append(1, 2)
+        curve.append(2, 4)
+        assert curve.buffered_data().tolist() == [[1, 2], [2, 4]]
+        x, y = curve.getData()
+        assert x.tolist() == [1, 2]
+        assert y.tolist() == [2, 4]
+
+    def test_overflow(self, curve):
+        curve.extend(range(5), range(5))
+        with pytest.raises(Exception, match="overflow"):
+            curve.append(5, 5)
+        with pytest.raises(Exception, match="overflow"):
+            curve.extend([5], [5])
+
+    def test_extend(self, curve):
+        curve.append(0, 0)
+        curve.extend([1, 2], np.array([10, 20]))
+        assert curve.buffered_data().tolist() == [[0, 0], [1, 10], [2, 20]]
+
+    @pytest.mark.parametrize("chunks", ([1] * 12, [3, 3, 3, 3], [4, 1, 7], [12], [2, 10]))
+    def test_circular(self, curve, chunks):
+        curve.prepare(5, circular=True)
+        start = 0
+        for chunk in chunks:
+            values = np.arange(start, start + chunk)
+            if chunk == 1:
+                curve.append(values[0], -values[0])
+            else:
+                curve.extend(values, -values)
+            start += chunk
+        assert curve.buffered_data()[:, 0].tolist() == list(range(7, 12))
+        assert curve.getData()[1].tolist() == list(range(-7, -12, -1))
+
+    def test_deferred_update(self, qtbot):
+        curve = BufferCurve(update_interval=10)
+        curve.prepare(1000)
+        emitted = mock.MagicMock()
+        curve.data_updated.connect(emitted)
+        with qtbot.waitSignal(curve.data_updated, timeout=1000):
+            for i in range(100):
+                curve.append(i, i)
+            curve.extend(range(100, 200), range(100, 200))
+            assert curve.getData()[0] is None
+        emitted.assert_called_once()
+        assert len(curve.getData()[0]) == 200
@@ -0,0 +1,203 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+import threading
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pymeasure.display.Qt import QtWidgets
+from pymeasure.display.refresh import RefreshCoordinator, ResultsSnapshots
+from pymeasure.display.widgets import PlotWidget, TableWidget
+from pymeasure.display.windows import ManagedWindow
+from pymeasure.experiment import Procedure
+
+
+class CountingResults:
+    """Results, which count the pulls of their data."""
+
+    def __init__(self):
+        self.procedure = mock.MagicMock(status=Procedure.RUNNING)
+        self.pulls = 0
+        self.reload = mock.MagicMock()
+        self._data = pd.DataFrame({"x": np.arange(5.), "y": np.arange(5.) ** 2})
+
+    @property
+    def data(self):
+        self.pulls += 1
+        return self._data
+
+
+class ProcedureWithData(Procedure):
+    DATA_COLUMNS = ["x", "y"]
+
+
+def test_snapshots_pull_once():
+    results = CountingResults()
+    snapshots = ResultsSnapshots(reload=[results])
+    assert snapshots[results] is snapshots[results]
+    assert results.pulls == 1
+    results.reload.assert_called_once_with()
+
+
+class TestRefreshCoordinator:
+    @pytest.fixture()
+    def window(self, qtbot):
+        tabs = QtWidgets.QTabWidget()
+        qtbot.addWidget(tabs)
+        plots = [PlotWidget("Plot 1", ["x", "y"]), PlotWidget("Plot 2", ["x", "y"])]
+        table = TableWidget("Table", ["x", "y"])
+        for wdg in plots + [table]:
+            tabs.addTab(wdg, wdg.name)
+        results = CountingResults()
+        for plot in plots:
+            plot.load(plot.new_curve(results))
+        table.load(table.new_curve(results))
+        coordinator = RefreshCoordinator(parent=tabs)
+        for wdg in plots + [table]:
+            coordinator.add_widget(wdg)
+        tabs.show()
+        return tabs, plots, table, results, coordinator
+
+    def test_add_widget_takes_over_timers(self, window):
+        tabs, plots, table, results, coordinator = window
+        assert coordinator.frames == [plots[0].plot_frame, plots[1].plot_frame, table.table]
+        assert not any(frame.timer.isActive() for frame in coordinator.frames)
+        assert coordinator.timer.isActive()
+        assert coordinator.refresh_time == 0.2
+
+    def test_refresh_pulls_once_and_skips_hidden(self, window):
+        tabs, plots, table, results, coordinator = window
+        results.pulls = 0
+        with mock.patch.object(plots[1].plot_frame, "refresh_data") as hidden_refresh:
+            coordinator.refresh()
+        assert results.pulls == 1
+        hidden_refresh.assert_not_called()
+
+    def test_all_visible_frames_share_the_snapshot(self, window):
+        tabs, plots, table, results, coordinator = window
+        tabs.setCurrentIndex(2)
+        results.pulls = 0
+        coordinator.refresh()
+        assert results.pulls == 1
+        assert table.table.source_model().rowCount() == 5
+
+    def test_interval_adapts_to_duration(self, window):
+        coordinator = window[-1]
+        coordinator.duration = 0.01
+        assert coordinator.interval == 0.2
+        coordinator.duration = 0.1
+        assert coordinator.interval == pytest.approx(0.4)
+        coordinator.duration = 10
+        assert coordinator.interval == coordinator.max_refresh_time
+
+
+def test_managed_window_uses_coordinator(qtbot):
+    window = ManagedWindow(ProcedureWithData, x_axis="x", y_axis="y")
+    qtbot.addWidget(window)
+    logging.getLogger().removeHandler(window.log_widget.handler)
+    assert window.refresh_coordinator.frames == [window.plot_widget.plot_frame]
+    assert not window.plot_widget.plot_frame.timer.isActive()
+    window.close()
+
+
+def test_managed_window_close_stops_coordinator(qtbot):
+    window = ManagedWindow(ProcedureWithData, x_axis="x", y_axis="y")
+    qtbot.addWidget(window)
+    logging.getLogger().removeHandler(window.log_widget.handler)
+    loader = window.refresh_coordinator.loader
+    window.close()
+    assert loader.isFinished()
+    assert not window.refresh_coordinator.timer.isActive()
+
+
+class BlockingResults(CountingResults):
+    """Results, whose data is available only after release is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    @property
+    def data(self):
+        self.release.wait(5)
+        return super().data
+
+
+class TestThreadedRefresh:
+    @pytest.fixture()
+    def window(self, qtbot):
+        plot = PlotWidget("Plot", ["x", "y"])
+        qtbot.addWidget(plot)
+        results = BlockingResults()
+        results.release.set()
+        curve = plot.new_curve(results)
+        plot.load(curve)
+        results.release.clear()
+        results.pulls = 0
+        results._data = pd.DataFrame({"x": np.arange(6.), "y": np.arange(6.) ** 2})
+        coordinator = RefreshCoordinator(threaded=True, parent=plot)
+        coordinator.add_widget(plot)
+        coordinator.timer.stop()
+        plot.show()
+        yield plot, curve, results, coordinator
+        results.release.set()
+        coordinator.stop()
+
+    def test_data_is_pulled_in_background(self, window, qtbot):
+        plot, curve, results, coordinator = window
+        coordinator.refresh()
+        assert results.pulls == 0  # the GUI thread did not wait for the data
+        assert len(curve.getData()[0]) == 5
+        results.release.set()
+        with qtbot.waitSignal(coordinator.refreshed, timeout=5000):
+            pass
+        assert results.pulls == 1
+        assert curve.getData()[1].tolist() == [0, 1, 4, 9, 16, 25]
+
+    def test_ticks_are_dropped_while_loading(self, window, qtbot):
+        plot, curve, results, coordinator = window
+        coordinator.refresh()
+        coordinator.refresh()
+        coordinator.refresh()
+        assert coordinator.dropped == 2
+        results.release.set()
+        with qtbot.waitSignal(coordinator.refreshed, timeout=5000):
+            pass
+        assert results.pulls == 1
+        coordinator.refresh()
+        with qtbot.waitSignal(coordinator.refreshed, timeout=5000):
+            pass
+        assert results.pulls == 2
+
+    def test_stop(self, window):
+        coordinator = window[-1]
+        loader = coordinator.loader
+        coordinator.stop()
+        assert loader.isFinished()
+        assert coordinator.loader is None
+        coordinator.stop()
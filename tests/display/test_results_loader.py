@@ -0,0 +1,117 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import logging
+import os
+from unittest import mock
+
+import pytest
+
+from pymeasure.display.Qt import QtWidgets
+from pymeasure.display.thread import ResultsLoader
+from pymeasure.display.windows import ManagedWindow
+from pymeasure.experiment import Procedure, Results
+
+
+class ProcedureWithData(Procedure):
+    DATA_COLUMNS = ["x", "y"]
+
+
+@pytest.fixture()
+def data_file(tmpdir):
+    filename = os.path.join(str(tmpdir), "data.csv")
+    Results(ProcedureWithData(), filename)
+    with open(filename, "a", encoding=Results.ENCODING) as f:
+        for i in range(50):
+            f.write(f"{i},{i ** 2}\n")
+    return filename
+
+
+def load_lazily(filename):
+    return Results.load(filename, procedure_class=ProcedureWithData, lazy=True)
+
+
+class TestResultsLoader:
+    @pytest.fixture()
+    def loader(self, qapp):
+        loader = ResultsLoader()
+        loader.start()
+        yield loader
+        loader.join()
+
+    def test_load(self, loader, data_file, qtbot):
+        results = load_lazily(data_file)
+        assert results._data is None
+        with qtbot.waitSignals([loader.progress, loader.loaded], timeout=5000):
+            loader.load(results)
+            assert loader.is_pending(data_file)
+        assert results._data["y"].tolist() == [i ** 2 for i in range(50)]
+        qtbot.waitUntil(lambda: not loader.pending, timeout=1000)
+
+    def test_load_fails(self, loader, data_file, qtbot):
+        results = load_lazily(data_file)
+        os.remove(data_file)
+        with qtbot.waitSignal(loader.loaded, timeout=5000) as blocker:
+            loader.load(results)
+        assert blocker.args == [results, True]
+
+    def test_stop(self, loader):
+        loader.join()
+        assert loader.isFinished()
+
+
+def test_managed_window_opens_in_background(data_file, qtbot):
+    window = ManagedWindow(ProcedureWithData, x_axis="x", y_axis="y")
+    qtbot.addWidget(window)
+    logging.getLogger().removeHandler(window.log_widget.handler)
+    with qtbot.waitSignal(window.results_loader.loaded, timeout=5000):
+        window.results_loader.load(load_lazily(data_file))
+    assert data_file in window.manager.experiments
+    curve = window.manager.experiments[0].curve_list[0]
+    assert len(curve.getData()[0]) == 50
+    window.close()
+
+
+def test_managed_window_reports_failed_load(data_file, qtbot):
+    window = ManagedWindow(ProcedureWithData, x_axis="x", y_axis="y")
+    qtbot.addWidget(window)
+    logging.getLogger().removeHandler(window.log_widget.handler)
+    results = load_lazily(data_file)
+    os.remove(data_file)
+    with mock.patch.object(QtWidgets.QMessageBox, "warning") as warning:
+        with qtbot.waitSignal(window.results_loader.loaded, timeout=5000):
+            window.results_loader.load(results)
+    warning.assert_called_once()
+    assert data_file not in window.manager.experiments
+    assert results._data is None
+    window.close()
+
+
+def test_managed_window_close_stops_loader(qtbot):
+    window = ManagedWindow(ProcedureWithData, x_axis="x", y_axis="y")
+    qtbot.addWidget(window)
+    logging.getLogger().removeHandler(window.log_widget.handler)
+    loader = window.results_loader
+    window.close()
+    assert loader.isFinished()
@@ -0,0 +1,240 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pyqtgraph as pg
+import pytest
+
+from pymeasure.display.Qt import QtCore
+from pymeasure.display.widgets.table_widget import ResultsTable, PandasModelByColumn, \
+    PandasModelByRow, PandasModelVirtual, Table
+
+
+def make_table(index_values, column_index="x"):
+    index_values = np.asarray(index_values)
+    results = SimpleNamespace(data=pd.DataFrame({"x": index_values,
+                                                 "y": np.arange(len(index_values)) * 1.5}))
+    return ResultsTable(results, pg.intColor(0), column_index=column_index)
+
+
+def extend_table(table, index_values):
+    data = table.results.data
+    new = pd.DataFrame({"x": index_values,
+                        "y": np.arange(len(data), len(data) + len(index_values)) * 1.5})
+    table.results.data = pd.concat([data, new], ignore_index=True)
+    table.update_data()
+
+
+def legacy_translate_to_local(model, row, col):
+    """Row lookup of PandasModelByColumn as it was implemented before the merged index."""
+    columns = 0
+    for results in model.results_list:
+        if col < (columns + results.columns):
+            break
+        columns += results.columns
+    header = sorted(set().union(*(set(r.data.index) for r in model.results_list)))
+    try:
+        row = list(results.data.index).index(header[row])
+    except ValueError:
+        row = None
+    return results, row, col - columns
+
+
+def assert_matches_legacy(model):
+    assert model.rowCount() == len(
+        set().union(*(set(r.data.index) for r in model.results_list)))
+    for row in range(model.rowCount()):
+        for col in range(model.columnCount()):
+            assert (model.translate_to_local(row, col)
+                    == legacy_translate_to_local(model, row, col))
+
+
+class TestPandasModelByColumn:
+    @pytest.fixture()
+    def model(self, qapp):
+        model = PandasModelByColumn(column_index="x")
+        self.tables = [make_table([0, 2, 4]), make_table([1, 2, 2, 3])]
+        for table in self.tables:
+            model.add_results(table)
+        return model
+
+    def test_vertical_header(self, model):
+        assert list(model.vertical_header) == [0, 1, 2, 3, 4]
+
+    def test_translate_to_local(self, model):
+        assert_matches_legacy(model)
+
+    def test_appended_rows(self, model):
+        extend_table(self.tables[0], [5, 6])
+        extend_table(self.tables[1], [4, 6, 7])
+        assert list(model.vertical_header) == list(range(8))
+        assert_matches_legacy(model)
+
+    def test_inserted_rows(self, model):
+        extend_table(self.tables[0], [-1, 1.5])
+        assert list(model.vertical_header) == [-1, 0, 1, 1.5, 2, 3, 4]
+        assert_matches_legacy(model)
+
+    def test_remove_results(self, model):
+        model.remove_results(self.tables[0])
+        assert list(model.vertical_header) == [1, 2, 3]
+        assert_matches_legacy(model)
+
+    def test_data(self, model):
+        assert model.data(model.index(1, 0)) == ""  # 1 is missing in the first results
+        assert model.data(model.index(2, 1)) == "1.5"
+
+    def test_set_index(self, model):
+        model.set_index(None)
+        assert model.rowCount() == 4
+        assert model.translate_to_local(3, 2) == (self.tables[1], 3, 0)
+
+    def test_benchmark_scrolling(self, qapp):
+        """Scroll through a table of 100k rows and compare with the legacy row lookup."""
+        rows = 100_000
+        model = PandasModelByColumn(column_index="x")
+        model.add_results(make_table(np.arange(rows)))
+        model.add_results(make_table(np.arange(0, 2 * rows, 2)))
+        visible_rows = 40
+        t0 = time.perf_counter()
+        for first_row in range(0, model.rowCount() - visible_rows, model.rowCount() // 50):
+            for row in range(first_row, first_row + visible_rows):
+                for col in range(model.columnCount()):
+                    model.data(model.index(row, col))
+        t1 = time.perf_counter()
+        for col in range(model.columnCount()):
+            legacy_translate_to_local(model, rows // 2, col)
+        t2 = time.perf_counter()
+        # 50 screens are faster than the legacy lookup of a single row
+        assert t1 - t0 < (t2 - t1) * visible_rows
+
+
+class TestPandasModelVirtual:
+    @pytest.fixture()
+    def model(self, qapp):
+        model = PandasModelVirtual()
+        model.block_size = 4
+        model.cache_blocks = 3
+        model.fetch_size = 10
+        self.tables = [make_table([0.1, 2, 1 / 3, 5, 4, 7], column_index=None),
+                       make_table(np.arange(20, 0, -1), column_index=None)]
+        for table in self.tables:
+            model.add_results(table)
+        return model
+
+    def cells(self, model):
+        return [[model.data(model.index(row, col)) for col in range(model.columnCount())]
+                for row in range(model.rowCount())]
+
+    def test_data_matches_row_layout(self, model):
+        reference = PandasModelByRow()
+        for table in self.tables:
+            reference.add_results(table)
+        expected = self.cells(reference)
+        while model.canFetchMore():
+            model.fetchMore()
+        assert self.cells(model) == expected
+        assert model.data(model.index(2, 0)) == "0.333333"
+
+    def test_fetch_more(self, model):
+        # 6 rows of the first results and 10 of the second one fetched by the data update
+        assert model.rowCount() == 16
+        assert model.canFetchMore()
+        model.fetchMore()
+        assert model.rowCount() == 26
+        assert not model.canFetchMore()
+
+    def test_lru_cache(self, model):
+        self.cells(model)
+        assert len(model._blocks) == model.cache_blocks
+
+    def test_appended_rows(self, model):
+        model.fetch_size = 100
+        model.fetchMore()
+        assert model.data(model.index(6, 0)) == "20"
+        extend_table(self.tables[0], [8.5])
+        assert model.rowCount() == 27
+        assert model.data(model.index(6, 0)) == "8.5"
+        assert model.data(model.index(7, 0)) == "20"
+
+    def test_sort(self, model):
+        model.sort(0, QtCore.Qt.SortOrder.AscendingOrder)
+        assert [model.data(model.index(row, 0)) for row in range(4)] == [
+            "0.1", "0.333333", "1", "2"]
+        assert model.headerData(0, QtCore.Qt.Orientation.Vertical,
+                                QtCore.Qt.ItemDataRole.DisplayRole) == "0"
+        assert model.headerData(2, QtCore.Qt.Orientation.Vertical,
+                                QtCore.Qt.ItemDataRole.DisplayRole) == "25"
+        model.sort(0, QtCore.Qt.SortOrder.DescendingOrder)
+        assert model.data(model.index(0, 0)) == "20"
+        model.sort(-1)
+        assert model.data(model.index(0, 0)) == "0.1"
+
+    @pytest.mark.parametrize("order", (QtCore.Qt.SortOrder.AscendingOrder,
+                                       QtCore.Qt.SortOrder.DescendingOrder))
+    def test_sorted_appended_rows(self, model, order):
+        model.fetch_size = 100
+        model.sort(0, order)
+        extend_table(self.tables[0], [8.5, 0.2])
+        extend_table(self.tables[1], [-1, 30])
+        reference = PandasModelVirtual()
+        for table in self.tables:
+            reference.add_results(table)
+        reference.sort(0, order)
+        assert model.rowCount() == reference.rowCount() == 30
+        assert self.cells(model) == self.cells(reference)
+
+    def test_sorted_appended_rows_move_persistent_index(self, model):
+        model.sort(0, QtCore.Qt.SortOrder.AscendingOrder)
+        index = QtCore.QPersistentModelIndex(model.index(2, 1))
+        assert model.data(model.index(2, 0)) == "1"
+        extend_table(self.tables[1], [0.2])
+        assert index.row() == 3
+        assert model.data(model.index(index.row(), 0)) == "1"
+
+    def test_appended_rows_signals(self, model):
+        model.fetch_size = 100
+        model.fetchMore()
+        model.sort(0, QtCore.Qt.SortOrder.AscendingOrder)
+        signals = []
+        model.dataChanged.connect(lambda *args: signals.append("dataChanged"))
+        model.layoutChanged.connect(lambda *args: signals.append("layoutChanged"))
+        model.rowsInserted.connect(lambda *args: signals.append("rowsInserted"))
+        # Rows sorted behind all other rows do not move the table
+        extend_table(self.tables[1], [50, 60])
+        assert signals == ["rowsInserted"]
+        assert model.data(model.index(27, 0)) == "60"
+
+    def test_table_sorts_without_proxy(self, qtbot):
+        table = Table(refresh_time=None, layout_class=PandasModelVirtual)
+        qtbot.addWidget(table)
+        assert isinstance(table.model(), PandasModelVirtual)
+        assert table.source_model() is table.model()
+        table.add_table(make_table([3., 1., 2.], column_index=None))
+        table.sortByColumn(0, QtCore.Qt.SortOrder.AscendingOrder)
+        assert table.model().data(table.model().index(0, 0)) == "1"
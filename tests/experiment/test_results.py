@@ -32,7 +32,7 @@ import pytest
 import numpy as np
 
 from pymeasure.units import ureg
-from pymeasure.experiment.results import Results, CSVFormatter
+from pymeasure.experiment.results import DataBus, Results, CSVFormatter
 from pymeasure.experiment.procedure import Procedure, Parameter
 from pymeasure.experiment import BooleanParameter
 from data.procedure_for_testing import RandomProcedure
@@ -97,6 +97,57 @@ class Test_csv_formatter_format:
         data = {'index': "10 stupid", 'length (m)': "50 cV", 'voltage (V)': True}
         assert formatter.format(data) == "nan,nan,nan"
 
+    def test_values(self):
+        formatter = CSVFormatter(columns=['t', 'length (m)', 'V'])
+        data = {'t': 1, 'length (m)': "50 cm"}
+        values = formatter.values(data)
+        assert values[:2] == [1, 0.5]
+        assert np.isnan(values[2])
+
+    def test_format_values(self, caplog):
+        formatter = CSVFormatter(columns=['t', 'length (m)'])
+        values = formatter.values({'t': 1, 'length (m)': "50 s"})
+        assert len(caplog.records) == 1
+        assert formatter.format(values) == "1,nan"
+        assert len(caplog.records) == 1
+
+
+class TestDataBus:
+    @pytest.fixture()
+    def bus(self):
+        return DataBus(['x', 'y'], size=4)
+
+    def test_read(self, bus):
+        bus.publish((1, 2.))
+        bus.publish((3, 4.))
+        data = bus.read(0)
+        assert list(data.columns) == ['x', 'y']
+        assert data.values.tolist() == [[1, 2], [3, 4]]
+        assert bus.read(1).values.tolist() == [[3, 4]]
+        assert len(bus.read(2)) == 0
+
+    def test_read_wraps_around(self, bus):
+        for i in range(6):
+            bus.publish((i, -i))
+        assert bus.read(3)["x"].tolist() == [3, 4, 5]
+        assert bus.read(2)["x"].tolist() == [2, 3, 4, 5]
+
+    @pytest.mark.parametrize("start", (0, 1, 7))
+    def test_read_unavailable_rows(self, bus, start):
+        for i in range(6):
+            bus.publish((i, -i))
+        assert bus.read(start) is None
+
+    def test_read_rows_before_start(self):
+        bus = DataBus(['x'], size=4, start=2)
+        bus.publish((2,))
+        assert bus.read(1) is None
+        assert bus.read(2)["x"].tolist() == [2]
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            DataBus(['x'], size=0)
+
 
 def test_procedure_filestorage():
     assert RandomProcedure.iterations.value == 100
@@ -116,7 +167,7 @@ class TestResults:
 
     @mock.patch('pymeasure.experiment.results.open', mock.mock_open(), create=True)
     @mock.patch('os.path.exists', return_value=True)
-    @mock.patch('pymeasure.experiment.results.pd.read_csv')
+    @mock.patch('pandas.read_csv')
     def test_regression_attr_data_when_up_to_date_should_retain_dtype(self,
                                                                       read_csv_mock,
                                                                       path_exists_mock):
@@ -150,6 +201,89 @@ class TestResults:
         pd.read_csv(filename, comment="#")  # assert no error
         assert (result.parameters['par'].value == np.linspace(1, 100, 17)).all()
 
+    @pytest.fixture()
+    def results(self, tmpdir):
+        procedure = RandomProcedure()
+        return Results(procedure, os.path.join(str(tmpdir), 'bus_test.csv'))
+
+    def write_rows(self, results, rows):
+        with open(results.data_filename, 'a', encoding=Results.ENCODING) as f:
+            for row in rows:
+                f.write(results.formatter.format(row) + Results.LINE_BREAK)
+
+    def test_data_from_bus(self, results):
+        bus = results.open_bus()
+        bus.publish((0, 0.5))
+        with mock.patch('pandas.read_csv') as read_csv_mock:
+            assert results.data.values.tolist() == [[0, 0.5]]
+            bus.publish((1, 0.25))
+            assert results.data.values.tolist() == [[0, 0.5], [1, 0.25]]
+        read_csv_mock.assert_not_called()
+
+    def test_data_falls_back_to_file(self, results):
+        rows = [{'Iteration': i, 'Random Number': i / 10} for i in range(5)]
+        bus = results.open_bus(size=2)
+        bus.publish((0, 0.))
+        assert len(results.data) == 1
+        for row in rows[1:]:
+            bus.publish(results.formatter.values(row))
+        self.write_rows(results, rows)
+        assert results.data["Iteration"].tolist() == [0, 1, 2, 3, 4]
+        bus.publish((5, 0.5))
+        assert results.data["Iteration"].tolist() == [0, 1, 2, 3, 4, 5]
+
+    def test_closed_bus_is_released(self, results):
+        bus = results.open_bus()
+        bus.publish((0, 0.))
+        bus.close()
+        assert len(results.data) == 1
+        assert results.bus is None
+
+    @pytest.fixture()
+    def data_file(self, results):
+        self.write_rows(results, [{'Iteration': i, 'Random Number': i / 10} for i in range(100)])
+        return results.data_filename
+
+    def test_lazy_load(self, data_file):
+        with mock.patch('pandas.read_csv',
+                        wraps=pd.read_csv) as read_csv_mock:
+            results = Results.load(data_file, procedure_class=RandomProcedure, lazy=True)
+            read_csv_mock.assert_not_called()
+            assert len(results.data) == 100
+            read_csv_mock.assert_called_once()
+
+    def test_reload_progress(self, data_file):
+        results = Results.load(data_file, procedure_class=RandomProcedure, lazy=True)
+        progress = mock.MagicMock()
+        results.reload(progress=progress)
+        assert progress.call_args_list[-1] == mock.call(100.)
+        assert results.data["Iteration"].tolist() == list(range(100))
+
+    def test_cache(self, data_file):
+        results = Results.load(data_file, procedure_class=RandomProcedure, cache=True)
+        assert os.path.exists(results.cache_filename)
+        with mock.patch('pandas.read_csv') as read_csv_mock:
+            cached = Results.load(data_file, procedure_class=RandomProcedure, cache=True)
+        read_csv_mock.assert_not_called()
+        pd.testing.assert_frame_equal(cached.data, results.data)
+
+    def test_cache_is_invalidated(self, data_file, results):
+        Results.load(data_file, procedure_class=RandomProcedure, cache=True)
+        self.write_rows(results, [{'Iteration': 100, 'Random Number': 0.}])
+        os.utime(data_file, ns=(0, 0))
+        reloaded = Results.load(data_file, procedure_class=RandomProcedure, cache=True)
+        assert len(reloaded.data) == 101
+
+    def test_cache_only_numeric_data(self, results):
+        self.write_rows(results, [{'Iteration': 0, 'Random Number': "abc"}])
+        results.cache = True
+        results.reload()
+        assert not os.path.exists(results.cache_filename)
+
+    def test_pickle_drops_bus(self, results):
+        results.open_bus()
+        assert pickle.loads(pickle.dumps(results)).bus is None
+
 
 def test_parameter_reading():
     data_path = os.path.join(os.path.dirname(__file__), "data/results_for_testing_parameters.csv")
@@ -24,6 +24,7 @@
 import importlib
 import logging
 
+import numpy as np
 import pytest
 import os
 import tempfile
@@ -65,6 +66,47 @@ def test_worker_finish():
     assert new_results.data.shape == (100, 2)
 
 
+def test_worker_publishes_results_to_bus():
+    procedure = RandomProcedure()
+    procedure.iterations = 100
+    procedure.delay = 0.001
+    file = tempfile.mktemp()
+    results = Results(procedure, file)
+    worker = Worker(results)
+    bus = results.bus
+    worker.start()
+    worker.join(timeout=20.0)
+
+    assert bus.closed
+    data = results.data
+    assert results.bus is None
+    assert data.shape == (100, 2)
+    new_results = Results.load(file, procedure_class=RandomProcedure)
+    assert np.allclose(data.values, new_results.data.values)
+
+
+def test_worker_converts_each_record_once():
+    procedure = RandomProcedure()
+    procedure.iterations = 10
+    procedure.delay = 0.001
+    results = Results(procedure, tempfile.mktemp())
+    calls = []
+    values = results.formatter.values
+    results.formatter.values = lambda record: calls.append(record) or values(record)
+    worker = Worker(results)
+    worker.start()
+    worker.join(timeout=20.0)
+
+    assert len(calls) == 10
+    assert results.data.shape == (10, 2)
+
+
+def test_worker_without_bus():
+    results = Results(RandomProcedure(), tempfile.mktemp())
+    Worker(results, bus_size=None)
+    assert results.bus is None
+
+
 def test_worker_closes_file_after_finishing():
     procedure = RandomProcedure()
     procedure.iterations = 100
@@ -22,6 +22,7 @@
 # THE SOFTWARE.
 #
 
+import numpy as np
 import pytest
 
 from pymeasure.test import expected_protocol
@@ -120,3 +121,42 @@ def test_vmu_disable():
         Agilent4156, [(":PAGE:CHAN:VMU1:DIS", None), ("SYST:ERR?", '0,"No error"')]
     ) as inst:
         assert inst.vmu1.disable is None
+
+
+def test_get_data():
+    with expected_protocol(
+        Agilent4156,
+        [("*OPC?", "1"),
+         (":PAGE:DISP:LIST?", "VAR1,I1"),
+         (":PAGE:DISP:DVAR?", ""),
+         (":FORM:DATA ASC", None),
+         (":DATA? 'VAR1'", "0,1,2"),
+         (":DATA? 'I1'", "1E-3,2E-3,3E-3"),
+         ],
+    ) as inst:
+        df = inst.get_data()
+    assert df.columns.tolist() == ["VAR1", "I1"]
+    assert df["VAR1"].tolist() == [0, 1, 2]
+    assert df["I1"].tolist() == [1e-3, 2e-3, 3e-3]
+
+
+def test_get_data_binary():
+    def block(values):
+        payload = np.array(values, dtype=">f8").tobytes()
+        return b"#2%02d" % len(payload) + payload + b"\n"
+
+    with expected_protocol(
+        Agilent4156,
+        [("*OPC?", "1"),
+         (":PAGE:DISP:LIST?", "VAR1,I1"),
+         (":PAGE:DISP:DVAR?", "V2"),
+         (":FORM:DATA REAL,64", None),
+         (":FORM:BORD NORM", None),
+         (":DATA? 'VAR1'", block([0, 1])),
+         (":DATA? 'I1'", block([1e-3, 2e-3])),
+         (":DATA? 'V2'", block([5, 6])),
+         ],
+    ) as inst:
+        df = inst.get_data(binary=True)
+    assert df.columns.tolist() == ["VAR1", "I1", "V2"]
+    assert df.to_numpy().tolist() == [[0, 1e-3, 5], [1, 2e-3, 6]]
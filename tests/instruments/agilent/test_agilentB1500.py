@@ -22,6 +22,8 @@
 # THE SOFTWARE.
 #
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from pymeasure.instruments.agilent import AgilentB1500
@@ -207,3 +209,46 @@ class TestSPGUChannel:
             [(f"SPUPD {self.channel}", None)],
         ) as inst:
             inst.spgu1.ch1.apply_setup()
+
+
+class TestReadData:
+    """Tests for parsing of measurement data."""
+
+    FMT1_DATA = ("NAX+1.00000E+00,NAT+1.00000E-03,NAI+1.23450E-06,NBV+2.50000E+00,"
+                 "NAX+2.00000E+00,NAT+2.00000E-03,CAI-1.00000E-04,NBV+2.50000E+00")
+    FMT21_DATA = ("000AX+1.000000E+00,000AT+1.000000E-03,000AI+1.234500E-06,"
+                  "000AX+2.000000E+00,000AT+2.000000E-03,001AI+1.000000E-01")
+
+    @staticmethod
+    def format_single(instr, data, number_of_points):
+        """Format the data element by element as a reference."""
+        rows = [[instr._data_format.format_single(e) for e in row]
+                for row in np.array(data.split(",")).reshape(number_of_points, -1)]
+        heads = [f"{e[1]} {e[2]}" for e in rows[0]]
+        return pd.DataFrame([[e[3] for e in row] for row in rows], columns=heads)
+
+    @pytest.mark.parametrize("fmt, data", [("FMT1", FMT1_DATA), ("FMT21", FMT21_DATA)])
+    def test_read_data(self, fmt, data):
+        with expected_protocol(AgilentB1500, [(None, data)]) as inst:
+            inst._data_format = inst._data_formatting(fmt, {1: "SMU1", 2: "SMU2"})
+            result = inst.read_data(2)
+            pd.testing.assert_frame_equal(result, self.format_single(inst, data, 2))
+        assert result.columns[0] == "SMU1 Sampling index"
+        assert result.iloc[:, 0].tolist() == [1, 2]
+
+    def test_read_data_logs_status(self, caplog):
+        with expected_protocol(AgilentB1500, [(None, self.FMT21_DATA)]) as inst:
+            inst._data_format = inst._data_formatting("FMT21", {1: "SMU1"})
+            with caplog.at_level("INFO"):
+                inst.read_data(2)
+        assert "SMU1: A/D converter overflowed." in caplog.text
+
+    def test_stream_data(self):
+        data = self.FMT1_DATA.encode() + b"\r"
+        half = len(data) // 2
+        with expected_protocol(AgilentB1500, [(None, data[:half]), (None, data[half:])]) as inst:
+            inst._data_format = inst._data_formatting("FMT1", {1: "SMU1", 2: "SMU2"})
+            blocks = list(inst.stream_data(2, 4, block_size=1))
+            expected = self.format_single(inst, self.FMT1_DATA, 2)
+        assert len(blocks) == 2
+        pd.testing.assert_frame_equal(pd.concat(blocks, ignore_index=True), expected)
@@ -22,6 +22,9 @@
 # THE SOFTWARE.
 #
 
+import numpy as np
+import pytest
+
 from pymeasure.test import expected_protocol
 
 from pymeasure.instruments.keithley import Keithley2400
@@ -47,3 +50,59 @@ def test_enable_source():
                            [("OUTPUT ON", None)],
                            ) as inst:
         inst.enable_source()
+
+
+def test_wait_for_buffer():
+    with expected_protocol(Keithley2400,
+                           [("*STB?", "0"), ("*STB?", "1"), ("*STB?", "65")],
+                           ) as inst:
+        inst.wait_for_buffer(interval=0)
+
+
+def test_wait_for_buffer_should_stop():
+    with expected_protocol(Keithley2400,
+                           [("*STB?", "0")],
+                           ) as inst:
+        inst.wait_for_buffer(should_stop=lambda: True)
+
+
+def test_read_buffer_binary():
+    payload = np.array([1.5, 2.5, -3.0], dtype=">f4").tobytes()
+    with expected_protocol(Keithley2400,
+                           [(":FORM:DATA SREAL;:FORM:BORD NORM", None),
+                            (":TRAC:DATA?", b"#212" + payload + b"\n"),
+                            (":FORM:DATA ASCII", None)],
+                           ) as inst:
+        assert inst.read_buffer().tolist() == [1.5, 2.5, -3.0]
+
+
+def test_read_buffer_ascii_structured():
+    with expected_protocol(Keithley2400,
+                           [(":FORM:DATA ASCII", None),
+                            (":TRAC:DATA?", "1.0,1e-3,2.0,2e-3")],
+                           ) as inst:
+        data = inst.read_buffer(elements=["voltage", "current"], binary=False)
+    assert data.dtype.names == ("voltage", "current")
+    assert data["voltage"].tolist() == [1.0, 2.0]
+    assert data["current"].tolist() == [1e-3, 2e-3]
+
+
+def test_read_buffer_range_not_supported():
+    with expected_protocol(Keithley2400, []) as inst:
+        with pytest.raises(NotImplementedError):
+            inst.read_buffer(start=2, count=5)
+        with pytest.raises(ValueError):
+            inst.read_buffer(start=2)
+
+
+def test_read_buffer_range():
+    class RangeKeithley(Keithley2400):
+        buffer_range_query = ":TRAC:DATA:SEL? {start},{count}"
+
+    payload = np.array([4.0, 5.0], dtype=">f4").tobytes()
+    with expected_protocol(RangeKeithley,
+                           [(":FORM:DATA SREAL;:FORM:BORD NORM", None),
+                            (":TRAC:DATA:SEL? 3,2", b"#18" + payload + b"\n"),
+                            (":FORM:DATA ASCII", None)],
+                           ) as inst:
+        assert inst.read_buffer(start=3, count=2).tolist() == [4.0, 5.0]
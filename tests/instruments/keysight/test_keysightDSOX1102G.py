@@ -0,0 +1,111 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import numpy as np
+import pytest
+
+from pymeasure.test import expected_protocol
+from pymeasure.instruments.keysight.keysightDSOX1102G import KeysightDSOX1102G
+
+# format WORD, type NORMAL, 4 points, count 1, xincrement, xorigin, xreference,
+# yincrement, yorigin, yreference
+PREAMBLE = "+1,+0,+4,+1,+1.0E-06,-2.0E-06,+0,+1.0E-03,+0.0E+00,+32768"
+PREAMBLE_BYTE = "+0,+0,+2,+1,+1.0E-06,+0.0E+00,+0,+4.0E-02,+1.0E+00,+128"
+
+
+def word_block(*values):
+    payload = np.array(values, dtype=">u2").tobytes()
+    return b"#1%d" % len(payload) + payload + b"\n"
+
+
+def test_download_data_word():
+    with expected_protocol(
+            KeysightDSOX1102G,
+            [(":waveform:source CHAN1", None),
+             (":waveform:points:mode NORM", None),
+             (":waveform:points 100", None),
+             (":waveform:format WORD", None),
+             (":waveform:byteorder MSBF;:waveform:unsigned 1", None),
+             (":waveform:preamble?", PREAMBLE),
+             (":waveform:data?", word_block(32768, 33768, 31768, 32769)),
+             ],
+    ) as instr:
+        data, preamble = instr.download_data("channel1", points=100, format_="word")
+        assert preamble["format"] == "WORD"
+        assert data == pytest.approx([0, 1, -1, 1e-3])
+
+
+def test_download_data_byte():
+    with expected_protocol(
+            KeysightDSOX1102G,
+            [(":waveform:source CHAN2", None),
+             (":waveform:points:mode NORM", None),
+             (":waveform:points 100", None),
+             (":waveform:format BYTE", None),
+             (":waveform:byteorder MSBF;:waveform:unsigned 1", None),
+             (":waveform:preamble?", PREAMBLE_BYTE),
+             (":waveform:data?", b"#12\x80\x81\n"),
+             ],
+    ) as instr:
+        data, preamble = instr.download_data("channel2", points=100, format_="byte")
+        assert data == pytest.approx([1, 1.04])
+
+
+def test_download_waveform_time_axis():
+    with expected_protocol(
+            KeysightDSOX1102G,
+            [(":waveform:source CHAN1", None),
+             (":waveform:points:mode NORM", None),
+             (":waveform:points 100", None),
+             (":waveform:format WORD", None),
+             (":waveform:byteorder MSBF;:waveform:unsigned 1", None),
+             (":waveform:preamble?", PREAMBLE),
+             (":waveform:data?", word_block(32768, 32768, 32768, 32768)),
+             ],
+    ) as instr:
+        data, time, preamble = instr.download_waveform("channel1", points=100)
+        assert time == pytest.approx([-2e-6, -1e-6, 0, 1e-6])
+        assert data == pytest.approx([0, 0, 0, 0])
+
+
+def test_download_waveforms():
+    with expected_protocol(
+            KeysightDSOX1102G,
+            [(":waveform:points:mode NORM", None),
+             (":waveform:points 100", None),
+             (":waveform:format WORD", None),
+             (":waveform:byteorder MSBF;:waveform:unsigned 1", None),
+             (":waveform:source CHAN1", None),
+             (":waveform:preamble?", PREAMBLE),
+             (":waveform:data?", word_block(32768, 32768, 32768, 32768)),
+             (":waveform:source CHAN2", None),
+             (":waveform:preamble?", PREAMBLE),
+             (":waveform:data?", word_block(33768, 33768, 33768, 33768)),
+             ],
+    ) as instr:
+        waveforms = instr.download_waveforms(["channel1", "channel2"], points=100)
+        assert list(waveforms) == ["channel1", "channel2"]
+        assert waveforms["channel1"][0] == pytest.approx([0, 0, 0, 0])
+        assert waveforms["channel2"][0] == pytest.approx([1, 1, 1, 1])
+        assert waveforms["channel2"][1] == pytest.approx([-2e-6, -1e-6, 0, 1e-6])
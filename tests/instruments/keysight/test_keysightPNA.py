@@ -162,6 +162,7 @@ class TestTrace:
             KeysightPNA,
             INITIALIZATION + [
              ("FORM?", data_format),
+             ("FORM:BORD?", "SWAP"),
              ("CALC1:MEAS1:X?", response),
              ],
         ) as inst:
@@ -169,6 +170,21 @@ class TestTrace:
             assert type(x_data) is np.ndarray
             assert [1.e+07] == x_data
 
+    @pytest.mark.parametrize("data_format, response",
+                             [("REAL,32", b"#14" + REAL32_DATA[::-1] + b"\n"),
+                              ("REAL,64", b"#18" + REAL64_DATA[::-1] + b"\n"),
+                              ])
+    def test_x_data_real_not_swapped(self, data_format, response):
+        with expected_protocol(
+            KeysightPNA,
+            INITIALIZATION + [
+             ("FORM?", data_format),
+             ("FORM:BORD?", "NORM"),
+             ("CALC1:MEAS1:X?", response),
+             ],
+        ) as inst:
+            assert [1.e+07] == inst.ch_1.tr_1.x_data
+
     def test_x_unit(self):
         with expected_protocol(
             KeysightPNA,
@@ -200,6 +216,7 @@ class TestTrace:
             KeysightPNA,
             INITIALIZATION + [
              ("FORM?", data_format),
+             ("FORM:BORD?", "SWAP"),
              ("CALC1:MEAS1:DATA:FDATA?", response),
              ],
         ) as inst:
@@ -230,6 +247,7 @@ class TestTrace:
             KeysightPNA,
             INITIALIZATION + [
              ("FORM?", data_format),
+             ("FORM:BORD?", "SWAP"),
              ("CALC1:MEAS1:DATA:SDATA?", response),
              ],
         ) as inst:
@@ -238,6 +256,30 @@ class TestTrace:
             assert 1.e7 == y_data[0][0]
             assert 1.e7 == y_data[0][1]
 
+    @pytest.mark.parametrize("data, query, response, expected", [
+        ("x", "FORM REAL,64;:FORM:BORD SWAP;:CALC1:MEAS1:X?",
+         b"#18" + REAL64_DATA + b"\n", [1.e7]),
+        ("formatted", "FORM REAL,32;:FORM:BORD SWAP;:CALC1:MEAS1:DATA:FDATA?",
+         b"#14" + REAL32_DATA + b"\n", [1.e7]),
+        ("complex", "FORM REAL,32;:FORM:BORD SWAP;:CALC1:MEAS1:DATA:SDATA?",
+         b"#216" + 4 * REAL32_DATA + b"\n", [1.e7 + 1.e7j, 1.e7 + 1.e7j]),
+    ])
+    def test_read_data(self, data, query, response, expected):
+        with expected_protocol(
+            KeysightPNA,
+            INITIALIZATION + [
+             (query, response),
+             ],
+        ) as inst:
+            got = inst.ch_1.tr_1.read_data(data)
+            assert got.dtype.kind == ("c" if data == "complex" else "f")
+            assert list(got) == expected
+
+    def test_read_data_invalid(self):
+        with expected_protocol(KeysightPNA, INITIALIZATION) as inst:
+            with pytest.raises(ValueError):
+                inst.ch_1.tr_1.read_data("complex", data_format="ascii")
+
     def test_y_unit(self):
         with expected_protocol(
             KeysightPNA,
@@ -303,6 +345,21 @@ class TestMeasurementChannel():
         ) as inst:
             assert [1, 2, 3, 6, 8] == inst.ch_1.measurements
 
+    def test_read_traces(self):
+        with expected_protocol(
+            KeysightPNA,
+            INITIALIZATION[:-1] + [
+             ("SYST:MEAS:CAT? 1", '"1,2"'),
+             ("FORM REAL,64;:FORM:BORD SWAP;:CALC1:MEAS1:DATA:SDATA?;:CALC1:MEAS2:DATA:SDATA?",
+              b"#216" + 2 * REAL64_DATA + b";#232" + 4 * REAL64_DATA + b"\n"),
+             ],
+        ) as inst:
+            got = inst.ch_1.read_traces("complex", data_format="real64")
+            assert list(got) == [1, 2]
+            assert got[1].dtype == np.complex128
+            assert list(got[1]) == [1.e7 + 1.e7j]
+            assert list(got[2]) == [1.e7 + 1.e7j] * 2
+
 
 class TestKeysightPNA():
     def test_abort(self):
@@ -22,6 +22,9 @@
 # THE SOFTWARE.
 #
 
+from decimal import Decimal
+
+import numpy as np
 import pytest
 
 from pymeasure.instruments.teledyne.teledyne_oscilloscope import sanitize_source
@@ -341,6 +344,176 @@ def test_download_two_points():
         assert y[1] == y[0]
 
 
+def test_download_raw():
+    with expected_protocol(
+            LeCroyT3DSO1204,
+            [(b"CHDR OFF", None),
+             (b"WFSU SP,1", None),
+             (b"WFSU NP,2", None),
+             (b"WFSU FP,0", None),
+             (b"SANU? C1", b"7.00E+06"),
+             (b"WFSU NP,2", None),
+             (b"WFSU FP,0", None),
+             (b"C1:WF? DAT2", b"DAT2,#9000000002" + b"\x01\xff" + b"\n\n"),
+             (b"WFSU?", b"SP,1,NP,2,FP,0"),
+             (b"ACQW?", b"SAMPLING"),
+             (b"SARA?", b"1.00E+09"),
+             (b"SAST?", b"Stop"),
+             (b"MSIZ?", b"7M"),
+             (b"TDIV?", b"5.00E-04"),
+             (b"TRDL?", b"-0.00E+00"),
+             (b"SANU? C1", b"7.00E+06"),
+             (b"C1:VDIV?", b"5.00E-02"),
+             (b"C1:OFST?", b"-1.50E-01"),
+             (b"C1:UNIT?", b"V")
+             ],
+            connection_attributes={'chunk_size': 0},
+    ) as instr:
+        raw, preamble = instr.download_waveform(source="c1", requested_points=2, sparsing=1,
+                                                raw=True)
+        assert raw.tolist() == [1, 255]
+        assert preamble["transmitted_points"] == 2
+        y, x, _ = instr.scale_waveform(raw, preamble)
+        assert y.tolist() == [1 * 0.05 / 25. + 0.150, -1 * 0.05 / 25. + 0.150]
+        assert x.tolist() == [-5e-4 * 14 / 2., -5e-4 * 14 / 2. + 1 / 1e9]
+
+
+PREAMBLE_COMM_PAIRS = [
+    (b"WFSU?", b"SP,1,NP,2,FP,0"),
+    (b"ACQW?", b"SAMPLING"),
+    (b"SARA?", b"1.00E+09"),
+    (b"SAST?", b"Stop"),
+    (b"MSIZ?", b"7M"),
+    (b"TDIV?", b"5.00E-04"),
+    (b"TRDL?", b"-0.00E+00"),
+    (b"SANU? C1", b"7.00E+06"),
+    (b"C1:VDIV?", b"5.00E-02"),
+    (b"C1:OFST?", b"-1.50E-01"),
+    (b"C1:UNIT?", b"V"),
+]
+
+
+def test_download_in_chunks():
+    with expected_protocol(
+            LeCroyT3DSO1204,
+            [(b"CHDR OFF", None),
+             (b"WFSU SP,1", None),
+             (b"WFSU NP,3", None),
+             (b"WFSU FP,0", None),
+             (b"SANU? C1", b"7.00E+06"),
+             (b"WFSU NP,2", None),
+             (b"WFSU FP,0", None),
+             (b"C1:WF? DAT2", b"DAT2,#9000000002" + b"\x01\x02" + b"\n\n"),
+             (b"WFSU NP,1", None),
+             (b"WFSU FP,2", None),
+             (b"C1:WF? DAT2", b"DAT2,#9000000001" + b"\x03" + b"\n\n"),
+             ] + PREAMBLE_COMM_PAIRS,
+            connection_attributes={'chunk_size': 0},
+    ) as instr:
+        raw, preamble = instr.download_waveform(source="c1", requested_points=3, sparsing=1,
+                                                raw=True, chunk_size=20)
+        assert raw.tolist() == [1, 2, 3]
+        assert instr.last_transfer_rate > 0
+
+
+def test_download_pipelined():
+    with expected_protocol(
+            LeCroyT3DSO1204,
+            [(b"CHDR OFF", None),
+             (b"WFSU SP,1", None),
+             (b"WFSU NP,4", None),
+             (b"WFSU FP,0", None),
+             (b"SANU? C1", b"7.00E+06"),
+             (b"WFSU NP,3,FP,0;C1:WF? DAT2",
+              b"DAT2,#9000000003" + b"\x01\x02\x03" + b"\n\n"),
+             (b"WFSU NP,1,FP,3;C1:WF? DAT2", b"DAT2,#9000000001" + b"\x04" + b"\n\n"),
+             ] + PREAMBLE_COMM_PAIRS,
+            connection_attributes={'chunk_size': 0},
+    ) as instr:
+        raw, preamble = instr.download_waveform(source="c1", requested_points=4, sparsing=1,
+                                                raw=True, chunk_size=21, pipeline=True)
+        assert raw.tolist() == [1, 2, 3, 4]
+
+
+def test_download_pipelined_keeps_number_of_points():
+    with expected_protocol(
+            LeCroyT3DSO1204,
+            [(b"CHDR OFF", None),
+             (b"WFSU SP,2", None),
+             (b"WFSU NP,2", None),
+             (b"WFSU FP,0", None),
+             (b"SANU? C1", b"7.00E+06"),
+             (b"WFSU FP,0;C1:WF? DAT2", b"DAT2,#9000000002" + b"\x01\x02" + b"\n\n"),
+             ] + PREAMBLE_COMM_PAIRS,
+            connection_attributes={'chunk_size': 0},
+    ) as instr:
+        raw, preamble = instr.download_waveform(source="c1", requested_points=2, sparsing=2,
+                                                raw=True, pipeline=True)
+        assert raw.tolist() == [1, 2]
+
+
+def test_waveform_chunk_size():
+    with expected_protocol(LeCroyT3DSO1204, [(b"CHDR OFF", None)]) as instr:
+        assert instr._get_waveform_chunk_size() == 20000
+        instr.waveform_chunk_size = 250000
+        assert instr._get_waveform_chunk_size() == 250000
+        instr.waveform_chunk_size = 1000
+        assert instr._get_waveform_chunk_size() == 1000
+        assert instr._get_waveform_chunk_size(500) == 500
+        with pytest.raises(ValueError):
+            instr._get_waveform_chunk_size(18)
+
+
+def _legacy_scale_waveform(ydata, preamble):
+    """Per-sample scaling as implemented before the vectorized version."""
+    def _scale_data(y):
+        if preamble["source"] == "MATH":
+            value = int.from_bytes([y], byteorder='big', signed=False) * preamble["ydiv"] / 25.
+            value -= preamble["ydiv"] * (preamble["yoffset"] + 255) / 50.
+        else:
+            value = int.from_bytes([y], byteorder='big', signed=True) * preamble["ydiv"] / 25.
+            value -= preamble["yoffset"]
+        return value
+
+    def _scale_time(x):
+        return float(Decimal(-preamble["xdiv"] * preamble["grid_number"] / 2.) +
+                     Decimal(float(x * preamble["sparsing"])) /
+                     Decimal(preamble["sampling_rate"]))
+
+    data_points = np.vectorize(_scale_data)(ydata)
+    time_points = np.vectorize(_scale_time)(np.arange(len(data_points)))
+    return data_points, time_points
+
+
+class TestScaleWaveform:
+    @pytest.fixture()
+    def instr(self):
+        with expected_protocol(LeCroyT3DSO1204, [(b"CHDR OFF", None)]) as instr:
+            yield instr
+
+    @pytest.mark.parametrize("source", ["C1", "MATH"])
+    def test_matches_legacy_implementation(self, instr, source):
+        preamble = {"source": source, "ydiv": 0.05, "yoffset": -0.15, "xdiv": 5e-4,
+                    "grid_number": 14, "sparsing": 3, "sampling_rate": 1e9}
+        raw = np.tile(np.arange(256, dtype=np.uint8), 8)
+        y, x, _ = instr.scale_waveform(raw, preamble)
+        y_legacy, x_legacy = _legacy_scale_waveform(raw, preamble)
+        assert y.dtype == x.dtype == np.float64
+        np.testing.assert_array_equal(y, y_legacy)
+        np.testing.assert_allclose(x, x_legacy, rtol=1e-15, atol=1e-18)
+
+    def test_large_input(self, instr):
+        """The vectorized scaling matches the per-sample implementation for a long waveform."""
+        preamble = {"source": "C1", "ydiv": 0.05, "yoffset": -0.15, "xdiv": 5e-4,
+                    "grid_number": 14, "sparsing": 1, "sampling_rate": 1e9}
+        raw = np.random.default_rng(0).integers(0, 256, 100_000, dtype=np.uint8)
+        y, x, _ = instr.scale_waveform(raw, preamble)
+        y_legacy, x_legacy = _legacy_scale_waveform(raw, preamble)
+        assert len(y) == len(x) == 100_000
+        np.testing.assert_array_equal(y, y_legacy)
+        np.testing.assert_allclose(x, x_legacy, rtol=1e-15, atol=1e-18)
+
+
 def test_trigger():
     with expected_protocol(
             LeCroyT3DSO1204,
@@ -25,6 +25,7 @@
 import math
 import struct
 
+import numpy as np
 import pytest
 
 from pymeasure.test import expected_protocol
@@ -1730,3 +1731,48 @@ def test_waveform_get_data_16bit_odd_buffer():
         first_raw_value = struct.unpack("<h", truncated_binary_data[0:2])[0]
         expected_first_voltage = (first_raw_value / 6553.0) * 0.05 - 0.0
         assert abs(volt_values[0] - expected_first_voltage) < 1e-6
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_waveform_get_data_as_array(dtype):
+    """Test waveform data retrieval as NumPy arrays in WORD format."""
+    header_len = 11
+    mock_preamble_array = bytearray(b'#9000000000' + b'\x00' * 400)
+    struct.pack_into('<f', mock_preamble_array, header_len + 0x9c, 0.05)   # v_scale
+    struct.pack_into('<f', mock_preamble_array, header_len + 0xa0, 0.1)    # v_offset
+    struct.pack_into('<f', mock_preamble_array, header_len + 0xb0, 1e-9)   # interval
+    struct.pack_into('<f', mock_preamble_array, header_len + 0xa4, 6553.0)  # code_per_div
+    struct.pack_into('<h', mock_preamble_array, header_len + 0xac, 12)     # adc_bit
+    struct.pack_into('<d', mock_preamble_array, header_len + 0xb4, 0.0)    # delay
+    struct.pack_into('<h', mock_preamble_array, header_len + 0x144, 10)    # tdiv_index
+    struct.pack_into('<f', mock_preamble_array, header_len + 0x148, 1.0)   # probe
+
+    raw_values = [0, 6553, -6553, 100]
+    chunk1 = struct.pack("<2h", *raw_values[:2])
+    chunk2 = struct.pack("<2h", *raw_values[2:])
+
+    with expected_protocol(
+            SDS1000XHD,
+            [
+                (b':WAVeform:STARt 0', None),
+                (b':WAVeform:PREamble?', bytes(mock_preamble_array)),
+                (b':ACQuire:POINts?', b'4'),
+                (b':WAVeform:MAXPoint?', b'2'),
+                (b':WAVeform:POINt 2', None),
+                (b':WAVeform:WIDTh BYTE', None),
+                (b':WAVeform:WIDTh WORD', None),
+                (b':WAVeform:STARt 0', None),
+                (b'WAV:DATA?', b"#14" + chunk1 + b"\n"),
+                (b':WAVeform:STARt 2', None),
+                (b'WAV:DATA?', b"#14" + chunk2 + b"\n"),
+            ],
+    ) as instr:
+        time_values, volt_values = instr.wf_C1.get_data(as_array=True, dtype=dtype)
+
+        assert isinstance(time_values, np.ndarray)
+        assert time_values.dtype == volt_values.dtype == dtype
+        vdiv, voffset = struct.unpack("<2f", struct.pack("<2f", 0.05, 0.1))
+        assert volt_values == pytest.approx(
+            [v / 6553.0 * vdiv - voffset for v in raw_values], rel=1e-6)
+        assert time_values == pytest.approx(
+            [-2.5e-6 + i * 1e-9 for i in range(4)], rel=1e-6)
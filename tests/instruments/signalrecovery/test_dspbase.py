@@ -22,6 +22,7 @@
 # THE SOFTWARE.
 #
 
+import numpy as np
 import pytest
 
 from pymeasure.test import expected_protocol
@@ -69,3 +70,73 @@ def test_x(reading, value):
             [('X.', reading)],
     ) as instr:
         assert instr.x == value
+
+
+def test_get_buffer_table():
+    with expected_protocol(
+            DSPBase,
+            [("M", "0,1,0,3"),
+             ("CBD", "3"),
+             ("M", "0,1,0,3"),
+             ("DCT 3", "100,-200"),
+             (None, "300,-400"),
+             (None, "500,-600"),
+             ],
+    ) as instr:
+        data = instr.get_buffer(convert_to_float=False, transfer="table")
+        assert data["x"].tolist() == [100, 300, 500]
+        assert data["y"].tolist() == [-200, -400, -600]
+
+
+def test_get_buffer_table_empty():
+    with expected_protocol(
+            DSPBase,
+            [("M", "0,1,0,0"),
+             ("CBD", "3"),
+             ("M", "0,1,0,0"),
+             ],
+    ) as instr:
+        data = instr.get_buffer(convert_to_float=False, transfer="table")
+        assert data["x"].tolist() == []
+        assert data["y"].tolist() == []
+
+
+def test_get_buffer_binary():
+    with expected_protocol(
+            DSPBase,
+            [("M", "0,1,0,2"),
+             ("CBD", "18"),
+             ("M", "0,1,0,2"),
+             ("DCB 1", np.array([100, -200], dtype=">i2").tobytes()),
+             ("DCB 4", np.array([24, 56], dtype=">i2").tobytes()),
+             ],
+    ) as instr:
+        data = instr.get_buffer(transfer="binary")
+        assert data["sensitivity"] == pytest.approx([0.1, 1e-7])
+        assert data["y"] == pytest.approx([1e-3, -2e-9])
+
+
+def test_get_buffer_invalid_transfer():
+    with expected_protocol(
+            DSPBase,
+            [("M", "0,1,0,2"),
+             ("CBD", "3"),
+             ],
+    ) as instr:
+        with pytest.raises(ValueError):
+            instr.get_buffer(transfer="invalid")
+
+
+def test_buffer_to_float():
+    with expected_protocol(DSPBase, []) as instr:
+        data = instr.buffer_to_float({
+            "x": np.array([10000, -5000]),
+            "sensitivity": np.array([27, 59]),
+            "phase": np.array([9000, -18000]),
+            "frequency part 1": np.array([0x86A0, 0xFFFF]),
+            "frequency part 2": np.array([0x0001, 0x0000]),
+        })
+        assert data["sensitivity"] == pytest.approx([1.0, 1e-6])
+        assert data["x"] == pytest.approx([1.0, -0.5e-6])
+        assert data["phase"] == pytest.approx([90, -180])
+        assert data["frequency"] == pytest.approx([100, 65.535])
@@ -21,6 +21,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 #
+from unittest import mock
+
+import numpy as np
 import pytest
 
 from pymeasure.test import expected_protocol
@@ -93,3 +96,91 @@ def test_output_conversion():
     ) as inst:
         conv = inst.output_conversion("X")
         assert conv(inst.x) == pytest.approx(-2.66e-7)
+
+
+def floats(*values):
+    return np.array(values, dtype=np.float32).tobytes()
+
+
+def test_stream_buffer():
+    with expected_protocol(
+        SR830,
+        [("SRAT?", "13"),
+         ("SPTS?", "3"),
+         ("TRCB?1,0,2", floats(1, 2)),
+         ("TRCB?2,0,2", floats(5, 6)),
+         ("TRCB?1,2,1", floats(3)),
+         ("TRCB?2,2,1", floats(7)),
+         ("PAUS", None)],
+    ) as inst:
+        chunks = list(inst.stream_buffer(3, chunk_size=2))
+        assert len(chunks) == 2
+        assert chunks[0][0].tolist() == [1, 2]
+        assert chunks[0][1].tolist() == [5, 6]
+        assert chunks[1][0].tolist() == [3]
+        assert chunks[1][1].tolist() == [7]
+
+
+def test_stream_buffer_labels():
+    with expected_protocol(
+        SR830,
+        [("SRAT?", "13"),
+         ("SPTS?", "2"),
+         ("TRCB?1,0,2", floats(1, 2)),
+         ("TRCB?2,0,2", floats(5, 6)),
+         ("PAUS", None)],
+    ) as inst:
+        (chunk,) = inst.stream_buffer(2, labels=("X", "Y"))
+        assert chunk["X"].tolist() == [1, 2]
+        assert chunk["Y"].tolist() == [5, 6]
+
+
+def test_stream_buffer_aborted():
+    with expected_protocol(
+        SR830,
+        [("SRAT?", "14"),
+         ("SPTS?", "0"),
+         ("PAUS", None)],
+    ) as inst:
+        assert list(inst.stream_buffer(2, has_aborted=lambda: True)) == []
+
+
+def test_stream_buffer_aborted_while_recording():
+    """A slow sample frequency must not delay the reaction to an abort."""
+    aborts = iter([False, False, True])
+    with expected_protocol(
+        SR830,
+        [("SRAT?", "0"),  # 62.5 mHz, a chunk takes half a minute
+         ("PAUS", None)],
+    ) as inst:
+        with mock.patch("time.sleep") as sleep:
+            assert list(inst.stream_buffer(2, has_aborted=lambda: next(aborts))) == []
+        assert [c.args[0] for c in sleep.call_args_list] == [0.1, 0.1]
+
+
+def test_fill_buffer():
+    with expected_protocol(
+        SR830,
+        [("SRAT?", "13"),
+         ("SPTS?", "1"),
+         ("SPTS?", "3"),
+         ("TRCB?1,0,3", floats(1, 2, 3)),
+         ("TRCB?2,0,3", floats(5, 6, 7)),
+         ("PAUS", None)],
+    ) as inst:
+        ch1, ch2 = inst.fill_buffer(3, delay=0)
+        assert ch1.tolist() == [1, 2, 3]
+        assert ch2.tolist() == [5, 6, 7]
+
+
+def test_buffer_measure():
+    with expected_protocol(
+        SR830,
+        [("FAST2;STRD", None),
+         ("SRAT?", "13"),
+         ("SPTS?", "2"),
+         ("TRCB?1,0,2", floats(1, 3)),
+         ("TRCB?2,0,2", floats(2, 2)),
+         ("PAUS", None)],
+    ) as inst:
+        assert inst.buffer_measure(2) == (2, 1, 2, 0)
@@ -0,0 +1,121 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import io
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from pymeasure.instruments.comedi import SynchronousAI
+
+
+class ChunkedFile(io.RawIOBase):
+    """Device file which returns at most `chunk` bytes per read."""
+
+    def __init__(self, data, chunk):
+        self.stream = io.BytesIO(data)
+        self.chunk = chunk
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        data = self.stream.read(min(len(buffer), self.chunk))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+class PolynomialConverter:
+    def get_to_physical_coefficients(self):
+        return [1.0, 0.5]
+
+    def get_to_physical_expansion_origin(self):
+        return 100
+
+
+class ScalingConverter:
+    def to_physical(self, values):
+        return values * 2.0
+
+
+def make_ai(raw, chunk):
+    ai = SynchronousAI.__new__(SynchronousAI)
+    ai.samples = raw.shape[0]
+    ai.channels = [mock.MagicMock(), mock.MagicMock()]
+    ai.channels[0].get_converter.return_value = PolynomialConverter()
+    ai.channels[1].get_converter.return_value = ScalingConverter()
+    ai.subdevice = mock.MagicMock()
+    ai.subdevice.command_test.return_value = None
+    ai.subdevice.get_dtype.return_value = np.uint16
+    ai.subdevice.get_flags.return_value.running = False
+    ai.subdevice.device.file = ChunkedFile(raw.astype(np.uint16).tobytes(), chunk)
+    ai.progress = []
+    ai.emitted = []
+    ai.emit_progress = ai.progress.append
+    ai.emit_data = lambda data: ai.emitted.append(np.array(data))
+    return ai
+
+
+@pytest.fixture(autouse=True)
+def inttrig_insn():
+    with mock.patch("pymeasure.instruments.comedi.inttrig_insn", create=True):
+        yield
+
+
+RAW = np.array([[100, 1], [102, 2], [104, 3], [106, 4], [108, 5]])
+PHYSICAL = np.array([[1, 2], [2, 4], [3, 6], [4, 8], [5, 10]])
+
+
+@pytest.mark.parametrize("chunk", [3, 1000])
+def test_measure_per_scan(chunk):
+    ai = make_ai(RAW, chunk)
+    ai.measure()
+    np.testing.assert_array_equal(ai.data, PHYSICAL)
+    assert [e.tolist() for e in ai.emitted] == PHYSICAL.tolist()
+    assert ai.progress == [0, 20, 40, 60, 80]
+
+
+@pytest.mark.parametrize("chunk", [3, 1000])
+def test_measure_blocks(chunk):
+    ai = make_ai(RAW, chunk)
+    ai.measure(block_size=2)
+    np.testing.assert_array_equal(ai.data, PHYSICAL)
+    assert [e.shape for e in ai.emitted] == [(2, 2), (2, 2), (1, 2)]
+    np.testing.assert_array_equal(np.concatenate(ai.emitted), PHYSICAL)
+    assert ai.progress == [0, 40, 80]
+
+
+def test_measure_stops_at_end_of_data():
+    ai = make_ai(RAW, 1000)
+    ai.samples = 8
+    ai.measure(block_size=3)
+    np.testing.assert_array_equal(ai.data[:5], PHYSICAL)
+    assert sum(len(e) for e in ai.emitted) == 5
+
+
+def test_measure_aborted():
+    ai = make_ai(RAW, 1000)
+    ai.measure(hasAborted=lambda: True)
+    assert ai.emitted == []
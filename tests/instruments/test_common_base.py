@@ -24,6 +24,7 @@
 
 import logging
 
+import numpy as np
 import pytest
 
 from pymeasure.units import ureg
@@ -377,6 +378,81 @@ class TestRemoveChild:
         assert getattr(parent_without_children, "function", None) is None
 
 
+class LazyChannelParent(CommonBaseTesting):
+    """A Base as a parent with lazily created channels"""
+    channels = CommonBase.MultiChannelCreator(GenericBase, ("A", "B", "C"), lazy=True)
+    analog = CommonBase.MultiChannelCreator(GenericBase, [1, 2], prefix="an_", lazy=True,
+                                            test=True)
+
+
+class TestLazyChannels:
+    @pytest.fixture()
+    def parent(self):
+        return LazyChannelParent(ProtocolAdapter())
+
+    def test_no_channels_created_at_init(self, parent):
+        assert parent.channels.pending_ids == ["A", "B", "C"]
+        assert "ch_A" not in vars(parent)
+
+    def test_collection_knows_ids(self, parent):
+        assert len(parent.channels) == 3
+        assert list(parent.channels) == ["A", "B", "C"]
+        assert "B" in parent.channels
+        assert parent.channels.pending_ids == ["A", "B", "C"]
+
+    def test_attribute_access_creates_channel(self, parent):
+        assert isinstance(parent.ch_B, GenericBase)
+        assert parent.ch_B is parent.channels["B"]
+        assert parent.channels.pending_ids == ["A", "C"]
+
+    def test_item_access_creates_channel(self, parent):
+        channel = parent.channels["C"]
+        assert isinstance(channel, GenericBase)
+        assert channel.id == "C"
+        assert parent.ch_C is channel
+
+    def test_kwargs_handed_to_channel(self, parent):
+        assert parent.an_1.test is True
+        assert parent.analog[2].test is True
+
+    def test_values_creates_all_channels(self, parent):
+        assert all(isinstance(ch, GenericBase) for ch in parent.channels.values())
+        assert parent.channels.pending_ids == []
+        assert dict(parent.channels) == {"A": parent.ch_A, "B": parent.ch_B, "C": parent.ch_C}
+
+    def test_order_is_kept(self, parent):
+        parent.ch_C
+        assert [ch.id for ch in parent.channels.values()] == ["A", "B", "C"]
+
+    def test_get(self, parent):
+        assert parent.channels.get("A") is parent.ch_A
+        assert parent.channels.get("Z") is None
+
+    def test_instances_are_independent(self, parent):
+        other = LazyChannelParent(ProtocolAdapter())
+        assert parent.ch_A is not other.ch_A
+        assert parent.ch_A.parent is parent
+
+    def test_removal_of_protected_children_fails(self, parent):
+        with pytest.raises(TypeError, match="cannot remove channels defined at class"):
+            parent.remove_child(parent.ch_A)
+
+    def test_add_and_remove_child(self, parent):
+        child = parent.add_child(GenericBase, "D")
+        assert parent.channels["D"] is child
+        parent.remove_child(child)
+        assert "D" not in parent.channels
+        assert len(parent.channels) == 3
+
+    def test_channel_communication(self):
+        parent = LazyChannelParent(ProtocolAdapter([("C{ch}:control 5", None)]))
+        parent.ch_A.fake_ctrl = 5
+
+    def test_missing_prefix_raises(self):
+        with pytest.raises(ValueError, match="prefix"):
+            CommonBase.MultiChannelCreator(GenericBase, [1, 2], prefix=None, lazy=True)
+
+
 class TestInheritanceWithChildren:
     class InstrumentSubclass(MultiChannelParent):
         """Override one channel group, inherit other groups."""
@@ -1046,3 +1122,130 @@ def test_dynamic_property_values_defined_at_superclass_level():
     inst.fake_ctrl2 = 17  # should raise an error if change unsuccessful
     with pytest.raises(ValueError):
         inst.fake_ctrl2 = 2  # should not raise an error if change unsuccessful
+
+
+class WriteIfChangedBase(CommonBaseTesting):
+    voltage = CommonBase.control(
+        "VOLT?", "VOLT %g", "docs",
+        write_if_changed=True,
+    )
+    mode = CommonBase.setting(
+        "MODE %d", "docs",
+        values={"A": 1, "B": 2},
+        map_values=True,
+        write_if_changed=True,
+    )
+    current = CommonBase.control(
+        "CURR?", "CURR %g", "docs",
+        dynamic=True,
+    )
+    frequency = CommonBase.control(
+        "FREQ?", "FREQ %.1f", "docs",
+        write_if_changed=True,
+    )
+    range = CommonBase.control(
+        "RANG?", "RANG %d", "docs",
+        values={"low": 1, "high": 2},
+        map_values=True,
+        write_if_changed=True,
+    )
+    points = CommonBase.control(
+        "POIN?", "POIN %s", "docs",
+        cast=int,
+        get_process_list=np.array,
+        set_process=lambda v: ",".join(str(p) for p in v),
+        write_if_changed=True,
+    )
+    ch_1 = CommonBase.ChannelCreator(GenericBase, 1)
+
+
+class TestWriteIfChanged:
+    def test_second_write_is_skipped(self):
+        inst = WriteIfChangedBase(ProtocolAdapter([("VOLT 5", None)]))
+        inst.voltage = 5
+        inst.voltage = 5
+
+    def test_changed_value_is_written(self):
+        inst = WriteIfChangedBase(ProtocolAdapter([("VOLT 5", None), ("VOLT 6", None)]))
+        inst.voltage = 5
+        inst.voltage = 6
+
+    def test_mapped_value_is_compared(self):
+        inst = WriteIfChangedBase(ProtocolAdapter([("MODE 1", None), ("MODE 2", None)]))
+        inst.mode = "A"
+        inst.mode = "A"
+        inst.mode = "B"
+
+    def test_get_with_same_value_keeps_cache(self):
+        inst = WriteIfChangedBase(ProtocolAdapter([("VOLT 5", None), ("VOLT?", "5")]))
+        inst.voltage = 5
+        assert inst.voltage == 5
+        inst.voltage = 5
+
+    def test_get_with_different_value_invalidates_cache(self):
+        inst = WriteIfChangedBase(ProtocolAdapter(
+            [("VOLT 5", None), ("VOLT?", "3"), ("VOLT 5", None)]))
+        inst.voltage = 5
+        assert inst.voltage == 3
+        inst.voltage = 5
+
+    def test_get_with_rounded_value_keeps_cache(self):
+        inst = WriteIfChangedBase(ProtocolAdapter([("FREQ 1.2", None), ("FREQ?", "1.2")]))
+        inst.frequency = 1.234
+        assert inst.frequency == 1.2
+        inst.frequency = 1.234
+
+    def test_get_with_mapped_value_keeps_cache(self):
+        inst = WriteIfChangedBase(ProtocolAdapter([("RANG 2", None), ("RANG?", "2")]))
+        inst.range = "high"
+        assert inst.range == "high"
+        inst.range = "high"
+
+    def test_get_array_value(self):
+        inst = WriteIfChangedBase(ProtocolAdapter(
+            [("POIN 1,2", None), ("POIN?", "1,2"), ("POIN?", "1,3"), ("POIN 1,2", None)]))
+        inst.points = [1, 2]
+        assert inst.points.tolist() == [1, 2]
+        inst.points = [1, 2]
+        assert inst.points.tolist() == [1, 3]
+        inst.points = [1, 2]
+
+    def test_get_without_write_if_changed(self):
+        inst = WriteIfChangedBase(ProtocolAdapter([("CURR?", "1")]))
+        assert inst.current == 1
+        assert inst._write_cache == {}
+
+    def test_clear_write_cache(self):
+        inst = WriteIfChangedBase(ProtocolAdapter([("VOLT 5", None), ("VOLT 5", None)]))
+        inst.voltage = 5
+        inst.clear_write_cache()
+        inst.voltage = 5
+
+    def test_clear_write_cache_clears_children(self):
+        inst = WriteIfChangedBase(ProtocolAdapter(
+            [("C{ch}:control 5", None), ("C{ch}:control 5", None)]))
+        inst.ch_1.fake_ctrl_write_if_changed = True
+        inst.ch_1.fake_ctrl = 5
+        inst.ch_1.fake_ctrl = 5
+        inst.clear_write_cache()
+        inst.ch_1.fake_ctrl = 5
+
+    def test_dynamic_write_if_changed(self):
+        inst = WriteIfChangedBase(ProtocolAdapter(
+            [("CURR 1", None), ("CURR 1", None), ("CURR 1", None)]))
+        inst.current = 1
+        inst.current = 1
+        inst.current_write_if_changed = True
+        inst.current = 1
+        inst.current = 1
+
+    def test_failed_write_is_not_cached(self):
+        class Fake(CommonBaseTesting):
+            x = CommonBase.setting("X %d", "docs", check_set_errors=True, write_if_changed=True)
+
+            def check_set_errors(self):
+                return [(7, "Error!")]
+
+        inst = Fake(ProtocolAdapter([("X 1", None), ("X 1", None)]))
+        inst.x = 1
+        inst.x = 1
@@ -215,6 +215,45 @@ class TestWaiting:
         assert instr.waited is None
 
 
+class TestWaitUntil:
+    @pytest.fixture()
+    def instr(self):
+        return Instrument(ProtocolAdapter(), "faked", includeSCPI=False)
+
+    def test_returns_when_condition_met(self, instr):
+        results = iter([False, False, True])
+        assert instr.wait_until(lambda: next(results), min_interval=0) is True
+
+    def test_should_stop(self, instr):
+        assert instr.wait_until(lambda: False, should_stop=lambda: True) is False
+
+    def test_timeout(self, instr):
+        with pytest.raises(TimeoutError):
+            instr.wait_until(lambda: False, timeout=0.01)
+
+    def test_interval_grows_exponentially(self, instr):
+        results = iter([False] * 5 + [True])
+        with mock.patch("time.sleep") as sleep:
+            instr.wait_until(lambda: next(results), min_interval=1, max_interval=5)
+        assert [c.args[0] for c in sleep.call_args_list] == [1, 2, 4, 5, 5]
+
+    def test_waits_for_srq(self, instr):
+        instr.adapter.wait_for_srq = mock.MagicMock(side_effect=TimeoutError)
+        results = iter([False, False, True])
+        with mock.patch("time.sleep") as sleep:
+            instr.wait_until(lambda: next(results), use_srq=True)
+        assert instr.adapter.wait_for_srq.call_count == 2
+        sleep.assert_not_called()
+
+    def test_falls_back_to_polling_without_srq(self, instr):
+        instr.adapter.wait_for_srq = mock.MagicMock(side_effect=NotImplementedError)
+        results = iter([False, False, True])
+        with mock.patch("time.sleep") as sleep:
+            instr.wait_until(lambda: next(results), use_srq=True)
+        assert instr.adapter.wait_for_srq.call_count == 1
+        assert sleep.call_count == 2
+
+
 @pytest.mark.parametrize("method, write, reply", (("id", "*IDN?", "xyz"),
                                                   ("complete", "*OPC?", "1"),
                                                   ("status", "*STB?", "189"),
@@ -239,6 +278,48 @@ def test_SCPI_write_commands(method, write):
         getattr(instr, method)()
 
 
+@pytest.mark.parametrize("reply, payload", ((b"#15abcde\n", b"abcde"),
+                                            (b"#210\x00\x01\x02\x03\x04\x05\x06\x07\x08\n\n",
+                                             bytes(range(9)) + b"\n"),
+                                            (b"#10\n", b""),
+                                            ))
+def test_read_ieee_block(reply, payload):
+    with expected_protocol(Instrument, [(None, reply)], name="test") as instr:
+        assert instr.read_ieee_block() == payload
+
+
+@pytest.mark.parametrize("payload", (b"abc", b"a\nb\nc"))
+def test_read_ieee_block_indefinite_length(payload):
+    with expected_protocol(Instrument, [(None, b"#0" + payload + b"\n")], name="test") as instr:
+        assert instr.read_ieee_block() == payload
+
+
+def test_read_ieee_block_indefinite_length_visa():
+    """VISA reads up to the end of the message with the termination character disabled."""
+    instr = Instrument("ASRL2::INSTR", "test", includeSCPI=False, visa_library="@sim",
+                       read_termination="\n")
+    replies = [b"#0", b"a\nbc\n"]
+    terminations = []
+
+    def read_bytes(count, **kwargs):
+        terminations.append(instr.adapter.connection.read_termination)
+        return replies.pop(0)
+
+    with mock.patch.object(instr.adapter, "read_bytes", side_effect=read_bytes):
+        assert instr.read_ieee_block() == b"a\nbc"
+    assert terminations == ["\n", ""]
+    assert instr.adapter.connection.read_termination == "\n"
+    instr.adapter.close()
+
+
+@pytest.mark.parametrize("reply", (b"1,2,3\n", b"#a12\n"))
+def test_read_ieee_block_invalid(reply):
+    with expected_protocol(Instrument, [(None, reply)], name="test") as instr:
+        with pytest.raises(ConnectionError):
+            instr.read_ieee_block()
+        instr.read_bytes(-1)
+
+
 def test_instrument_check_errors():
     with expected_protocol(
             Instrument,
@@ -0,0 +1,113 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import importlib
+import subprocess
+import sys
+import types
+
+import pytest
+
+from pymeasure.lazy_import import attach
+
+
+def run_python(code):
+    """Run `code` in a fresh interpreter and return its stdout."""
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                          check=True).stdout.strip()
+
+
+@pytest.fixture()
+def package():
+    """Lazy access to the `json` package, the attributes are already defined there."""
+    module = types.ModuleType("fake_package")
+    module.__getattr__, module.__dir__, module.__all__ = attach(
+        "json", {"decoder": ["JSONDecoder"]})
+    return module
+
+
+class TestAttach:
+    def test_all(self, package):
+        assert package.__all__ == ["JSONDecoder"]
+
+    def test_getattr(self, package):
+        import json.decoder
+        assert package.__getattr__("JSONDecoder") is json.decoder.JSONDecoder
+
+    def test_getattr_submodule(self, package):
+        import json.decoder
+        assert package.__getattr__("decoder") is json.decoder
+
+    def test_getattr_unknown_name(self, package):
+        with pytest.raises(AttributeError, match="no attribute 'unknown'"):
+            package.__getattr__("unknown")
+
+    def test_dir(self, package):
+        assert {"JSONDecoder", "decoder", "loads"} <= set(package.__dir__())
+
+
+def test_manufacturer_package_does_not_import_drivers():
+    result = run_python(
+        "import sys; import pymeasure.instruments.keithley as k;"
+        "print('pymeasure.instruments.keithley.keithley2400' in sys.modules);"
+        "from pymeasure.instruments.keithley import Keithley2400;"
+        "print('pymeasure.instruments.keithley.keithley2400' in sys.modules)")
+    assert result.split() == ["False", "True"]
+
+
+def test_experiment_does_not_import_pandas():
+    result = run_python(
+        "import sys; import pymeasure.experiment; print('pandas' in sys.modules)")
+    assert result == "False"
+
+
+def test_manufacturer_package_imports_drivers_on_access():
+    """Importing a manufacturer package imports none of its drivers, accessing all does."""
+    result = run_python(
+        "import sys; import pymeasure.instruments.keithley as k;"
+        "drivers = [f'{k.__name__}.{module}' for module in"
+        " ('keithley2000', 'keithley2600', 'keithleyDMM6500', 'buffer')];"
+        "print(sum(name in sys.modules for name in drivers));"
+        "[getattr(k, name) for name in k.__all__];"
+        "print(sum(name in sys.modules for name in drivers))")
+    assert result.split() == ["0", "4"]
+
+
+@pytest.mark.parametrize("package, module", (
+    ("keithley", "buffer"),
+    ("lakeshore", "lakeshore_base"),
+    ("oxfordinstruments", "base"),
+    ("signalrecovery", "dsp_base"),
+    ("tdk", "tdk_base"),
+))
+def test_helper_submodule_attribute(package, module):
+    package = importlib.import_module(f"pymeasure.instruments.{package}")
+    assert getattr(package, module) is importlib.import_module(f"{package.__name__}.{module}")
+
+
+def test_display_without_qt():
+    result = run_python(
+        "import sys; sys.modules['qtpy'] = None;"
+        "import pymeasure.display as display; print(hasattr(display, 'Manager'))")
+    assert result == "False"